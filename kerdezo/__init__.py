@@ -2,15 +2,311 @@
 """
 
 from getpass import getpass
+from types import MappingProxyType
+import asyncio
+import copy
+import inspect
+import numbers
 import sys
+import time
+import weakref
+
+from kerdezo import completion, converters as _converters
+from kerdezo.dependencies import Computed, Constraint
+from kerdezo.metrics import validatorName
+from kerdezo.output import Output
+from kerdezo.providers import ChoiceProvider, PrefixIndex
+from kerdezo.validators import (
+    checker,
+    concurrentValidators,
+    fuseValidators,
+    memoizeValidators
+)
 
 __version__ = "0.1.0"
 
+# Question attributes the compiled validation pipeline depends on
+_PIPELINE_ATTRS = frozenset(["type", "choices", "validators"])
+# Question attributes the rendered prompt depends on
+_PROMPT_ATTRS = frozenset(["title", "choices", "default"])
+# Maximum number of distinct validator tuples shared between questions
+_INTERN_LIMIT = 4096
+# Shared `extra` of questions initialized without extra options
+_NO_EXTRA = MappingProxyType({})
+
 
 class InteractiveError(Exception):
     pass
 
 
+async def _resolve(value):
+    """Await `value` if it is awaitable, return it as is otherwise."""
+    if inspect.isawaitable(value):
+        value = await value
+    return value
+
+
+async def _validateAsync(validator, answer, question, context):
+    """Run a compiled validator, awaiting it if it returns an awaitable.
+    Concurrent groups of validators wait for their threads, so they are run
+    in the default executor, not to block the event loop.
+    """
+    if getattr(validator, "concurrent", False):
+        loop = asyncio.get_running_loop()
+        res = await loop.run_in_executor(
+            None, validator, answer, question, context
+        )
+    else:
+        res = validator(answer, question, context)
+    if inspect.isawaitable(res):
+        await res
+
+
+def _inExecutor(fn):
+    """Wrap a blocking function to run in the default executor."""
+    async def _fn(*args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, fn, *args)
+    return _fn
+
+
+class Choices(ChoiceProvider):
+    """Ordered, hash-indexed collection of the possible answers (`choices`) of
+    a question: the in-memory choice provider.
+    Membership tests and canonicalization are constant time operations.
+    Optionally, string answers can be matched case-insensitively
+    (`caseFold`), ignoring leading and trailing whitespace (`strip`), or by
+    alternative names (`aliases`, a mapping of alias to choice). The
+    normalized lookup table is computed once, on initialization, while the
+    prefix index used by completion is built on first use.
+    Choices must be hashable.
+    """
+
+    __slots__ = (
+        "_items", "_index", "_aliases", "_text", "_prefixes", "caseFold",
+        "strip", "__weakref__"
+    )
+
+    def __init__(self, items=(), caseFold=False, strip=False, aliases=None):
+        """Initialize a new instance of the `Choices` class.
+
+        Args:
+            items (Iterable, optional): Possible answers. Defaults to ().
+            caseFold (bool, optional): Match strings case-insensitively.
+            Defaults to False.
+            strip (bool, optional): Ignore leading and trailing whitespace
+            of strings. Defaults to False.
+            aliases (dict, optional): Alternative names of choices.
+            Defaults to None.
+
+        Raises:
+            ValueError: Trying to add the same choice multiple times
+            ValueError: Alias target not included in choices
+            ValueError: Alias conflicts with a choice
+        """
+        self.caseFold = caseFold
+        self.strip = strip
+        self._items = tuple(items)
+        self._aliases = dict(aliases) if aliases else None
+        self._text = None
+        self._prefixes = None
+
+        normalize = self.normalize
+        index = {normalize(item): item for item in self._items}
+        if len(index) != len(self._items):
+            raise ValueError("Trying to add the same choice multiple times")
+
+        if aliases:
+            choices = set(self._items)
+            for alias, target in aliases.items():
+                if target not in choices:
+                    raise ValueError(
+                        f"Alias target not included in 'choices': {target}"
+                    )
+                key = normalize(alias)
+                if index.get(key, target) != target:
+                    raise ValueError(f"Alias conflicts with a choice: {alias}")
+                index[key] = target
+
+        self._index = index
+
+    @property
+    def aliases(self):
+        """Alternative names of choices.
+
+        Returns:
+            dict: mapping of alias to choice
+        """
+        return dict(self._aliases) if self._aliases else {}
+
+    def normalize(self, value):
+        """Returns the lookup key of a value.
+
+        Args:
+            value (any): choice or answer
+
+        Returns:
+            any: normalized value
+        """
+        if isinstance(value, str):
+            if self.strip:
+                value = value.strip()
+            if self.caseFold:
+                value = value.casefold()
+        return value
+
+    def get(self, value, default=None):
+        """Returns the choice that matches the given value.
+
+        Args:
+            value (any): answer
+            default (any, optional): Returned if no choice matches.
+            Defaults to None.
+
+        Returns:
+            any: the matching choice as defined, or `default`
+        """
+        try:
+            return self._index.get(self.normalize(value), default)
+        except TypeError:
+            # Unhashable values are never among the choices
+            return default
+
+    def __contains__(self, value):
+        try:
+            return self.normalize(value) in self._index
+        except TypeError:
+            return False
+
+    def page(self, offset, limit):
+        """Returns a slice of the choices.
+
+        Args:
+            offset (int): index of the first choice
+            limit (int): maximum number of choices
+
+        Returns:
+            list: choices
+        """
+        return list(self._items[offset:offset + limit])
+
+    def filter(self, prefix, limit=None):
+        """Returns the choices whose string representation starts with
+        `prefix`, sorted. Matching follows `caseFold` and `strip`. The
+        prefix index is built on first use.
+
+        Args:
+            prefix (str): prefix of the choices
+            limit (int, optional): Maximum number of choices.
+            Defaults to None.
+
+        Returns:
+            list: matching choices
+        """
+        prefixes = self._prefixes
+        if prefixes is None:
+            normalize = self.normalize
+            prefixes = PrefixIndex(
+                self._items, key=lambda item: normalize(str(item))
+            )
+            self._prefixes = prefixes
+
+        if self.strip:
+            # Trailing whitespace may be part of the prefix
+            prefix = prefix.lstrip()
+        if self.caseFold:
+            prefix = prefix.casefold()
+        return prefixes.find(prefix, limit)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __str__(self):
+        """Returns the first choices as a comma-separated string (see
+        `ChoiceProvider.window`). The string is built on first use only.
+
+        Returns:
+            str: choices as string
+        """
+        text = self._text
+        if text is None:
+            text = self.window()
+            self._text = text
+        return text
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return len(self._items) > 0
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Choices):
+            return self._items == other._items
+        if isinstance(other, (list, tuple)):
+            return self._items == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Returns printable representation of the current object.
+
+        Returns:
+            str: string representation of the choices
+        """
+        return f"<Choices: {len(self._items)} items>"
+
+
+# Choices and validators shared by questions with identical definitions
+_internedChoices = weakref.WeakValueDictionary()
+_internedValidators = {}
+
+
+def _internChoices(items, typ):
+    """Returns a `Choices` instance of `items`, shared with other questions
+    of the same type and choices.
+    """
+    if isinstance(items, (ChoiceProvider, Computed)):
+        return items
+
+    items = tuple(items)
+    # Choices are shared only if they are identical, not just equal: e.g.
+    # True == 1 and -0.0 == 0.0, but they are displayed and stored
+    # differently
+    key = (typ, items, tuple(
+        (type(item), repr(item)) if isinstance(item, numbers.Number)
+        else type(item)
+        for item in items
+    ))
+    choices = _internedChoices.get(key)
+    if choices is None:
+        choices = Choices(items)
+        _internedChoices[key] = choices
+    return choices
+
+
+def _internValidators(validators):
+    """Returns `validators` as a tuple, shared with other questions with the
+    same validators.
+    """
+    validators = tuple(validators)
+    try:
+        interned = _internedValidators.get(validators)
+    except TypeError:
+        # Unhashable callables
+        return validators
+
+    if interned is None:
+        interned = validators
+        if len(_internedValidators) < _INTERN_LIMIT:
+            _internedValidators[validators] = validators
+    return interned
+
+
 class Question:
     """Entity that represents a particular question in the interactive suite
     that must be answered.
@@ -26,25 +322,46 @@ class Question:
     point. Returning value is not required.
     """
 
-    # Title of the question
-    title = ""
-    # Key name in the result dict in which the answer is stored for question
-    dest = None
-    # Default answer for the question
-    default = None
-    # Expected type of the answer
-    type = str
-    # Whether the answer should echo or not. Disable on password prompt
-    echo = True
-    # Possible answers for the question
-    choices = []
-    # Functions that validate the answer
-    validators = []
-    # Help message for the question
-    help = ""
+    __slots__ = (
+        # Title of the question
+        "title",
+        # Key name in the result dict in which the answer is stored for
+        # question
+        "dest",
+        # Default answer for the question
+        "default",
+        # Expected type of the answer
+        "type",
+        # Whether the answer should echo or not. Disable on password prompt
+        "echo",
+        # Possible answers for the question (`Choices` instance)
+        "choices",
+        # Functions that validate the answer (tuple)
+        "validators",
+        # Help message for the question
+        "help",
+        # Extra options passed on initialization (read-only mapping)
+        "extra",
+        # Compiled validation pipeline
+        "_pipeline",
+        # Rendered prompt
+        "_prompt"
+    )
 
     def __init__(self, title="", **kwargs):
         """Initialize a new instance of the `Question` class.
+        Options other than the ones listed in `__slots__` are stored in
+        `extra`. Pass `memoize=True` (or a dict of `maxsize` and `ttl`) to
+        memoize the outcome of the non-contextual validators (see
+        `kerdezo.validators.memoize`). `validationTimeout` sets the overall
+        deadline of independent validators run concurrently (see
+        `kerdezo.validators.independent`).
+        `default` and `choices` may be computed from other answers, and
+        validators may be constraints on other answers (see
+        `kerdezo.dependencies`). `skip` is a condition on which the question
+        is not asked: a `Computed` value or a callable that receives the
+        session. With `prefixMatch=True`, an answer that is the prefix of a
+        single choice is accepted as that choice.
 
         Args:
             title (str, optional): Title of the question. Defaults to "".
@@ -61,44 +378,250 @@ class Question:
         if len(title) == 0 or title.isspace():
             raise ValueError("'title' is invalid")
 
-        dest = kwargs.get("dest", title)
+        dest = kwargs.pop("dest", title)
 
         if dest is not None and (len(dest) == 0 or dest.isspace()):
             raise ValueError("'dest' cannot be empty string")
-        else:
-            self.dest = dest
 
         # Check choice types
-        typ = kwargs.get("type", str)
-        choices = kwargs.get("choices", [])
+        typ = kwargs.pop("type", str)
 
-        # Find duplicate choices
-        keys = {i: choices.count(i) for i in choices}.values()
-        if len(keys) != len(choices):
-            raise ValueError("Trying to add the same choice multiple times")
+        # Index choices, find duplicate choices
+        choices = _internChoices(kwargs.pop("choices", ()), typ)
+
+        # Computed defaults and choices are checked when they are computed
+        defaultValue = kwargs.pop("default", None)
+        if not isinstance(defaultValue, Computed):
+            self._checkDefault(defaultValue, choices, typ)
+
+        if isinstance(choices, Choices):
+            for choice in choices:
+                if not isinstance(choice, typ):
+                    raise ValueError(
+                        f"Invalid type of choice: {choice}\
+                        (expected: {typ.__name__})"
+                    )
+
+        self.title = title
+        self.dest = dest
+        self.default = defaultValue
+        self.type = typ
+        self.echo = kwargs.pop("echo", True)
+        self.choices = choices
+        validators = kwargs.pop("validators", ())
+        memoize = kwargs.pop("memoize", None)
+        if memoize:
+            options = memoize if isinstance(memoize, dict) else {}
+            validators = memoizeValidators(validators, **options)
+        self.validators = validators
+        self.help = kwargs.pop("help", "")
+        self.extra = MappingProxyType(kwargs) if kwargs else _NO_EXTRA
+
+    @staticmethod
+    def _checkDefault(default, choices, typ):
+        if default is None or isinstance(choices, Computed):
+            return
 
         # If choices and default value provided, choices should include default
-        defaultValue = kwargs.get("default", None)
-        hasChoices = len(choices) > 0
-        noDefault = defaultValue not in choices
-        if defaultValue is not None and hasChoices and noDefault:
+        if choices and default not in choices:
             raise ValueError("Default value not included in 'choices'")
 
-        if defaultValue is not None and type(defaultValue) != typ:
+        if type(default) != typ:
             raise ValueError(
                 f"Invalid type of 'default' (expected: {typ.__name__})"
             )
 
-        for choice in choices:
-            if not isinstance(choice, typ):
-                raise ValueError(
-                    f"Invalid type of choice: {choice}\
-                    (expected: {typ.__name__})"
+    def __setattr__(self, name, value):
+        if name == "choices":
+            value = _internChoices(value, self.type)
+        elif name == "validators":
+            value = _internValidators(value)
+
+        super().__setattr__(name, value)
+
+        if name in _PIPELINE_ATTRS:
+            super().__setattr__("_pipeline", None)
+        if name in _PROMPT_ATTRS:
+            super().__setattr__("_prompt", None)
+
+    def __copy__(self):
+        other = object.__new__(type(self))
+        for name in Question.__slots__:
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            object.__setattr__(other, name, value)
+        if hasattr(self, "__dict__"):
+            other.__dict__.update(self.__dict__)
+        return other
+
+    def sources(self):
+        """Returns the 'dest' of the questions that the computed default and
+        choices, and the constraints of the question depend on.
+
+        Returns:
+            tuple: 'dest' of the source questions, without duplicates
+        """
+        sources = {}
+        for item in (self.default, self.choices) + self.validators:
+            if isinstance(item, (Computed, Constraint)):
+                sources.update(dict.fromkeys(item.sources))
+        return tuple(sources)
+
+    def bind(self, answers):
+        """Returns a copy of the question with the computed default and
+        choices evaluated against the given answers. Questions without
+        computed attributes are returned as they are.
+
+        Args:
+            answers (dict): answers by 'dest'
+
+        Raises:
+            ValueError: Computed default not included in choices
+            ValueError: Invalid type of computed default
+
+        Returns:
+            Question: question with concrete default and choices
+        """
+        default, choices = self.default, self.choices
+        isDefaultComputed = isinstance(default, Computed)
+        isChoicesComputed = isinstance(choices, Computed)
+        if not (isDefaultComputed or isChoicesComputed):
+            return self
+
+        bound = copy.copy(self)
+        if isChoicesComputed:
+            bound.choices = choices(answers)
+        if isDefaultComputed:
+            bound.default = default(answers)
+        self._checkDefault(bound.default, bound.choices, bound.type)
+        return bound
+
+    def _compile(self, converters):
+        typ = self.type
+        convertType = None if typ is None else converters.get(typ)
+        choices = self.choices
+        if isinstance(choices, Computed) or not choices:
+            # Computed choices are checked by the bound question
+            choices = None
+        prefixMatch = choices is not None and self.extra.get("prefixMatch")
+        validators = tuple(concurrentValidators(
+            fuseValidators(self.validators),
+            self.extra.get("validationTimeout")
+        ))
+        question = self
+        missing = object()
+
+        def checkChoices(answer):
+            if choices is not None and answer not in choices:
+                raise InteractiveError(
+                    f"Choose one from the following: {question.getChoices()}"
+                )
+
+        def check(answer, context=None):
+            checkChoices(answer)
+            for validator in validators:
+                validator(answer, question, context)
+
+        if type(self).validate is not Question.validate:
+            # Respect validation logic of subclasses
+            def validate(answer, context=None):
+                if not question.validate(answer, context):
+                    raise ValueError(f"Invalid answer: {answer}")
+        elif choices is None and len(validators) == 0:
+            validate = None
+        else:
+            validate = check
+
+        def convert(raw):
+            if convertType is not None:
+                raw = convertType(raw)
+            if choices is not None:
+                canonical = choices.get(raw, missing)
+                if canonical is not missing:
+                    raw = canonical
+                elif prefixMatch and isinstance(raw, str):
+                    raw = choices.expand(raw, raw)
+            return raw
+
+        def pipeline(raw, context=None):
+            value = convert(raw)
+            if validate is not None:
+                validate(value, context)
+            return value
+
+        if validate is None:
+            checks = ()
+        elif validate is check:
+            checks = tuple(checker(validator) for validator in validators)
+        else:
+            checks = (checker(
+                lambda answer, question, context: validate(answer, context)
+            ),)
+        checkingChoices = validate is check and choices is not None
+
+        def run(raw, context=None):
+            try:
+                value = convert(raw)
+            except Exception as ex:
+                return None, ex
+            if checkingChoices and value not in choices:
+                return value, InteractiveError(
+                    f"Choose one from the following: {question.getChoices()}"
                 )
+            for checkValue in checks:
+                error = checkValue(value, question, context)
+                if error is not None:
+                    return value, error
+            return value, None
+
+        # Stages of the pipeline, for callers that handle them separately
+        pipeline.run = run
+        pipeline.convert = convert
+        pipeline.validate = validate
+        pipeline.checkChoices = checkChoices
+        pipeline.check = check
+        pipeline.validators = validators
+        pipeline.converters = converters
+        pipeline.version = converters.version
+        return pipeline
+
+    def compile(self, converters=None):
+        """Returns the validation pipeline of the question: a callable that
+        converts a raw answer to the expected type, maps it to the canonical
+        choice, checks the choices and runs the validators, with adjacent
+        built-in bound validators fused into a single check.
+
+        The pipeline is built once and cached until `type`, `choices` or
+        `validators` are set, or another (or a changed) converter registry
+        is passed.
 
-        self.title = title
-        self.type = typ
-        self.__dict__.update(**kwargs)
+        Args:
+            converters (Converters, optional): Converters of the answer by
+            type (see `kerdezo.converters`). Defaults to the default
+            registry.
+
+        Returns:
+            callable: `pipeline(raw, context=None)` that returns the
+            type-converted answer or raises on failure. Its `run` method
+            returns the answer and the failure (or `None`) instead of
+            raising: validators that support it (see
+            `kerdezo.validators.nonRaising`) are checked without raising
+            an exception.
+        """
+        if converters is None:
+            converters = _converters.defaults
+        pipeline = self._pipeline
+        if (pipeline is None or pipeline.converters is not converters
+                or pipeline.version != converters.version):
+            pipeline = self._compile(converters)
+            super().__setattr__("_pipeline", pipeline)
+        return pipeline
+
+    def invalidate(self):
+        """Drop the cached validation pipeline of the question."""
+        super().__setattr__("_pipeline", None)
 
     def validate(self, answer, context=None):
         """Validate the given answer against the question.
@@ -114,24 +637,41 @@ class Question:
         Returns:
             bool: `True` if answer passed validation, `False` otherwise.
         """
-        res = False
+        self.compile().check(answer, context)
+        return True
 
-        # Validate choices
-        if len(self.choices) > 0:
-            if answer not in self.choices:
-                raise InteractiveError(
-                    f"Choose one from the following: {self.getChoices()}"
-                )
+    async def validateAsync(self, answer, context=None):
+        """Validate the given answer against the question, awaiting the
+        validators that return an awaitable (e.g. `async def` validators).
+        The validators are run as compiled (see `compile`): fused, and
+        independent ones concurrently, with their timeouts.
 
-        if len(self.validators) > 0:
-            for validator in self.validators:
-                validator(answer, self, context)
-            res = True
-        else:
-            # Store answer
-            res = True
+        Args:
+            answer (any): Type-converted answer to the question
+            context (Kerdezo, optional): Originator suite. Defaults to None.
 
-        return res
+        Raises:
+            InteractiveError: the answer is none of the choices (if any)
+            ValueError: validation fails
+
+        Returns:
+            bool: `True` if answer passed validation, `False` otherwise.
+        """
+        pipeline = self._pipeline
+        if pipeline is None:
+            pipeline = self.compile()
+
+        if pipeline.validate is not pipeline.check:
+            # No validation, or the validation logic of a subclass
+            if pipeline.validate is not None:
+                pipeline.validate(answer, context)
+            return True
+
+        pipeline.checkChoices(answer)
+        for validator in pipeline.validators:
+            await _validateAsync(validator, answer, self, context)
+
+        return True
 
     def getChoices(self):
         """Returns the possible values ('choices') of the question as a
@@ -140,7 +680,7 @@ class Question:
         Returns:
             str: 'choices' as string
         """
-        return ", ".join([str(item) for item in self.choices])
+        return str(self.choices)
 
     def getHelp(self, missing="(No help provided)"):
         """Returns the help of a question, or `missing` if help is not defined.
@@ -156,10 +696,15 @@ class Question:
 
     def __str__(self):
         """Returns a string that represents the current object.
+        The string is cached until `title`, `choices` or `default` are set.
 
         Returns:
             str: question as a string
         """
+        prompt = self._prompt
+        if prompt is not None:
+            return prompt
+
         if self.choices:
             choices = " {" + self.getChoices() + "}"
         else:
@@ -170,7 +715,9 @@ class Question:
         else:
             suggested = ""
 
-        return f"{self.title}{choices}{suggested}"
+        prompt = f"{self.title}{choices}{suggested}"
+        super().__setattr__("_prompt", prompt)
+        return prompt
 
     def __repr__(self):
         """Returns printable representation of the current object.
@@ -181,54 +728,250 @@ class Question:
         return f"<Question: {self.title}>"
 
 
-class Kerdezo:
-    # Message to print before asking questions
-    startMessage = None
-    # Message to print after the last question has been answered
-    endMessage = None
-    # Message to print if errors occurred and failBehaviour is not "retry"
-    errorMessage = None
-    # What to do if an answer fails on type conversion or validation
-    failBehaviour = "retry"  # or "continue" or "stop"
-    # Method to handle type conversion or validation errors
-    failHandler = None
-    # Method to handle test abortion (e.g. Ctrl+C on console)
-    abortHandler = None
-    # Special kind of answer that shows help message on a particular question
-    helpInvoker = "?"
+class QuestionRegistry:
+    """Ordered collection of the questions of a suite, indexed by 'dest' and
+    by identity. Adding, looking up and removing a question are constant time
+    operations. Iteration yields questions in the order they were added.
+    The questions that depend on other answers are indexed by the 'dest' of
+    their sources on first use.
+    Question sources (see `Kerdezo.addSource`) are kept in the plan of the
+    suite, in order with the questions, but are not indexed.
+    """
 
-    def __init__(self, **kwargs):
-        """Initialize the interactive suite.
+    __slots__ = ("_byDest", "_byId", "_dependents", "_plan")
+
+    def __init__(self):
+        self._byDest = {}
+        self._byId = {}
+        self._dependents = None
+        # Questions and sources in order, only once a source is added
+        self._plan = None
+
+    def add(self, question):
+        """Add a question to the registry.
+
+        Args:
+            question (Question): Question instance
 
         Raises:
-            ValueError: Invalid value passed for failBehaviour
+            InteractiveError: Trying to add question with the same 'dest' twice
         """
-        if "failBehaviour" in kwargs:
-            if kwargs["failBehaviour"] not in ["retry", "continue", "stop"]:
-                raise ValueError("Invalid value for 'failBehaviour'")
+        self.update([question])
 
-        self.__dict__.update(**kwargs)
+    def update(self, questions):
+        """Add several questions to the registry at once. Either all of the
+        questions are added or none of them.
+
+        Args:
+            questions (Iterable[Question]): Question instances
+
+        Raises:
+            InteractiveError: Trying to add question with the same 'dest' twice
+        """
+        batch = {}
+        for question in questions:
+            if question.dest in self._byDest or question.dest in batch:
+                raise InteractiveError(
+                    f"Trying to add question with the same 'dest' twice:\
+                    {question.dest}"
+                )
+            batch[question.dest] = question
+
+        self._byDest.update(batch)
+        self._byId.update((id(q), dest) for dest, q in batch.items())
+        self._dependents = None
+        if self._plan is not None:
+            self._plan.extend(batch.values())
+
+    def addSource(self, source):
+        """Add a question source to the end of the plan.
+
+        Args:
+            source (callable | Iterable): question source
+        """
+        if self._plan is None:
+            self._plan = list(self._byDest.values())
+        self._plan.append(source)
+
+    def plan(self):
+        """Returns the questions and the question sources in order.
+
+        Returns:
+            Collection: questions and question sources
+        """
+        return self._plan if self._plan is not None else self._byDest.values()
+
+    def get(self, dest):
+        """Get a question by 'dest'.
+
+        Args:
+            dest (str): 'dest' of the question
+
+        Returns:
+            Question: Question instance or `None` if not found
+        """
+        return self._byDest.get(dest)
+
+    def remove(self, question):
+        """Remove a question from the registry.
+
+        Args:
+            question (Question): Question instance
+
+        Raises:
+            ValueError: Question not found
+        """
+        if question not in self:
+            raise ValueError(f"Question not found: {question}")
+
+        del self._byDest[self._byId.pop(id(question))]
+        self._dependents = None
+        if self._plan is not None:
+            self._plan = [item for item in self._plan if item is not question]
+
+    def dependents(self, dest):
+        """Get the questions that depend on the answer to a question.
+        The index is built on first use after questions are added or removed,
+        thus dependencies set on questions already in the registry are not
+        seen until then.
 
-        self._questions = []
+        Args:
+            dest (str): 'dest' of the source question
+
+        Returns:
+            list: dependent questions in order
+        """
+        index = self._dependents
+        if index is None:
+            index = {}
+            for question in self._byDest.values():
+                for source in question.sources():
+                    index.setdefault(source, []).append(question)
+            self._dependents = index
+        return index.get(dest, ())
+
+    def __contains__(self, question):
+        return id(question) in self._byId
+
+    def __iter__(self):
+        return iter(self._byDest.values())
+
+    def __len__(self):
+        return len(self._byDest)
+
+
+class BatchResult:
+    """Outcome of answering the questions of a suite from a single record.
+    `answers` holds the type-converted answers by 'dest', `errors` holds
+    the list of errors by 'dest' for every question that failed.
+    """
+
+    __slots__ = ("answers", "errors")
+
+    def __init__(self, answers, errors):
+        self.answers = answers
+        self.errors = errors
+
+    @property
+    def ok(self):
+        """Whether the record has been answered without errors.
+
+        Returns:
+            bool: `True` if there were no errors
+        """
+        return len(self.errors) == 0
+
+    def __repr__(self):
+        """Returns printable representation of the current object.
+
+        Returns:
+            str: string representation of the result
+        """
+        answers, errors = len(self.answers), len(self.errors)
+        return f"<BatchResult: {answers} answers, {errors} errors>"
+
+
+class Session:
+    """Run state of a suite: the answers, the errors and the position of the
+    question being asked. The questions and the configuration are read from
+    the suite (`Suite` or `Kerdezo`), so a single suite definition can serve
+    any number of sessions.
+    Sessions are passed as `context` to validators and handlers. Attributes
+    that are not defined on the session are looked up on the suite.
+    """
+
+    __slots__ = (
+        "suite", "_recorder", "_answers", "_errors", "_bound", "position"
+    )
+
+    def __init__(self, suite, recorder=None):
+        """Initialize a new session of a suite.
+
+        Args:
+            suite (Suite | Kerdezo): Suite definition
+            recorder (Recorder, optional): Recorder of the session events.
+            Defaults to the recorder of the suite.
+        """
+        self.suite = suite
+        self._recorder = recorder
         self._answers = {}
         self._errors = {}
+        # Questions with computed attributes, bound to the answers by id
+        self._bound = {}
+        self.position = 0
+
+    @property
+    def recorder(self):
+        """Recorder of the session events: the one passed to the session,
+        otherwise the current recorder of the suite.
+        """
+        recorder = self._recorder
+        return recorder if recorder is not None else self.suite.recorder
 
-    def _addQuestion(self, question):
-        # look for the same dest
-        res = [q for q in self._questions if q.dest == question.dest]
-        if len(res) > 0:
-            raise InteractiveError(
-                f"Trying to add question with the same 'dest' twice:\
-                {question.dest}"
-            )
+    @recorder.setter
+    def recorder(self, recorder):
+        self._recorder = recorder
+
+    def _record(self, kind, question=None, **data):
+        """Pass an event to the recorder of the session (if any).
 
-        if self.helpInvoker is not None and (self.helpInvoker ==
-           question.default or self.helpInvoker in question.choices):
-            raise InteractiveError(
-                "'default' or 'choices' conflicts with 'helpInvoker'"
+        Args:
+            kind (str): event type, e.g. "prompt" or "answer"
+            question (Question, optional): Question the event relates to
+        """
+        data["event"] = kind
+        data["time"] = time.time()
+        data["session"] = id(self)
+        if question is not None:
+            data["dest"] = question.dest
+        self.recorder.record(data)
+
+    def __getattr__(self, name):
+        if name in Session.__slots__:
+            raise AttributeError(name)
+        return getattr(self.suite, name)
+
+    def _recordInput(self, question, raw):
+        # Do not record what is typed at password prompts
+        self._record("input", question, raw=raw if question.echo else None)
+
+    def _observeError(self, kind, question, err):
+        if self.recorder is not None:
+            self._record(
+                kind, question, error=str(err), errorType=type(err).__name__
             )
+        if self.suite.metrics is not None:
+            self.suite.metrics.increment(question.dest, "failures_total")
 
-        self._questions.append(question)
+    def _observeInput(self, fn, prompt, question):
+        """Read input with metrics enabled."""
+        start = time.perf_counter()
+        try:
+            return fn(prompt)
+        finally:
+            self.suite.metrics.observe(
+                question.dest, "input_seconds", time.perf_counter() - start
+            )
 
     def _answer(self, question, value):
         """Store answer on a particular question.
@@ -242,30 +985,149 @@ class Kerdezo:
         """
         if question.dest is not None:
             self._answers[question.dest] = value
+            dependents = self.suite._questions.dependents(question.dest)
+            if dependents:
+                self._propagate(question.dest, dependents)
+        if self.recorder is not None:
+            self._record(
+                "answer", question, value=value if question.echo else None
+            )
+        return True
+
+    def _bind(self, question):
+        """Returns the question with its computed attributes evaluated
+        against the answers of the session.
+        """
+        bound = self._bound.get(id(question))
+        if bound is None:
+            bound = question.bind(self._answers)
+            if bound is not question:
+                self._bound[id(question)] = bound
+        return bound
+
+    def _skips(self, question):
+        """Evaluate the skip condition of a question (if any)."""
+        skip = question.extra.get("skip")
+        if skip is None:
+            return False
+        if isinstance(skip, Computed):
+            return bool(skip(self._answers))
+        return bool(skip(self))
+
+    def _bindFailed(self, question, err):
+        """Store the failure of computing the skip condition, default or
+        choices of a question as an error of the question.
+
+        Returns:
+            bool: `True` if the remaining questions are to be asked
+        """
+        self._observeError("validationError", question, err)
+        self._errors.setdefault(question.dest, []).append(err)
+        return self.suite.failBehaviour != "stop"
+
+    def _walk(self):
+        """Yields the questions to ask in order, bound to the answers of the
+        session. Sources produce their questions only when they are reached,
+        and questions whose skip condition holds are left out. Questions
+        whose computed attributes fail are left out as well, and the failure
+        is stored as their error (the walk ends there if `failBehaviour` is
+        "stop").
+        """
+        for item in self.suite._questions.plan():
+            if isinstance(item, Question):
+                try:
+                    if self._skips(item):
+                        continue
+                    bound = self._bind(item)
+                except Exception as ex:
+                    if self._bindFailed(item, ex):
+                        continue
+                    return
+                yield bound
+            else:
+                if not (yield from self._produce(item)):
+                    return
+
+    def _produce(self, source):
+        """Yields the questions of a question source, see `_walk`.
+
+        Returns:
+            bool: `False` if the walk is to end
+        """
+        produced = source(self) if callable(source) else source
+        if isinstance(produced, (Question, str)):
+            produced = (produced,)
+
+        for item in produced or ():
+            if isinstance(item, str):
+                item = Question(item)
+            elif not isinstance(item, Question):
+                # Nested source
+                if not (yield from self._produce(item)):
+                    return False
+                continue
+
+            try:
+                if self._skips(item):
+                    continue
+                # Produced questions are not kept, bind them without caching
+                bound = item.bind(self._answers)
+            except Exception as ex:
+                if self._bindFailed(item, ex):
+                    continue
+                return False
+            yield bound
         return True
 
-    def _printMessage(self, msg, outfile):
+    def _propagate(self, dest, dependents):
+        """Update the questions that depend on a changed answer: drop their
+        computed attributes, to be recomputed when they are asked, and check
+        the answered ones against their constraints again. Answers that fail
+        are removed and the error is stored.
+        """
+        answers = self._answers
+        for question in dependents:
+            self._bound.pop(id(question), None)
+
+            if question.dest not in answers:
+                continue
+
+            for validator in question.validators:
+                if (isinstance(validator, Constraint) and
+                   dest in validator.sources):
+                    try:
+                        validator(answers[question.dest], question, self)
+                    except ValueError as ex:
+                        del answers[question.dest]
+                        self._errors.setdefault(question.dest, []).append(ex)
+                        break
+
+    def _printMessage(self, msg, output):
         if msg is not None:
-            print(msg, file=outfile)
+            output.print(msg)
 
     def _handleAbort(self):
-        if callable(self.abortHandler):
-            self.abortHandler(self)
+        if self.recorder is not None:
+            self._record("abort")
+        if callable(self.suite.abortHandler):
+            self.suite.abortHandler(self)
 
     def _handleFail(self, err, question):
-        if callable(self.failHandler):
-            self.failHandler(err, self)
+        if callable(self.suite.failHandler):
+            self.suite.failHandler(err, self)
 
     def _handleException(self, err, question):
         ok = False
 
-        if self.failBehaviour == "stop":
+        if self.suite.failBehaviour == "stop":
             raise InteractiveError(err)
 
-        elif self.failBehaviour == "retry":
+        elif self.suite.failBehaviour == "retry":
+            if self.suite.metrics is not None:
+                self.suite.metrics.increment(question.dest, "retries_total")
             self._handleFail(err, question)
 
-        elif self.failBehaviour == "continue":
+        elif self.suite.failBehaviour == "continue":
             if question.dest not in self._errors:
                 self._errors[question.dest] = []
             self._errors[question.dest].append(err)
@@ -273,64 +1135,334 @@ class Kerdezo:
 
         return ok
 
-    def _ask(self, question, inputFn, silentInputFn, outfile):
-        ok = False
+    async def _handleAbortAsync(self):
+        if self.recorder is not None:
+            self._record("abort")
+        if callable(self.suite.abortHandler):
+            await _resolve(self.suite.abortHandler(self))
+
+    async def _handleFailAsync(self, err, question):
+        if callable(self.suite.failHandler):
+            await _resolve(self.suite.failHandler(err, self))
+
+    async def _handleExceptionAsync(self, err, question):
+        if self.suite.failBehaviour == "retry":
+            if self.suite.metrics is not None:
+                self.suite.metrics.increment(question.dest, "retries_total")
+            await self._handleFailAsync(err, question)
+            return False
+
+        return self._handleException(err, question)
+
+    async def _processAsync(self, question, raw):
+        # Check and store if question has default answer
+        if raw == "" and question.default is not None:
+            return self._answer(question, question.default)
+
+        # Convert to the appropriate type
+        metrics = self.suite.metrics
+        pipeline = question.compile(self.suite.converters)
+        start = time.perf_counter()
+        try:
+            raw = pipeline.convert(raw)
+        except Exception as ex:
+            self._observeError("conversionError", question, ex)
+            raise
+        finally:
+            if metrics is not None:
+                metrics.observe(
+                    question.dest,
+                    "conversion_seconds",
+                    time.perf_counter() - start
+                )
 
-        while not ok:
-            try:
-                fn = inputFn if question.echo else silentInputFn
-                # TODO handle GetPassWarning
-                # TODO custom question formatting?
-                raw = fn(str(question) + ": ")
+        try:
+            if (metrics is not None and pipeline.validate is pipeline.check
+                    and type(question).validateAsync is
+                    Question.validateAsync):
+                # Time the compiled validators one by one, see
+                # `_processObserved`
+                pipeline.checkChoices(raw)
+                for validator in pipeline.validators:
+                    start = time.perf_counter()
+                    try:
+                        await _validateAsync(validator, raw, question, self)
+                    finally:
+                        metrics.observe(
+                            question.dest,
+                            "validator_seconds",
+                            time.perf_counter() - start,
+                            validatorName(validator)
+                        )
+                ok = True
+            else:
+                ok = await _resolve(question.validateAsync(raw, self))
+        except Exception as ex:
+            self._observeError("validationError", question, ex)
+            raise
+
+        if ok:
+            self._answer(question, raw)
+
+        return ok
+
+    async def _askAsync(self, question, inputFn, silentInputFn, outputFn,
+                        output):
+        ok = False
+
+        while not ok:
+            try:
+                fn = inputFn if question.echo else silentInputFn
+                prompt = str(question) + ": "
+                if self.recorder is not None:
+                    self._record("prompt", question, prompt=prompt)
+                output.flush()
+                start = time.perf_counter()
+                raw = await _resolve(fn(prompt))
+                if self.suite.metrics is not None:
+                    self.suite.metrics.observe(
+                        question.dest,
+                        "input_seconds",
+                        time.perf_counter() - start
+                    )
+                if self.recorder is not None:
+                    self._recordInput(question, raw)
 
                 # Handle help invocation
-                if (self.helpInvoker is not None and
-                   raw == self.helpInvoker):
-                    print(question.getHelp(), file=outfile)
+                if (self.suite.helpInvoker is not None and
+                   raw == self.suite.helpInvoker):
+                    if self.suite.metrics is not None:
+                        self.suite.metrics.increment(
+                            question.dest, "help_total"
+                        )
+                    await _resolve(outputFn(question.getHelp()))
                     continue
 
-                # Check and store if question has default answer
-                if raw == "" and question.default is not None:
-                    ok = self._answer(question, question.default)
-                    break
+                ok = await self._processAsync(question, raw)
+            except EOFError:
+                # End of input, nothing more to retry with
+                raise
+            except Exception as ex:
+                ok = await self._handleExceptionAsync(ex, question)
 
-                # Convert to the appropriate type
-                if question.type is not None:
-                    raw = question.type(raw)
+    def _process(self, question, raw):
+        """Convert, validate and store a raw answer to a question.
 
-                ok = question.validate(raw, self)
+        Args:
+            question (Question): Question instance
+            raw (str): Raw answer as typed by the user
 
-                if ok:
-                    self._answer(question, raw)
-            except Exception as ex:
-                ok = self._handleException(ex, question)
+        Returns:
+            bool: `True` if the answer has been stored
+        """
+        # Check and store if question has default answer
+        if raw == "" and question.default is not None:
+            return self._answer(question, question.default)
 
-    def addQuestion(self, question, **kwargs):
-        """Add a question to the suite.
+        pipeline = question.compile(self.suite.converters)
+
+        if self.recorder is None and self.suite.metrics is None:
+            # Convert, canonicalize and validate in a single step
+            value = pipeline(raw, self)
+        else:
+            value = self._processObserved(question, pipeline, raw)
+
+        return self._answer(question, value)
+
+    def _check(self, question, raw):
+        """Convert, validate and store a raw answer to a question, like
+        `_process`, but return the failure instead of raising it.
 
         Args:
-            question (Question | str): Question instance or question title
+            question (Question): Question instance
+            raw (str): Raw answer as typed by the user
 
-        Raises:
-            TypeError: Invalid type for 'question'
+        Returns:
+            Exception: the failure, or `None` if the answer has been stored
+        """
+        if raw == "" and question.default is not None:
+            self._answer(question, question.default)
+            return None
+
+        if self.recorder is not None or self.suite.metrics is not None:
+            try:
+                self._process(question, raw)
+            except Exception as ex:
+                return ex
+            return None
+
+        value, error = question.compile(self.suite.converters).run(raw, self)
+        if error is None:
+            self._answer(question, value)
+        return error
+
+    def _processObserved(self, question, pipeline, raw):
+        """Run the stages of the pipeline of a question one by one, with
+        recording and metrics.
+        """
+        metrics = self.suite.metrics
+        clock = time.perf_counter
+        start = clock()
+
+        try:
+            value = pipeline.convert(raw)
+        except Exception as ex:
+            self._observeError("conversionError", question, ex)
+            raise
+        finally:
+            if metrics is not None:
+                metrics.observe(
+                    question.dest, "conversion_seconds", clock() - start
+                )
+
+        try:
+            if metrics is not None and pipeline.validate is pipeline.check:
+                # Time the compiled validators (fused and concurrent groups
+                # as a whole) one by one
+                pipeline.checkChoices(value)
+                for validator in pipeline.validators:
+                    start = clock()
+                    try:
+                        validator(value, question, self)
+                    finally:
+                        metrics.observe(
+                            question.dest,
+                            "validator_seconds",
+                            clock() - start,
+                            validatorName(validator)
+                        )
+            elif pipeline.validate is not None:
+                pipeline.validate(value, self)
+        except Exception as ex:
+            self._observeError("validationError", question, ex)
+            raise
+
+        return value
+
+    def _ask(self, question, inputFn, silentInputFn, output):
+        ok = False
+
+        while not ok:
+            try:
+                fn = inputFn if question.echo else silentInputFn
+                # TODO handle GetPassWarning
+                # TODO custom question formatting?
+                prompt = str(question) + ": "
+                if self.recorder is not None:
+                    self._record("prompt", question, prompt=prompt)
+                # Write the messages of the cycle at once
+                output.flush()
+                if self.suite.metrics is None:
+                    raw = fn(prompt)
+                else:
+                    raw = self._observeInput(fn, prompt, question)
+                if self.recorder is not None:
+                    self._recordInput(question, raw)
+
+                # Handle help invocation
+                if (self.suite.helpInvoker is not None and
+                   raw == self.suite.helpInvoker):
+                    if self.suite.metrics is not None:
+                        self.suite.metrics.increment(
+                            question.dest, "help_total"
+                        )
+                    output.print(question.getHelp())
+                    continue
+
+                error = self._check(question, raw)
+            except EOFError:
+                # End of input, nothing more to retry with
+                raise
+            except Exception as ex:
+                error = ex
+
+            ok = error is None or self._handleException(error, question)
+
+    def _prefilled(self, question, prefilled):
+        """Returns the prefilled raw answer to a question or `None`."""
+        raw = prefilled.get(question.dest) if question.dest else None
+        if raw is not None and self.recorder is not None:
+            self._recordInput(question, raw)
+        return raw
+
+    def _prefill(self, question, prefilled):
+        """Answer a question from the prefilled answers (if any).
 
         Returns:
-            Kerdezo: Kerdezo suite for method chaining
+            bool: `True` if the question needs not be asked
         """
-        if isinstance(question, Question):
-            self._addQuestion(question)
-        elif isinstance(question, str):
-            quest = Question(question, **kwargs)
-            self._addQuestion(quest)
-        else:
-            raise TypeError(
-                "Invalid type for 'question' (expected 'str' or 'Question')"
+        raw = self._prefilled(question, prefilled)
+        if raw is None:
+            return False
+
+        error = self._check(question, raw)
+        # Ask the question when retrying
+        return error is None or self._handleException(error, question)
+
+    async def _prefillAsync(self, question, prefilled):
+        raw = self._prefilled(question, prefilled)
+        if raw is None:
+            return False
+
+        try:
+            return await self._processAsync(question, raw)
+        except Exception as ex:
+            return await self._handleExceptionAsync(ex, question)
+
+    def _askRecord(self, record):
+        for self.position, question in enumerate(self._walk()):
+            dest = question.dest
+            raw = "" if dest is None else record.get(dest, "")
+            if raw is None:
+                raw = ""
+
+            error = self._check(question, raw)
+            if error is not None:
+                self._errors.setdefault(question.dest, []).append(error)
+                if self.suite.failBehaviour == "stop":
+                    break
+
+    def askRecord(self, record):
+        """Answer the questions of the suite from a single record without
+        any terminal I/O. See `Kerdezo.askBatch` for details.
+
+        Args:
+            record (dict): raw answers by 'dest'
+
+        Returns:
+            BatchResult: converted answers and errors of the record
+        """
+        self._askRecord(record)
+        return BatchResult(self._answers, self._errors)
+
+    @staticmethod
+    def _output(kwargs):
+        """Returns the output channel set by the arguments of `ask`."""
+        output = kwargs.get("output")
+        if output is None:
+            output = Output(
+                kwargs.get("outfile", sys.stdout), kwargs.get("encoding")
             )
-        return self
+        return output
 
     def ask(self, **kwargs):
         """Start asking questions.
 
+        Questions whose 'dest' is found in `answers` (a mapping of 'dest' to
+        raw answer, or any object with a `get` method) are answered from
+        there without prompting, unless the answer fails and
+        `failBehaviour` is "retry". End of input (`EOFError`) aborts the
+        session like `KeyboardInterrupt`.
+
+        Messages are written to `outfile` (a text or a binary stream, see
+        `kerdezo.output`), buffered and flushed once per prompt. Pass
+        `encoding` to write to a binary stream with an encoding other than
+        UTF-8, or an `Output` instance as `output`.
+
+        When answers are read from a terminal with the built-in `input`,
+        the choices of the questions can be completed with Tab (see
+        `kerdezo.completion`), unless `completion=False` is passed.
+
         Raises:
             InteractiveError: No questions to ask
 
@@ -340,57 +1472,113 @@ class Kerdezo:
         reset = kwargs.get("reset", True)
         inputFn = kwargs.get("inputFn", input)
         silentInputFn = kwargs.get("silentInputFn", getpass)
-        outfile = kwargs.get("outfile", sys.stdout)
+        prefilled = kwargs.get("answers")
+        output = self._output(kwargs)
+        completer = None
+        if kwargs.get("completion", True) and completion.available(inputFn):
+            completer = completion.Completer()
 
         if reset:
             self._answers = {}
+            self._bound = {}
+            self.position = 0
 
-        if len(self._questions) == 0:
+        if len(self.suite._questions.plan()) == 0:
             raise InteractiveError("No questions to ask")
 
-        self._printMessage(self.startMessage, outfile)
+        self._printMessage(self.suite.startMessage, output)
+        question = None
+        if completer is not None:
+            completer.install()
 
         try:
-            for question in self._questions:
-                self._ask(question, inputFn, silentInputFn, outfile)
+            for self.position, question in enumerate(self._walk()):
+                if prefilled and self._prefill(question, prefilled):
+                    continue
+                if completer is not None:
+                    echo = question.echo
+                    completer.choices = question.choices if echo else None
+                self._ask(question, inputFn, silentInputFn, output)
 
             if len(self._errors) > 0:
-                self._printMessage(self.errorMessage, outfile)
+                self._printMessage(self.suite.errorMessage, output)
             else:
-                self._printMessage(self.endMessage, outfile)
+                self._printMessage(self.suite.endMessage, output)
 
             return self._answers
         except (ValueError, InteractiveError) as ex:
             self._handleFail(ex, question)
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             self._handleAbort()
+        finally:
+            output.flush()
+            if completer is not None:
+                completer.uninstall()
 
-    def getQuestion(self, question):
-        """Get a particular question.
+    async def askAsync(self, **kwargs):
+        """Start asking questions asynchronously.
 
-        Args:
-            question (Question | str): Question instance or 'dest'
+        Works the same way as `ask`, but `inputFn`, `silentInputFn` and
+        `outputFn` may be coroutine functions, and so may be validators,
+        `failHandler` and `abortHandler`. By default, console input is read
+        in the default executor of the running event loop, so other
+        coroutines are not blocked.
 
         Raises:
-            TypeError: Invalid type for 'question'
-            ValueError: Question not found
+            InteractiveError: No questions to ask
 
         Returns:
-            Question: Question instance
+            dict: Answers to the questions
         """
-        if isinstance(question, Question):
-            filtered = [q for q in self._questions if q == question]
-        elif isinstance(question, str):
-            filtered = [q for q in self._questions if q.dest == question]
-        else:
-            raise TypeError(
-                "Invalid type for 'question' (expected 'Question' or 'str')"
-            )
+        reset = kwargs.get("reset", True)
+        inputFn = kwargs.get("inputFn", _inExecutor(input))
+        silentInputFn = kwargs.get("silentInputFn", _inExecutor(getpass))
+        prefilled = kwargs.get("answers")
+        output = self._output(kwargs)
+        outputFn = kwargs.get("outputFn", output.print)
 
-        if len(filtered) != 1:
-            raise ValueError(f"Question not found: {question}")
+        if reset:
+            self._answers = {}
+            self._bound = {}
+            self.position = 0
+
+        if len(self.suite._questions.plan()) == 0:
+            raise InteractiveError("No questions to ask")
+
+        async def printMessage(msg):
+            if msg is not None:
+                await _resolve(outputFn(msg))
+
+        await printMessage(self.suite.startMessage)
+        question = None
+
+        try:
+            for self.position, question in enumerate(self._walk()):
+                if prefilled and await self._prefillAsync(
+                    question, prefilled
+                ):
+                    continue
+                await self._askAsync(
+                    question, inputFn, silentInputFn, outputFn, output
+                )
+
+            if len(self._errors) > 0:
+                await printMessage(self.suite.errorMessage)
+            else:
+                await printMessage(self.suite.endMessage)
 
-        return filtered[0]
+            return self._answers
+        except (ValueError, InteractiveError) as ex:
+            await self._handleFailAsync(ex, question)
+        except (KeyboardInterrupt, EOFError):
+            await self._handleAbortAsync()
+        finally:
+            output.flush()
+
+    def getQuestion(self, question):
+        """Get a particular question of the suite. See `Kerdezo.getQuestion`.
+        """
+        return self.suite.getQuestion(question)
 
     def getAnswer(self, question):
         """Get the answer to a particular question.
@@ -443,3 +1631,395 @@ class Kerdezo:
             )
 
         return res
+
+
+class _Definition:
+    """Common base of suite definitions."""
+
+    # Message to print before asking questions
+    startMessage = None
+    # Message to print after the last question has been answered
+    endMessage = None
+    # Message to print if errors occurred and failBehaviour is not "retry"
+    errorMessage = None
+    # What to do if an answer fails on type conversion or validation
+    failBehaviour = "retry"  # or "continue" or "stop"
+    # Method to handle type conversion or validation errors
+    failHandler = None
+    # Method to handle test abortion (e.g. Ctrl+C on console)
+    abortHandler = None
+    # Special kind of answer that shows help message on a particular question
+    helpInvoker = "?"
+    # Recorder that receives the events of sessions (see `kerdezo.recorders`)
+    recorder = None
+    # Collector of per-question metrics (see `kerdezo.metrics`)
+    metrics = None
+    # Converters of answers by type (see `kerdezo.converters`)
+    converters = None
+
+    @staticmethod
+    def _checkOptions(kwargs):
+        if "failBehaviour" in kwargs:
+            if kwargs["failBehaviour"] not in ["retry", "continue", "stop"]:
+                raise ValueError("Invalid value for 'failBehaviour'")
+
+    def _checkHelpInvoker(self, questions):
+        helpInvoker = self.helpInvoker
+
+        if helpInvoker is not None:
+            for question in questions:
+                choices = question.choices
+                if isinstance(choices, Computed):
+                    choices = ()
+                if (helpInvoker == question.default or
+                   helpInvoker in choices):
+                    raise InteractiveError(
+                        "'default' or 'choices' conflicts with 'helpInvoker'"
+                    )
+
+    def session(self):
+        """Start a new session of the suite.
+
+        Returns:
+            Session: session with no answers
+        """
+        return Session(self)
+
+    def compile(self):
+        """Build the validation pipeline of every question in advance, e.g.
+        before batch validation.
+
+        Returns:
+            Kerdezo | Suite: the suite for method chaining
+        """
+        for question in self._questions:
+            question.compile(self.converters)
+        return self
+
+    def askBatch(self, records, workers=None, chunkSize=None, ordered=True):
+        """Answer the questions of the suite from an iterable of records
+        without any terminal I/O.
+
+        Every record is a mapping of 'dest' to raw (string) answer. Missing
+        keys are treated as empty answers, thus defaults apply. Conversion
+        and validation work the same way as in `ask`, but failures are never
+        retried: they are collected per 'dest' in the result. With
+        `failBehaviour` set to "stop" the rest of the record is skipped after
+        the first failure. `failHandler` is not called.
+
+        Records are consumed lazily, one at a time, each in a session of
+        its own. With `workers` set, records are answered in chunks by a
+        pool of processes, see `kerdezo.parallel`.
+
+        Args:
+            records (Iterable[dict]): raw answer records
+            workers (int, optional): Number of worker processes, `None` to
+            answer the records in the current process. Defaults to None.
+            chunkSize (int, optional): Number of records sent to a worker at
+            once. Defaults to `kerdezo.parallel.CHUNK_SIZE`.
+            ordered (bool, optional): Yield the results of the workers in
+            the order of the records. Defaults to True.
+
+        Raises:
+            InteractiveError: No questions to ask
+            ValueError: The suite cannot be shipped to the workers
+
+        Yields:
+            BatchResult: converted answers and errors of a record
+        """
+        if workers is not None:
+            from kerdezo import parallel
+            return parallel.askBatch(
+                self, records, workers,
+                chunkSize or parallel.CHUNK_SIZE, ordered
+            )
+
+        return self._askBatch(records)
+
+    def _askBatch(self, records):
+        if len(self._questions.plan()) == 0:
+            raise InteractiveError("No questions to ask")
+
+        for record in records:
+            yield Session(self).askRecord(record)
+
+    def getQuestion(self, question):
+        """Get a particular question.
+
+        Args:
+            question (Question | str): Question instance or 'dest'
+
+        Raises:
+            TypeError: Invalid type for 'question'
+            ValueError: Question not found
+
+        Returns:
+            Question: Question instance
+        """
+        if isinstance(question, Question):
+            found = question if question in self._questions else None
+        elif isinstance(question, str):
+            found = self._questions.get(question)
+        else:
+            raise TypeError(
+                "Invalid type for 'question' (expected 'Question' or 'str')"
+            )
+
+        if found is None:
+            raise ValueError(f"Question not found: {question}")
+
+        return found
+
+
+class Suite(_Definition):
+    """Immutable suite definition that can be shared by any number of
+    sessions, e.g. one per concurrent user. Create one with
+    `Kerdezo.freeze` or from a list of questions directly.
+    """
+
+    def __init__(self, questions=(), **kwargs):
+        """Initialize the frozen suite.
+
+        Args:
+            questions (Iterable[Question], optional): Questions and question
+            sources (see `Kerdezo.addSource`) of the suite. Defaults to ().
+
+        Raises:
+            ValueError: Invalid value passed for failBehaviour
+            InteractiveError: Conflicting 'dest' or 'helpInvoker'
+        """
+        self._checkOptions(kwargs)
+
+        for key, value in kwargs.items():
+            object.__setattr__(self, key, value)
+
+        questions = list(questions)
+        registry = QuestionRegistry()
+        for item in questions:
+            if isinstance(item, Question):
+                self._checkHelpInvoker([item])
+                registry.add(item)
+            else:
+                registry.addSource(item)
+        object.__setattr__(self, "_questions", registry)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'Suite' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("'Suite' object is immutable")
+
+    def ask(self, **kwargs):
+        """Start asking questions in a new session. See `Kerdezo.ask`.
+
+        Returns:
+            dict: Answers to the questions
+        """
+        return self.session().ask(**kwargs)
+
+    async def askAsync(self, **kwargs):
+        """Start asking questions asynchronously in a new session. See
+        `Kerdezo.askAsync`.
+
+        Returns:
+            dict: Answers to the questions
+        """
+        return await self.session().askAsync(**kwargs)
+
+
+class Kerdezo(_Definition):
+    """Interactive suite: the mutable suite definition questions can be
+    added to, together with a session that holds the answers of the last
+    `ask` run. Use `freeze` to get a shareable, immutable `Suite`.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize the interactive suite.
+
+        Raises:
+            ValueError: Invalid value passed for failBehaviour
+        """
+        self._checkOptions(kwargs)
+
+        self.__dict__.update(**kwargs)
+
+        self._questions = QuestionRegistry()
+        self._session = Session(self)
+
+    @property
+    def _answers(self):
+        return self._session._answers
+
+    @property
+    def _errors(self):
+        return self._session._errors
+
+    def _addQuestions(self, questions):
+        self._checkHelpInvoker(questions)
+        self._questions.update(questions)
+
+    def _addQuestion(self, question):
+        self._addQuestions([question])
+
+    def addQuestion(self, question, **kwargs):
+        """Add a question to the suite.
+
+        Args:
+            question (Question | str): Question instance or question title
+
+        Raises:
+            TypeError: Invalid type for 'question'
+
+        Returns:
+            Kerdezo: Kerdezo suite for method chaining
+        """
+        if isinstance(question, Question):
+            self._addQuestion(question)
+        elif isinstance(question, str):
+            quest = Question(question, **kwargs)
+            self._addQuestion(quest)
+        else:
+            raise TypeError(
+                "Invalid type for 'question' (expected 'str' or 'Question')"
+            )
+        return self
+
+    def addQuestions(self, questions):
+        """Add several questions to the suite at once. The whole batch is
+        validated before any of the questions is added.
+
+        Args:
+            questions (Iterable[Question | str]): Question instances or
+            question titles
+
+        Raises:
+            TypeError: Invalid type for 'question'
+            InteractiveError: Conflicting 'dest' or 'helpInvoker'
+
+        Returns:
+            Kerdezo: Kerdezo suite for method chaining
+        """
+        batch = []
+        for question in questions:
+            if isinstance(question, str):
+                question = Question(question)
+            elif not isinstance(question, Question):
+                raise TypeError(
+                    "Invalid type for 'question' "
+                    "(expected 'str' or 'Question')"
+                )
+            batch.append(question)
+
+        self._addQuestions(batch)
+        return self
+
+    def addSource(self, source):
+        """Add a question source to the suite: questions produced lazily,
+        when the source is reached in a session, instead of being added in
+        advance. Thus the questions may depend on the answers given so far,
+        and only the questions on the path actually taken are built.
+
+        A source is either a callable that is called with the session
+        (`context`) and returns a question or an iterable of questions (e.g.
+        a generator function), or an iterable itself. Iterables may contain
+        nested sources, and are consumed one question at a time, after the
+        previous question has been answered. Titles (str) are accepted as
+        questions. Iterators are exhausted after a single session; use a
+        callable for suites asked several times.
+
+        Produced questions are not part of the suite: they are not indexed
+        by 'dest' and their 'dest' is not checked for conflicts.
+
+        Args:
+            source (callable | Iterable): question source
+
+        Returns:
+            Kerdezo: Kerdezo suite for method chaining
+        """
+        self._questions.addSource(source)
+        return self
+
+    def removeQuestion(self, question):
+        """Remove a question from the suite.
+
+        Args:
+            question (Question | str): Question instance or 'dest'
+
+        Raises:
+            TypeError: Invalid type for 'question'
+            ValueError: Question not found
+
+        Returns:
+            Kerdezo: Kerdezo suite for method chaining
+        """
+        self._questions.remove(self.getQuestion(question))
+        return self
+
+    def freeze(self):
+        """Create an immutable copy of the suite definition that can be shared
+        by concurrent sessions. Questions are shared, not copied.
+
+        Returns:
+            Suite: frozen suite
+        """
+        options = {
+            key: value for key, value in self.__dict__.items()
+            if not key.startswith("_")
+        }
+        return Suite(self._questions.plan(), **options)
+
+    def ask(self, **kwargs):
+        """Start asking questions.
+
+        Raises:
+            InteractiveError: No questions to ask
+
+        Returns:
+            dict: Answers to the questions
+        """
+        return self._session.ask(**kwargs)
+
+    async def askAsync(self, **kwargs):
+        """Start asking questions asynchronously.
+
+        Works the same way as `ask`, but `inputFn`, `silentInputFn` and
+        `outputFn` may be coroutine functions, and so may be validators,
+        `failHandler` and `abortHandler`. By default, console input is read
+        in the default executor of the running event loop, so other
+        coroutines are not blocked.
+
+        Raises:
+            InteractiveError: No questions to ask
+
+        Returns:
+            dict: Answers to the questions
+        """
+        return await self._session.askAsync(**kwargs)
+
+    def getAnswer(self, question):
+        """Get the answer to a particular question.
+
+        Args:
+            question (Question | str): Question instance or 'dest'
+
+        Raises:
+            TypeError: Invalid type for 'question'
+
+        Returns:
+            Any: Answer represented by an appropriate type
+        """
+        return self._session.getAnswer(question)
+
+    def getErrors(self, question):
+        """Get errors that occurred during the answering.
+
+        Args:
+            question (Question | str): Question instance or 'dest'
+
+        Raises:
+            TypeError: Invalid type for 'question'
+
+        Returns:
+            list: list of errors
+        """
+        return self._session.getErrors(question)
@@ -0,0 +1,89 @@
+"""Command line interface: run a suite headless. See `kerdezo.headless`."""
+
+import argparse
+import getpass
+import json
+import sys
+
+from kerdezo.headless import (
+    ENV_PREFIX,
+    Answers,
+    LineReader,
+    loadAnswers,
+    loadSuite,
+    runBatch,
+    runSession
+)
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    stderr = sys.stderr if stderr is None else stderr
+
+    parser = argparse.ArgumentParser(
+        prog="python -m kerdezo",
+        description="Run a suite headless: answers are taken from the "
+                    "environment, an answers file and the standard input, "
+                    "results are written to the standard output as JSON."
+    )
+    parser.add_argument(
+        "suite", help="JSON suite definition file or 'module:name' reference"
+    )
+    parser.add_argument(
+        "--answers", metavar="FILE",
+        help="answers file (.json, .jsonl or dest=value lines); several "
+             "records are answered in batch, without reading the input"
+    )
+    parser.add_argument(
+        "--env-prefix", default=ENV_PREFIX, metavar="PREFIX",
+        help=f"prefix of answer environment variables (default: "
+             f"{ENV_PREFIX})"
+    )
+    parser.add_argument(
+        "--no-env", action="store_true",
+        help="ignore answers in environment variables"
+    )
+    parser.add_argument(
+        "--encoding", default="utf-8", help="encoding of the input"
+    )
+    parser.add_argument(
+        "--indent", type=int, default=None, help="indentation of the JSON"
+    )
+    args = parser.parse_args(argv)
+    prefix = None if args.no_env else args.env_prefix
+
+    try:
+        suite = loadSuite(args.suite)
+        records = loadAnswers(args.answers) if args.answers else [{}]
+    except (OSError, ValueError) as ex:
+        parser.error(str(ex))
+
+    ok = True
+
+    if len(records) > 1:
+        for result in runBatch(suite, records, prefix=prefix):
+            ok = ok and not result["errors"]
+            print(json.dumps(result, default=str), file=stdout)
+        return 0 if ok else 1
+
+    interactive = stdin.isatty()
+    reader = LineReader(
+        stdin.buffer,
+        encoding=args.encoding,
+        prompts=stderr if interactive else None
+    )
+    result = runSession(
+        suite,
+        answers=Answers(records[0], prefix=prefix),
+        inputFn=reader,
+        silentInputFn=getpass.getpass if interactive else reader,
+        outfile=stderr
+    )
+
+    print(json.dumps(result, default=str, indent=args.indent), file=stdout)
+    return 0 if result["complete"] and not result["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""This package contains benchmarks of the hot paths of the `Kerdezo` suite.
+
+Run all benchmarks and write the results as JSON:
+
+    $ python -m kerdezo.benchmarks --output results.json
+
+Compare two runs (e.g. of different commits):
+
+    $ python -m kerdezo.benchmarks --compare before.json after.json
+"""
@@ -0,0 +1,73 @@
+"""Command line interface of the benchmarks. See `kerdezo.benchmarks`."""
+
+import argparse
+import json
+import sys
+
+from kerdezo.benchmarks.cases import CASES, SIZES, compare, run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m kerdezo.benchmarks",
+        description="Benchmark the hot paths of kerdezo."
+    )
+    parser.add_argument(
+        "--case", action="append", dest="cases", metavar="NAME",
+        help="case to run (may be repeated, default: all)"
+    )
+    parser.add_argument(
+        "--sizes", type=lambda v: [int(i) for i in v.split(",")],
+        default=list(SIZES), help="comma-separated problem sizes"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=0.2,
+        help="time budget per case and size in seconds"
+    )
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+        help="compare two result files"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the available cases"
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in CASES:
+            print(name)
+        return 0
+
+    if args.compare:
+        results = []
+        for path in args.compare:
+            with open(path, "r", encoding="utf8") as fp:
+                results.append(json.load(fp))
+
+        for name, size, before, after, ratio in compare(*results):
+            print(f"{name:40} {size:>8} {before:.6f}s {after:.6f}s "
+                  f"x{ratio:.2f}")
+        return 0
+
+    unknown = [name for name in args.cases or [] if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case: {', '.join(unknown)}")
+
+    results = run(
+        args.cases, args.sizes, args.repeat, args.budget, log=sys.stderr
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as fp:
+            json.dump(results, fp, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""Benchmark cases and the runner that times them.
+
+Every case is a function that takes the size of the problem and returns a
+callable to be timed, so that setup costs are not measured.
+"""
+
+import io
+import platform
+import statistics
+import time
+
+from kerdezo import Choices, Kerdezo, Question, __version__
+from kerdezo.validators import IntegerValidators, StringValidators
+
+# Default problem sizes
+SIZES = (10, 1000, 100000)
+# Version of the result format
+FORMAT_VERSION = 1
+
+# Registered cases by name
+CASES = {}
+
+
+def case(name):
+    """Register a benchmark case.
+
+    Args:
+        name (str): name of the case in the results
+    """
+    def _register(fn):
+        CASES[name] = fn
+        return fn
+    return _register
+
+
+def answerMachine(answers):
+    """Returns an `inputFn` that gives the answers in order."""
+    answers = iter(answers)
+
+    def _input(prompt):
+        return next(answers)
+
+    return _input
+
+
+@case("Question.__init__[choices]")
+def questionInit(size):
+    choices = [f"choice-{i}" for i in range(size)]
+
+    def run():
+        Question("Pick one", choices=choices, default=choices[-1])
+    return run
+
+
+@case("Kerdezo.addQuestion")
+def addQuestion(size):
+    questions = [Question(f"Question {i}") for i in range(size)]
+
+    def run():
+        suite = Kerdezo()
+        for question in questions:
+            suite.addQuestion(question)
+    return run
+
+
+@case("Kerdezo.ask")
+def ask(size):
+    suite = Kerdezo()
+    for i in range(size):
+        suite.addQuestion(
+            f"Question {i}",
+            type=int,
+            validators=[
+                IntegerValidators.greaterEqual(0),
+                IntegerValidators.lessEqual(size)
+            ]
+        )
+    answers = [str(i) for i in range(size)]
+    outfile = io.StringIO()
+
+    def run():
+        suite.ask(inputFn=answerMachine(answers), outfile=outfile)
+    return run
+
+
+@case("Choices.filter")
+def choicesFilter(size):
+    choices = Choices([f"item-{i:06}" for i in range(size)])
+    # Build the prefix index beforehand
+    choices.filter("")
+    prefixes = [f"item-0{i % 100:02}" for i in range(100)]
+
+    def run():
+        for prefix in prefixes:
+            choices.filter(prefix, limit=100)
+    return run
+
+
+def _validatorCase(factory, args, value):
+    def _case(size):
+        validator = factory(*args)
+        values = [value] * size
+
+        def run():
+            for v in values:
+                validator(v)
+        return run
+    return _case
+
+
+_VALIDATORS = [
+    (StringValidators, "equal", ("foo",), "foo"),
+    (StringValidators, "notEqual", ("foo",), "bar"),
+    (StringValidators, "minimumLength", (3,), "foobar"),
+    (StringValidators, "maximumLength", (10,), "foobar"),
+    (StringValidators, "notEmptyOrWhitespace", (), "foobar"),
+    (StringValidators, "emailAddress", (), "somebody@example.com"),
+    (IntegerValidators, "equal", (5,), 5),
+    (IntegerValidators, "notEqual", (5,), 6),
+    (IntegerValidators, "greater", (0,), 5),
+    (IntegerValidators, "greaterEqual", (0,), 5),
+    (IntegerValidators, "less", (10,), 5),
+    (IntegerValidators, "lessEqual", (10,), 5)
+]
+
+for _cls, _name, _args, _value in _VALIDATORS:
+    case(f"{_cls.__name__}.{_name}")(
+        _validatorCase(getattr(_cls, _name), _args, _value)
+    )
+
+
+def measure(fn, repeat=5, budget=0.2):
+    """Time a callable.
+
+    The callable is run `repeat` times, but no more than what fits into
+    `budget` seconds (and at least once).
+
+    Args:
+        fn (callable): callable to time
+        repeat (int, optional): Number of runs. Defaults to 5.
+        budget (float, optional): Time budget in seconds. Defaults to 0.2.
+
+    Returns:
+        list: duration of the runs in seconds
+    """
+    timings = []
+    started = time.perf_counter()
+
+    while len(timings) < repeat:
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+        if time.perf_counter() - started > budget:
+            break
+
+    return timings
+
+
+def run(names=None, sizes=SIZES, repeat=5, budget=0.2, log=None):
+    """Run benchmark cases.
+
+    Args:
+        names (Iterable[str], optional): Cases to run. Defaults to all.
+        sizes (Iterable[int], optional): Problem sizes. Defaults to SIZES.
+        repeat (int, optional): Maximum number of runs per case and size.
+        Defaults to 5.
+        budget (float, optional): Time budget per case and size in seconds.
+        Defaults to 0.2.
+        log (file, optional): Progress is written here. Defaults to None.
+
+    Raises:
+        KeyError: Unknown case
+
+    Returns:
+        dict: JSON-serializable results
+    """
+    results = []
+
+    for name in (names or CASES):
+        factory = CASES[name]
+        for size in sizes:
+            timings = measure(factory(size), repeat=repeat, budget=budget)
+            result = {
+                "name": name,
+                "size": size,
+                "runs": len(timings),
+                "best": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.mean(timings)
+            }
+            results.append(result)
+            if log is not None:
+                print(f"{name:40} {size:>8} {result['best']:.6f}s", file=log)
+
+    return {
+        "version": FORMAT_VERSION,
+        "kerdezo": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results
+    }
+
+
+def compare(before, after):
+    """Compare the results of two runs by the best timings.
+
+    Args:
+        before (dict): baseline results
+        after (dict): new results
+
+    Returns:
+        list: `(name, size, before, after, ratio)` tuples of the cases found
+        in both runs, where `ratio` is after / before
+    """
+    baseline = {(r["name"], r["size"]): r["best"] for r in before["results"]}
+    res = []
+
+    for r in after["results"]:
+        key = (r["name"], r["size"])
+        if key in baseline:
+            old = baseline[key]
+            ratio = r["best"] / old if old > 0 else float("inf")
+            res.append((key[0], key[1], old, r["best"], ratio))
+
+    return res
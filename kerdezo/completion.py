@@ -0,0 +1,105 @@
+"""Tab completion of choices on the console, using `readline`.
+
+`Kerdezo.ask` installs a `Completer` when the answers are read with the
+built-in `input` from a terminal and `readline` is available (it is not on
+some platforms). Pressing Tab completes the answer to the choices of the
+question being asked; choices are looked up in their prefix index (see
+`Choices.filter`).
+"""
+
+import sys
+
+try:
+    import readline
+except ImportError:  # pragma: no cover
+    readline = None
+
+# Maximum number of completions offered at once
+LIMIT = 100
+
+
+class Completer:
+    """Readline completer of the choices of the current question."""
+
+    def __init__(self, limit=LIMIT):
+        """Initialize a new instance of the `Completer` class.
+
+        Args:
+            limit (int, optional): Maximum number of completions offered at
+            once. Defaults to LIMIT.
+        """
+        self.limit = limit
+        # Choices of the question being asked (or None)
+        self.choices = None
+        self._matches = []
+        self._saved = None
+
+    def complete(self, text, state):
+        """Readline completion function.
+
+        Args:
+            text (str): text typed so far
+            state (int): index of the requested completion
+
+        Returns:
+            str: the completion or `None` if there are no more
+        """
+        if state == 0:
+            choices = self.choices
+            if choices:
+                matches = choices.filter(text, limit=self.limit)
+                self._matches = [str(item) for item in matches]
+            else:
+                self._matches = []
+
+        if state < len(self._matches):
+            return self._matches[state]
+        return None
+
+    def install(self):
+        """Make the completer the completer of readline.
+
+        Returns:
+            Completer: the completer
+        """
+        self._saved = (readline.get_completer(),
+                       readline.get_completer_delims())
+        readline.set_completer(self.complete)
+        # Choices may contain spaces, complete the whole line
+        readline.set_completer_delims("")
+        readline.parse_and_bind("tab: complete")
+        return self
+
+    def uninstall(self):
+        """Restore the previous completer of readline."""
+        if self._saved is not None:
+            completer, delims = self._saved
+            readline.set_completer(completer)
+            readline.set_completer_delims(delims)
+            self._saved = None
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *args):
+        self.uninstall()
+
+
+def available(inputFn, stdin=None):
+    """Whether completion can be used with the given input function.
+
+    Args:
+        inputFn (callable): function that reads the answers
+        stdin (file, optional): Standard input. Defaults to `sys.stdin`.
+
+    Returns:
+        bool: `True` for the built-in `input` reading from a terminal, with
+        `readline` available
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    if readline is None or inputFn is not input:
+        return False
+    try:
+        return stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
@@ -0,0 +1,383 @@
+"""Converters of raw answers to the type of questions.
+
+A `Converters` registry maps types to converters: callables that take the
+raw answer and return the converted value, or raise `ValueError`. Types
+without a converter are called with the raw answer, e.g. `str(raw)`.
+The registry is resolved once per question, when its validation pipeline
+is compiled (see `Question.compile`), so looking up a converter costs
+nothing per answer.
+
+Built-in converters:
+
+* `int`, `float`, `Decimal`: the syntax of the type itself by default.
+  Registries created with a `decimalPoint` ("." or ",") accept digit
+  grouping as well, with the same rules for all three types: the other
+  one of "." and ",", spaces and "'" group digits ("1 000", "1.000,5" with
+  decimal comma), and integers cannot have decimals
+* `bool`: yes/no answers ("y", "yes", "true", "on", "1" and their
+  negatives), case-insensitively
+* `date`, `datetime`, `time`: ISO 8601
+* `Enum` subclasses: member names or values, case-insensitively
+
+Every suite uses the `defaults` registry, unless another one is passed as
+its `converters` option:
+
+    converters = Converters()
+    converters.register(Path, lambda raw: Path(raw).expanduser())
+    suite = Kerdezo(converters=converters)
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+import functools
+import re
+
+# Number with digit grouping (thousands separated by the same separator),
+# by decimal point
+_GROUPED = {
+    point: re.compile(
+        r"[+-]?(?:\d{1,3}(?:([ '\u00a0\u202f" + other + r"])\d{3})"
+        r"(?:\1\d{3})*|\d*)(?:" + re.escape(point) + r"\d*)?"
+        r"(?:[eE][+-]?\d+)?"
+    )
+    for point, other in ((".", ","), (",", "."))
+}
+_BOOLEANS = {
+    **dict.fromkeys(("y", "yes", "true", "t", "on", "1"), True),
+    **dict.fromkeys(("n", "no", "false", "f", "off", "0"), False)
+}
+
+
+def _text(raw):
+    if not isinstance(raw, str):
+        raise ValueError(f"Invalid answer: {raw!r}")
+    return raw.strip()
+
+
+def _ungroup(raw, decimalPoint, name):
+    """Returns a number with digit grouping in the notation of `int`,
+    `float` and `Decimal`: without grouping and with decimal point.
+    """
+    text = _text(raw)
+    match = _GROUPED[decimalPoint].fullmatch(text)
+    if match is None or not any(char.isdigit() for char in text):
+        raise ValueError(f"Invalid {name}: {raw!r}")
+
+    group = match.group(1)
+    if group is not None:
+        text = text.replace(group, "")
+    if decimalPoint == ",":
+        text = text.replace(",", ".")
+    return text
+
+
+def toInt(raw, decimalPoint=None):
+    """Convert an answer to `int`.
+
+    Args:
+        raw (str): raw answer
+        decimalPoint (str, optional): Decimal point ("." or ",") of numbers
+        with digit grouping, `None` for the syntax of `int` only.
+        Defaults to None.
+
+    Raises:
+        ValueError: Invalid integer
+
+    Returns:
+        int: converted answer
+    """
+    if decimalPoint is None or not isinstance(raw, str):
+        return int(raw)
+
+    text = _ungroup(raw, decimalPoint, "integer")
+    try:
+        return int(text)
+    except ValueError:
+        # Decimals or exponent
+        raise ValueError(f"Invalid integer: {raw!r}") from None
+
+
+def toFloat(raw, decimalPoint=None):
+    """Convert an answer to `float`.
+
+    Args:
+        raw (str): raw answer
+        decimalPoint (str, optional): Decimal point ("." or ",") of numbers
+        with digit grouping, `None` for the syntax of `float` only.
+        Defaults to None.
+
+    Raises:
+        ValueError: Invalid number
+
+    Returns:
+        float: converted answer
+    """
+    if decimalPoint is None or not isinstance(raw, str):
+        return float(raw)
+    return float(_ungroup(raw, decimalPoint, "number"))
+
+
+def toDecimal(raw, decimalPoint=None):
+    """Convert an answer to `Decimal`.
+
+    Args:
+        raw (str): raw answer
+        decimalPoint (str, optional): Decimal point ("." or ",") of numbers
+        with digit grouping, `None` for the syntax of `Decimal` only.
+        Defaults to None.
+
+    Raises:
+        ValueError: Invalid decimal
+
+    Returns:
+        Decimal: converted answer
+    """
+    if isinstance(raw, Decimal):
+        return raw
+    if decimalPoint is not None and isinstance(raw, str):
+        raw = _ungroup(raw, decimalPoint, "decimal")
+    try:
+        return Decimal(raw)
+    except InvalidOperation:
+        raise ValueError(f"Invalid decimal: {raw!r}") from None
+
+
+# Number converters by decimal point
+_NUMBER_CONVERTERS = {
+    point: {
+        int: functools.partial(toInt, decimalPoint=point),
+        float: functools.partial(toFloat, decimalPoint=point),
+        Decimal: functools.partial(toDecimal, decimalPoint=point)
+    }
+    for point in (".", ",")
+}
+_NUMBER_CONVERTERS[None] = {int: toInt, float: toFloat, Decimal: toDecimal}
+
+
+def toBool(raw):
+    """Convert a yes/no answer to `bool`.
+
+    Args:
+        raw (str): raw answer
+
+    Raises:
+        ValueError: Not a yes/no answer
+
+    Returns:
+        bool: converted answer
+    """
+    if isinstance(raw, bool):
+        return raw
+    try:
+        return _BOOLEANS[_text(raw).casefold()]
+    except KeyError:
+        raise ValueError(f"Answer yes or no: {raw!r}") from None
+
+
+def _isoConverter(typ):
+    def _converter(raw):
+        if type(raw) is typ:
+            return raw
+        try:
+            return typ.fromisoformat(_text(raw))
+        except ValueError:
+            raise ValueError(
+                f"Invalid {typ.__name__} (expected ISO 8601): {raw!r}"
+            ) from None
+    return _converter
+
+
+_ISO_CONVERTERS = {typ: _isoConverter(typ) for typ in (date, datetime, time)}
+
+
+def enumConverter(enumType):
+    """Create the converter of an `Enum` type, that looks members up by name
+    or value, case-insensitively.
+
+    Args:
+        enumType (type): subclass of `Enum`
+
+    Returns:
+        callable: converter
+    """
+    table = {}
+    for name, member in enumType.__members__.items():
+        table.setdefault(str(member.value).casefold(), member)
+        table[name.casefold()] = member
+
+    def _converter(raw):
+        if isinstance(raw, enumType):
+            return raw
+        member = table.get(_text(raw).casefold())
+        if member is None:
+            raise ValueError(f"Invalid {enumType.__name__}: {raw!r}")
+        return member
+    return _converter
+
+
+class Converters:
+    """Registry of converters by type."""
+
+    def __init__(self, builtins=True, decimalPoint=None):
+        """Initialize a new instance of the `Converters` class.
+
+        Args:
+            builtins (bool, optional): Register the built-in converters.
+            Defaults to True.
+            decimalPoint (str, optional): Decimal point ("." or ",") of
+            the numbers with digit grouping accepted by the built-in
+            converters, `None` to accept the syntax of the number types
+            only. Defaults to None.
+
+        Raises:
+            ValueError: Invalid decimal point
+        """
+        if decimalPoint not in _NUMBER_CONVERTERS:
+            raise ValueError(f"Invalid decimal point: {decimalPoint!r}")
+
+        self._converters = {}
+        self._factories = {}
+        self._resolved = {}
+        self.version = 0
+        self._builtins = builtins
+        self.decimalPoint = decimalPoint
+
+        if builtins:
+            for typ, converter in _NUMBER_CONVERTERS[decimalPoint].items():
+                self.register(typ, converter)
+            self.register(bool, toBool)
+            for typ, converter in _ISO_CONVERTERS.items():
+                self.register(typ, converter)
+            self.registerFactory(Enum, enumConverter)
+
+    def __reduce__(self):
+        # Built-in converters are registered again on unpickling, only the
+        # converters registered later are pickled (by reference)
+        base = Converters(self._builtins, self.decimalPoint)
+        return (_restoreConverters, (
+            self._builtins,
+            self.decimalPoint,
+            {
+                typ: converter
+                for typ, converter in self._converters.items()
+                if base._converters.get(typ) is not converter
+            },
+            {
+                typ: factory
+                for typ, factory in self._factories.items()
+                if base._factories.get(typ) is not factory
+            }
+        ))
+
+    def register(self, typ, converter):
+        """Register the converter of a type.
+
+        Args:
+            typ (type): the type
+            converter (callable): converts a raw answer or raises
+            `ValueError`
+
+        Returns:
+            Converters: the registry for method chaining
+        """
+        self._converters[typ] = converter
+        self._changed()
+        return self
+
+    def registerFactory(self, base, factory):
+        """Register a factory of converters for the subclasses of a type,
+        e.g. `Enum`. The factory is called once per subclass.
+
+        Args:
+            base (type): the base type
+            factory (callable): returns the converter of a subclass
+
+        Returns:
+            Converters: the registry for method chaining
+        """
+        self._factories[base] = factory
+        self._changed()
+        return self
+
+    def _changed(self):
+        self._resolved.clear()
+        self.version += 1
+
+    def get(self, typ):
+        """Get the converter of a type: the registered one, the one created
+        by the factory of its closest base, or the type itself.
+
+        Args:
+            typ (type): the type
+
+        Returns:
+            callable: converter
+        """
+        converter = self._resolved.get(typ)
+        if converter is None:
+            converter = self._converters.get(typ)
+            if converter is None:
+                converter = typ
+                for base in getattr(typ, "__mro__", ())[1:]:
+                    factory = self._factories.get(base)
+                    if factory is not None:
+                        converter = factory(typ)
+                        break
+            self._resolved[typ] = converter
+        return converter
+
+    def convert(self, typ, raw):
+        """Convert a raw answer to a type.
+
+        Args:
+            typ (type): the type
+            raw (any): raw answer
+
+        Returns:
+            any: converted answer
+        """
+        return self.get(typ)(raw)
+
+    def convertColumn(self, typ, values):
+        """Convert a column of raw answers at once, e.g. in batch imports.
+        The whole column is converted in a single pass if it is valid, value
+        by value otherwise.
+
+        Args:
+            typ (type): the type
+            values (Iterable): raw answers
+
+        Returns:
+            tuple: list of converted answers (`None` where conversion
+            failed) and dict of errors by index
+        """
+        converter = self.get(typ)
+        values = values if isinstance(values, (list, tuple)) else list(values)
+
+        try:
+            return list(map(converter, values)), {}
+        except Exception:
+            pass
+
+        res = []
+        errors = {}
+        for index, value in enumerate(values):
+            try:
+                res.append(converter(value))
+            except Exception as ex:
+                res.append(None)
+                errors[index] = ex
+        return res, errors
+
+
+def _restoreConverters(builtins, decimalPoint, converters, factories):
+    res = Converters(builtins, decimalPoint)
+    res._converters.update(converters)
+    res._factories.update(factories)
+    res._changed()
+    return res
+
+
+# Registry of the suites without a `converters` option
+defaults = Converters()
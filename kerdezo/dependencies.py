@@ -0,0 +1,125 @@
+"""Declarative dependencies between questions.
+
+Defaults and choices of a question can be computed from the answers to
+other questions (`Computed`), and validators can check an answer against
+other answers (`Constraint`). Both declare the 'dest' of the questions they
+depend on (their `sources`):
+
+    suite.addQuestion("Protocol", choices=["http", "https"])
+    suite.addQuestion(
+        "Port",
+        type=int,
+        default=Computed(lambda protocol: 443 if protocol == "https" else 80,
+                         "Protocol")
+    )
+
+The suite keeps an index of the questions that depend on each 'dest'. When
+an answer is stored in a session, only the defaults and choices of the
+dependent questions are recomputed, and only the constraints of the
+dependent questions that have been answered already are checked again.
+Computed values are held by the session, so frozen suites stay shareable.
+"""
+
+import functools
+
+
+class Computed:
+    """Value computed from the answers to other questions: the function is
+    called with the answers to the `sources` (`None` if not answered yet),
+    in the order they are listed.
+    """
+
+    __slots__ = ("fn", "sources")
+
+    def __init__(self, fn, *sources):
+        """Initialize a new instance of the `Computed` class.
+
+        Args:
+            fn (callable): function that computes the value
+            *sources (str): 'dest' of the questions the value depends on
+        """
+        self.fn = fn
+        self.sources = sources
+
+    def __call__(self, answers):
+        """Compute the value.
+
+        Args:
+            answers (dict): answers by 'dest'
+
+        Returns:
+            any: computed value
+        """
+        return self.fn(*[answers.get(source) for source in self.sources])
+
+    def __repr__(self):
+        """Returns printable representation of the current object.
+
+        Returns:
+            str: string representation of the computed value
+        """
+        return f"<Computed: {', '.join(self.sources)}>"
+
+
+class Constraint:
+    """Validator that checks an answer against the answers to other
+    questions: the function is called with the answer, followed by the
+    answers to the `sources` (`None` if not answered yet), and may raise
+    `ValueError`.
+    """
+
+    # Constraints depend on the context, never memoize them
+    contextual = True
+
+    def __init__(self, fn, *sources):
+        """Initialize a new instance of the `Constraint` class.
+
+        Args:
+            fn (callable): function that checks the answer
+            *sources (str): 'dest' of the questions the check depends on
+        """
+        functools.update_wrapper(self, fn)
+        self.fn = fn
+        self.sources = sources
+
+    def __call__(self, value, question=None, context=None):
+        answers = context._answers if context is not None else {}
+        return self.fn(
+            value, *[answers.get(source) for source in self.sources]
+        )
+
+    def __repr__(self):
+        """Returns printable representation of the current object.
+
+        Returns:
+            str: string representation of the constraint
+        """
+        return f"<Constraint: {', '.join(self.sources)}>"
+
+
+def computed(*sources):
+    """Decorator that makes a `Computed` value of a function.
+
+    Args:
+        *sources (str): 'dest' of the questions the value depends on
+
+    Returns:
+        callable: decorator
+    """
+    def _decorator(fn):
+        return Computed(fn, *sources)
+    return _decorator
+
+
+def constraint(*sources):
+    """Decorator that makes a `Constraint` validator of a function.
+
+    Args:
+        *sources (str): 'dest' of the questions the check depends on
+
+    Returns:
+        callable: decorator
+    """
+    def _decorator(fn):
+        return Constraint(fn, *sources)
+    return _decorator
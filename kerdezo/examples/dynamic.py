@@ -1,11 +1,13 @@
-"""This test demonstrates how to add questions dynamically and how to create
-dynamic bindings to check values with validators.
+"""This test demonstrates how to produce questions dynamically and how to
+create dynamic bindings to check values with validators.
+Questions are generated lazily by a question source, one at a time, when
+they are reached.
 """
 
 import random
 import sys
 
-from kerdezo import Kerdezo
+from kerdezo import Kerdezo, Question
 from kerdezo.validators import IntegerValidators
 
 
@@ -125,28 +127,24 @@ def checkAnswer(num1, op, num2):
     return _validator
 
 
-def failHandler(err, context):
-    print(f"Fail: {err}", file=sys.stderr)
+def arithmetic(context):
+    """Question source: yields the questions one by one, when reached.
 
+    Args:
+        context (Session): Context
 
-if __name__ == "__main__":
-    suite = Kerdezo(
-        startMessage="""Let's see how do you do with numbers.
-Give you answers as numbers.""",
-        endMessage="Good job!",
-        failHandler=failHandler
-    )
+    Yields:
+        Question: arithmetic question
+    """
+    random.seed()
 
-    # Add questions dynamically
     for i in range(5):
-        random.seed()
-
         # Generate random numbers and random operator
         num1 = RandomInt()
         op = Operator.random()
         num2 = RandomInt()
 
-        suite.addQuestion(
+        yield Question(
             f"{num1} {op:text} {num2}",
             type=int,
             help=getHelp(num1, op, num2),
@@ -157,4 +155,20 @@ Give you answers as numbers.""",
             ]
         )
 
+
+def failHandler(err, context):
+    print(f"Fail: {err}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    suite = Kerdezo(
+        startMessage="""Let's see how do you do with numbers.
+Give you answers as numbers.""",
+        endMessage="Good job!",
+        failHandler=failHandler
+    )
+
+    # Add questions dynamically
+    suite.addSource(arithmetic)
+
     suite.ask()
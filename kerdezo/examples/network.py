@@ -2,6 +2,7 @@ import ipaddress
 import sys
 
 from kerdezo import Kerdezo
+from kerdezo.dependencies import computed
 
 
 def ipAddressValidator(value, question, context):
@@ -13,9 +14,9 @@ def portNumberValidator(value, question, context):
         raise ValueError(f"Invalid port number: {value}")
 
 
-def setPortNumberByProtocol(value, question, context):
-    port = 80 if value == "http" else 443
-    context.getQuestion("Port").default = port
+@computed("Protocol")
+def portNumberByProtocol(protocol):
+    return 80 if protocol == "http" else 443
 
 
 def failHandler(err, context):
@@ -38,14 +39,13 @@ To get help on a question, answer with '?' (without apostrophes)
 
     suite.addQuestion(
         "Protocol",
-        choices=["http", "https"],
-        validators=[setPortNumberByProtocol]
+        choices=["http", "https"]
     )
 
     suite.addQuestion(
         "Port",
         type=int,
-        default=8080,
+        default=portNumberByProtocol,
         help="Type a TCP port number",
         validators=[portNumberValidator]
     )
@@ -3,6 +3,7 @@ import sys
 from datetime import datetime
 
 from kerdezo import Kerdezo
+from kerdezo.dependencies import constraint
 from kerdezo.validators import StringValidators
 
 
@@ -50,18 +51,19 @@ def validateBirthYear(value, question, context):
         )
 
 
-def validateRepeatPassword(value, question, context):
+@constraint("Password")
+def validateRepeatPassword(value, password):
     """Validate the 'Repeat password' question.
     This function checks equality with the answer for the 'Password' question.
 
     Args:
         value (str): Repeat password input
-        context (Kerdezo): Context
+        password (str): Answer to the 'Password' question
 
     Raises:
         ValueError: Passwords does not match.
     """
-    if value != context.getAnswer("Password"):
+    if value != password:
         raise ValueError(
             "Passwords do not match"
         )
@@ -1,24 +1,15 @@
-from kerdezo import Kerdezo, Question
-
-
-class YesNoQuestion(Question):
-    def __init__(self, title, **kwargs):
-        super().__init__(title, **kwargs)
-        self.validators.insert(0, self.validator)
-
-    @staticmethod
-    def validator(value, question, context):
-        pass
+from kerdezo import Kerdezo
 
 
 if __name__ == "__main__":
     suite = Kerdezo()
 
+    # "y", "yes", "n", "no" etc. are converted by the built-in converter of
+    # `bool` (see `kerdezo.converters`)
     suite.addQuestion(
         "Do you have a driving license?",
-        choices=["yes", "no"],
-        default="yes",
-        validators=[]
+        type=bool,
+        default=True
     )
 
     suite.ask()
@@ -0,0 +1,276 @@
+"""Headless runs of suites, e.g. in CI or provisioning scripts.
+
+Answers are taken, in order of precedence, from environment variables
+(`KERDEZO_<DEST>`, see `envName`), from an answers file (see
+`loadAnswers`) and from the standard input, read in blocks by a
+`LineReader`. Questions answered by the environment or the file are not
+prompted for. Results are JSON-serializable dicts (see `runSession`). The
+command line interface is `python -m kerdezo`.
+"""
+
+from collections import deque
+import json
+import os
+import re
+import sys
+
+from kerdezo import Kerdezo, Suite, serialization
+
+# Prefix of the environment variables that hold answers
+ENV_PREFIX = "KERDEZO_"
+# Number of bytes read from the input at once
+BUFFER_SIZE = 65536
+
+
+def envName(dest, prefix=ENV_PREFIX):
+    """Returns the name of the environment variable that holds the answer
+    to a question: the prefix followed by the 'dest' in upper case, with
+    runs of characters other than letters and digits replaced by "_".
+
+    Args:
+        dest (str): 'dest' of the question
+        prefix (str, optional): Prefix of the name. Defaults to ENV_PREFIX.
+
+    Returns:
+        str: name of the variable, e.g. "KERDEZO_IP_ADDRESS"
+    """
+    return prefix + re.sub(r"[^0-9A-Za-z]+", "_", dest).strip("_").upper()
+
+
+class Answers:
+    """Prefilled answers by 'dest': the answers of a record, overridden by
+    environment variables.
+    """
+
+    __slots__ = ("answers", "environ", "prefix")
+
+    def __init__(self, answers=None, environ=None, prefix=ENV_PREFIX):
+        """Initialize a new instance of the `Answers` class.
+
+        Args:
+            answers (dict, optional): raw answers by 'dest'.
+            Defaults to None.
+            environ (dict, optional): Environment variables.
+            Defaults to `os.environ`.
+            prefix (str, optional): Prefix of the environment variables, or
+            `None` to ignore the environment. Defaults to ENV_PREFIX.
+        """
+        self.answers = answers if answers is not None else {}
+        self.environ = os.environ if environ is None else environ
+        self.prefix = prefix
+
+    def get(self, dest, default=None):
+        """Get the raw answer to a question.
+
+        Args:
+            dest (str): 'dest' of the question (`None` has no answer)
+            default (any, optional): Returned if there is no answer.
+            Defaults to None.
+
+        Returns:
+            any: raw answer or `default`
+        """
+        if dest is None:
+            return default
+        if self.prefix is not None:
+            value = self.environ.get(envName(dest, self.prefix))
+            if value is not None:
+                return value
+        return self.answers.get(dest, default)
+
+
+class LineReader:
+    """Reader of answers from a binary stream, one line per answer. The
+    stream is read in blocks and split into lines in bulk, rather than
+    with a read call per line. Usable as `inputFn`.
+    """
+
+    def __init__(self, stream=None, encoding="utf-8", prompts=None,
+                 bufferSize=BUFFER_SIZE):
+        """Initialize a new instance of the `LineReader` class.
+
+        Args:
+            stream (file, optional): Binary stream.
+            Defaults to `sys.stdin.buffer`.
+            encoding (str, optional): Encoding of the input.
+            Defaults to "utf-8".
+            prompts (file, optional): Text stream prompts are written to,
+            `None` not to write prompts. Defaults to None.
+            bufferSize (int, optional): Number of bytes read at once.
+            Defaults to BUFFER_SIZE.
+        """
+        self.stream = sys.stdin.buffer if stream is None else stream
+        self.encoding = encoding
+        self.prompts = prompts
+        self.bufferSize = bufferSize
+        self._lines = deque()
+        self._rest = b""
+        self._eof = False
+
+    def _fill(self):
+        # Return what is available rather than waiting for a full block
+        read = getattr(self.stream, "read1", self.stream.read)
+
+        while not self._lines and not self._eof:
+            chunk = read(self.bufferSize)
+            if not chunk:
+                self._eof = True
+                if self._rest:
+                    self._lines.append(self._rest)
+                    self._rest = b""
+                break
+
+            lines = (self._rest + chunk).split(b"\n")
+            self._rest = lines.pop()
+            self._lines.extend(lines)
+
+    def readline(self):
+        """Read an answer.
+
+        Raises:
+            EOFError: End of input
+
+        Returns:
+            str: the line without the line terminator
+        """
+        if not self._lines:
+            self._fill()
+            if not self._lines:
+                raise EOFError()
+
+        line = self._lines.popleft()
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        return line.decode(self.encoding)
+
+    def __call__(self, prompt=""):
+        if self.prompts is not None:
+            self.prompts.write(prompt)
+            self.prompts.flush()
+        return self.readline()
+
+
+def loadAnswers(path):
+    """Load answer records from a file. The format is chosen by extension:
+
+    * `.json`: an object of raw answers by 'dest', or a list of them
+    * `.jsonl`: an object per line
+    * otherwise: a `dest=value` pair per line; blank lines and lines
+      starting with "#" are ignored
+
+    Args:
+        path (str): path of the file
+
+    Raises:
+        ValueError: Invalid answers file
+
+    Returns:
+        list: answer records (dicts)
+    """
+    with open(path, "r", encoding="utf8") as fp:
+        if path.endswith(".jsonl"):
+            records = [json.loads(line) for line in fp if line.strip()]
+        elif path.endswith(".json"):
+            records = json.load(fp)
+            if isinstance(records, dict):
+                records = [records]
+        else:
+            record = {}
+            for number, line in enumerate(fp, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                key, sep, value = line.partition("=")
+                if not sep:
+                    raise ValueError(f"{path}:{number}: expected 'dest=value'")
+                record[key.strip()] = value.strip()
+            records = [record]
+
+    if not all(isinstance(record, dict) for record in records):
+        raise ValueError(f"{path}: answers must be objects")
+    return records
+
+
+def loadSuite(spec):
+    """Load a suite from a JSON definition file, or import it by reference
+    (`"module:name"`). Referenced callables are called to create the suite.
+
+    Args:
+        spec (str): path or reference
+
+    Raises:
+        ValueError: The suite cannot be loaded
+
+    Returns:
+        Kerdezo | Suite: the suite
+    """
+    if os.path.isfile(spec):
+        with open(spec, "rb") as fp:
+            return serialization.load(fp, cache=False)
+
+    suite = serialization.resolveReference(spec)
+    if not isinstance(suite, (Kerdezo, Suite)) and callable(suite):
+        suite = suite()
+    if not isinstance(suite, (Kerdezo, Suite)):
+        raise ValueError(f"Not a suite: {spec}")
+    return suite
+
+
+def _result(answers, errors, complete):
+    return {
+        "answers": answers,
+        "errors": {
+            dest: [str(err) for err in errs] for dest, errs in errors.items()
+        },
+        "complete": complete
+    }
+
+
+def runSession(suite, answers=None, inputFn=None, silentInputFn=None,
+               outfile=None):
+    """Answer the questions of a suite in a session: from the prefilled
+    answers where available, from the input otherwise.
+
+    Args:
+        suite (Kerdezo | Suite): the suite
+        answers (Answers, optional): Prefilled answers. Defaults to None.
+        inputFn (callable, optional): Reads the other answers.
+        Defaults to a `LineReader` of the standard input.
+        silentInputFn (callable, optional): Reads the answers with `echo`
+        disabled. Defaults to `inputFn`.
+        outfile (file, optional): Messages are written here.
+        Defaults to `sys.stderr`.
+
+    Returns:
+        dict: `answers`, `errors` (messages by 'dest') and `complete` (whether
+        the session ran to the end)
+    """
+    inputFn = LineReader() if inputFn is None else inputFn
+    session = suite.session()
+    res = session.ask(
+        answers=answers,
+        inputFn=inputFn,
+        silentInputFn=inputFn if silentInputFn is None else silentInputFn,
+        outfile=sys.stderr if outfile is None else outfile,
+        completion=False
+    )
+    return _result(session._answers, session._errors, res is not None)
+
+
+def runBatch(suite, records, environ=None, prefix=ENV_PREFIX):
+    """Answer the questions of a suite from records, without input.
+
+    Args:
+        suite (Kerdezo | Suite): the suite
+        records (Iterable[dict]): raw answer records
+        environ (dict, optional): Environment variables overriding the
+        records. Defaults to `os.environ`.
+        prefix (str, optional): Prefix of the environment variables, or
+        `None` to ignore the environment. Defaults to ENV_PREFIX.
+
+    Yields:
+        dict: result of a record, see `runSession`
+    """
+    records = (Answers(record, environ, prefix) for record in records)
+    for result in suite.askBatch(records):
+        yield _result(result.answers, result.errors, True)
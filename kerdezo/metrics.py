@@ -0,0 +1,247 @@
+"""Per-question metrics: latency histograms, failure, retry and help counts.
+
+Set a `Metrics` instance on the suite (`Kerdezo(metrics=Metrics())`) to
+collect the following, by the 'dest' of the questions:
+
+* `input_seconds`: time spent waiting on user input (histogram)
+* `conversion_seconds`: time spent in type conversion (histogram)
+* `validator_seconds`: time spent in each validator, labeled by the name of
+  the validator; fused and concurrent groups of validators are timed as a
+  whole (histogram)
+* `failures_total`: failed conversions and validations (counter)
+* `retries_total`: questions asked again after a failure (counter)
+* `help_total`: help invocations (counter)
+
+Without metrics set on the suite, nothing is measured.
+"""
+
+from bisect import bisect_left
+import threading
+
+# Default upper bounds of histogram buckets in seconds
+BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5,
+    1.0, 5.0, 10.0, 30.0, 60.0, 300.0
+)
+
+
+def validatorName(validator):
+    """Returns a readable name of a validator, used as label in metrics.
+
+    Args:
+        validator (callable): validator
+
+    Returns:
+        str: name of the validator or its factory, names of the validators
+        of a fused or concurrent group joined by "+"
+    """
+    group = getattr(validator, "group", None)
+    if group is not None:
+        return "+".join(validatorName(member) for member in group)
+    factory = getattr(validator, "factory", None)
+    if factory is not None:
+        return factory[0].rpartition(":")[2]
+    return getattr(validator, "__qualname__", None) or repr(validator)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n") \
+        .replace('"', '\\"')
+
+
+def _labels(labels):
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+
+
+class Histogram:
+    """Histogram with fixed buckets. Observing a value costs a binary
+    search and an increment.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets=BUCKETS):
+        """Initialize a new instance of the `Histogram` class.
+
+        Args:
+            buckets (tuple, optional): Sorted upper bounds of the buckets.
+            Defaults to BUCKETS.
+        """
+        self.buckets = buckets
+        # The last bucket counts values above the highest bound
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """Add a value to the histogram.
+
+        Args:
+            value (float): observed value
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Returns the cumulative counts by upper bound, the last upper bound
+        being infinity.
+
+        Returns:
+            list: `(upper bound, count)` tuples
+        """
+        res = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            res.append((bound, total))
+        return res
+
+    def quantile(self, q):
+        """Estimate a quantile as the upper bound of the bucket it falls in.
+
+        Args:
+            q (float): quantile between 0 and 1
+
+        Returns:
+            float: estimated quantile or `None` if there are no observations
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+
+    def __repr__(self):
+        """Returns printable representation of the current object.
+
+        Returns:
+            str: string representation of the histogram
+        """
+        return f"<Histogram: count={self.count}, sum={self.sum:.6f}>"
+
+
+class Metrics:
+    """Thread-safe collection of histograms and counters by question."""
+
+    def __init__(self, buckets=BUCKETS):
+        """Initialize a new instance of the `Metrics` class.
+
+        Args:
+            buckets (tuple, optional): Upper bounds of histogram buckets in
+            seconds. Defaults to BUCKETS.
+        """
+        self.buckets = buckets
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, dest, name, value, label=None):
+        """Add a value to a histogram.
+
+        Args:
+            dest (str): 'dest' of the question
+            name (str): name of the histogram, e.g. "input_seconds"
+            value (float): observed value
+            label (str, optional): Further label (validator name).
+            Defaults to None.
+        """
+        key = (name, dest, label)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def increment(self, dest, name, value=1):
+        """Increment a counter.
+
+        Args:
+            dest (str): 'dest' of the question
+            name (str): name of the counter, e.g. "retries_total"
+            value (int, optional): Increment. Defaults to 1.
+        """
+        key = (name, dest)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def histogram(self, dest, name, label=None):
+        """Get a histogram.
+
+        Args:
+            dest (str): 'dest' of the question
+            name (str): name of the histogram
+            label (str, optional): Further label. Defaults to None.
+
+        Returns:
+            Histogram: the histogram or `None` if there are no observations
+        """
+        return self._histograms.get((name, dest, label))
+
+    def counter(self, dest, name):
+        """Get the value of a counter.
+
+        Args:
+            dest (str): 'dest' of the question
+            name (str): name of the counter
+
+        Returns:
+            int: value of the counter
+        """
+        return self._counters.get((name, dest), 0)
+
+    def reset(self):
+        """Drop all collected metrics."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def toPrometheus(self, prefix="kerdezo"):
+        """Returns the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Prefix of the metric names.
+            Defaults to "kerdezo".
+
+        Returns:
+            str: metrics as text
+        """
+        lines = []
+
+        with self._lock:
+            histograms = sorted(
+                self._histograms.items(), key=lambda i: str(i[0])
+            )
+            counters = sorted(self._counters.items(), key=lambda i: str(i[0]))
+
+            typed = set()
+            for (name, dest, label), histogram in histograms:
+                metric = f"{prefix}_{name}"
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} histogram")
+
+                labels = [("dest", dest)]
+                if label is not None:
+                    labels.append(("validator", label))
+
+                for bound, total in histogram.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    bucketLabels = _labels(labels + [("le", le)])
+                    lines.append(f"{metric}_bucket{{{bucketLabels}}} {total}")
+                lines.append(
+                    f"{metric}_sum{{{_labels(labels)}}} {histogram.sum!r}"
+                )
+                lines.append(
+                    f"{metric}_count{{{_labels(labels)}}} {histogram.count}"
+                )
+
+            for (name, dest), value in counters:
+                metric = f"{prefix}_{name}"
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric}{{{_labels([('dest', dest)])}}} {value}")
+
+        return "\n".join(lines) + "\n" if lines else ""
@@ -0,0 +1,80 @@
+"""Buffered output channel of sessions.
+
+Messages (start, end and error messages, help texts) are collected in a
+buffer and written with a single write and flush right before the next
+prompt, instead of a write per message. Binary streams are supported with
+an encoding:
+
+    suite.ask(outfile=sys.stdout.buffer, encoding="utf-8")
+"""
+
+import codecs
+import io
+import sys
+
+
+class Output:
+    """Buffered writer of messages to a text or binary stream."""
+
+    __slots__ = ("stream", "encoding", "errors", "binary", "_buffer",
+                 "_encoder")
+
+    def __init__(self, stream=None, encoding=None, errors="strict"):
+        """Initialize a new instance of the `Output` class.
+
+        Args:
+            stream (file, optional): Text or binary stream.
+            Defaults to `sys.stdout`.
+            encoding (str, optional): Encoding of the messages written to a
+            binary stream. Passing an encoding makes the stream treated as
+            binary. Defaults to UTF-8 for binary streams.
+            errors (str, optional): Encoding error handler.
+            Defaults to "strict".
+        """
+        self.stream = sys.stdout if stream is None else stream
+        self.binary = encoding is not None or isinstance(
+            self.stream, (io.RawIOBase, io.BufferedIOBase)
+        )
+        self.encoding = encoding or "utf-8"
+        self.errors = errors
+        self._buffer = []
+        # Stateful encoder, e.g. a byte order mark is written once only
+        self._encoder = codecs.getincrementalencoder(self.encoding)(errors) \
+            if self.binary else None
+
+    def write(self, text):
+        """Buffer text to be written on the next flush.
+
+        Args:
+            text (str): text
+        """
+        self._buffer.append(text)
+
+    def print(self, msg):
+        """Buffer a message as a line to be written on the next flush.
+
+        Args:
+            msg (any): message
+        """
+        self._buffer.append(f"{msg}\n")
+
+    def flush(self):
+        """Write out the buffered text at once and flush the stream.
+        Does nothing if the buffer is empty.
+        """
+        if not self._buffer:
+            return
+
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        if self.binary:
+            self.stream.write(self._encoder.encode(text))
+        else:
+            self.stream.write(text)
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
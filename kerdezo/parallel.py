@@ -0,0 +1,188 @@
+"""Batch validation on a pool of processes.
+
+`askBatch` answers records like `Kerdezo.askBatch`, but shards them into
+chunks that are answered by worker processes. The suite is shipped to each
+worker once, when the worker starts, and chunks of records are streamed to
+the workers, at most a few chunks per worker at a time. Results are
+yielded in the order of the records, or as they are ready
+(`ordered=False`).
+
+The suite is shipped as its JSON definition (see `kerdezo.serialization`),
+thus validators, types and handlers are shipped by reference, and the
+validators created by a factory decorated with `validatorFactory` (e.g.
+all built-in validators, which are closures) are re-created in the workers
+from the factory and its arguments. Suites that cannot be stored by
+reference (e.g. with lambda validators or validators defined in functions)
+are inherited by the workers where processes are started by forking;
+elsewhere they are rejected with `ValueError`. The converter registry of
+the suite (see `kerdezo.converters`) is pickled, with the converters
+registered on top of the built-in ones stored by reference. Recorders and
+metrics are not shipped.
+
+Errors are returned as the exceptions raised in the workers; exceptions
+that cannot be pickled are replaced by `InteractiveError` with the same
+message.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import itertools
+import json
+import multiprocessing
+import os
+import pickle
+
+from kerdezo import BatchResult, InteractiveError, Session, serialization
+
+# Number of records sent to a worker at once
+CHUNK_SIZE = 1000
+# Number of chunks in progress per worker
+_PREFETCH = 2
+
+# Suite of the worker process
+_suite = None
+# Suite inherited by forked workers
+_inherited = None
+
+
+def _initWorker(shipped):
+    global _suite
+    if shipped is None:
+        _suite = _inherited
+        return
+
+    definition, converters = shipped
+    data = json.loads(definition)
+    if converters is not None:
+        options = data.setdefault("options", {})
+        options["converters"] = pickle.loads(converters)
+    _suite = serialization.fromDict(data)
+
+
+def _portable(err):
+    try:
+        pickle.dumps(err)
+        return err
+    except Exception:
+        return InteractiveError(f"{type(err).__name__}: {err}")
+
+
+def _answerChunk(records):
+    """Answer a chunk of records in a worker process.
+
+    Returns:
+        bytes: pickled list of `(answers, errors)` tuples
+    """
+    results = []
+    for record in records:
+        session = Session(_suite)
+        session._askRecord(record)
+        results.append((session._answers, session._errors))
+
+    try:
+        return pickle.dumps(results, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        results = [
+            (answers, {
+                dest: [_portable(err) for err in errs]
+                for dest, errs in errors.items()
+            })
+            for answers, errors in results
+        ]
+        return pickle.dumps(results, pickle.HIGHEST_PROTOCOL)
+
+
+def _chunks(records, size):
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _ship(suite):
+    """Returns the definition of the suite and its pickled converter
+    registry shipped to the workers, or `None` if workers inherit the suite
+    by forking.
+    """
+    try:
+        definition = serialization.dumps(suite)
+        converters = suite.converters
+        if converters is not None:
+            try:
+                converters = pickle.dumps(converters)
+            except (pickle.PicklingError, AttributeError, TypeError) as ex:
+                raise ValueError(
+                    f"Converters cannot be pickled: {ex}"
+                ) from ex
+        return definition, converters
+    except (TypeError, ValueError) as ex:
+        if multiprocessing.get_start_method() != "fork":
+            raise ValueError(
+                f"Suite cannot be shipped to worker processes: {ex}"
+            ) from ex
+        return None
+
+
+def askBatch(suite, records, workers=None, chunkSize=CHUNK_SIZE,
+             ordered=True):
+    """Answer the questions of a suite from an iterable of records on a pool
+    of processes. See `Kerdezo.askBatch` for the handling of records.
+
+    Args:
+        suite (Kerdezo | Suite): the suite
+        records (Iterable[dict]): raw answer records (picklable)
+        workers (int, optional): Number of worker processes.
+        Defaults to the number of CPUs.
+        chunkSize (int, optional): Number of records sent to a worker at
+        once. Defaults to CHUNK_SIZE.
+        ordered (bool, optional): Yield the results in the order of the
+        records, rather than as they are ready. Defaults to True.
+
+    Raises:
+        InteractiveError: No questions to ask
+        ValueError: The suite cannot be shipped to the workers
+
+    Yields:
+        BatchResult: converted answers and errors of a record
+    """
+    global _inherited
+
+    if len(suite._questions.plan()) == 0:
+        raise InteractiveError("No questions to ask")
+
+    workers = workers or os.cpu_count() or 1
+    shipped = _ship(suite)
+    if shipped is None:
+        _inherited = suite
+
+    chunks = _chunks(records, chunkSize)
+    pending = deque()
+
+    with ProcessPoolExecutor(workers, initializer=_initWorker,
+                             initargs=(shipped,)) as executor:
+        try:
+            for chunk in itertools.islice(chunks, workers * _PREFETCH):
+                pending.append(executor.submit(_answerChunk, chunk))
+
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+
+                results = pickle.loads(future.result())
+
+                # Keep the workers busy while the results are consumed
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(executor.submit(_answerChunk, chunk))
+
+                for answers, errors in results:
+                    yield BatchResult(answers, errors)
+        finally:
+            for future in pending:
+                future.cancel()
+            _inherited = None
@@ -0,0 +1,334 @@
+"""Choice providers: the possible answers of a question, queried lazily.
+
+A `ChoiceProvider` answers membership, count and page queries without
+materializing all of its choices, so questions can be backed by large or
+remote catalogs. `kerdezo.Choices` is the in-memory provider questions use
+by default; `PagedChoices` fetches the choices page by page and caches
+them:
+
+    countries = PagedChoices(
+        lambda offset, limit: api.countries(offset, limit),
+        count=api.countryCount,
+        lookup=api.findCountry
+    )
+    suite.addQuestion("Country", choices=countries)
+
+Prompts show a window of the first `WINDOW` choices only, followed by the
+number of the others, e.g. "Albania, Andorra, ... (193 more)".
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+import threading
+
+# Number of choices shown in prompts and error messages
+WINDOW = 10
+
+_MISSING = object()
+# Greater than any character, bounds the keys starting with a prefix
+_MAX_CHAR = "\U0010ffff"
+
+
+class PrefixIndex:
+    """Sorted array of the string keys of choices, searched by bisection.
+    Finding the choices that start with a prefix costs two binary searches
+    and the slicing of the results.
+    """
+
+    __slots__ = ("_keys", "_items")
+
+    def __init__(self, items, key=str):
+        """Initialize a new instance of the `PrefixIndex` class.
+
+        Args:
+            items (Iterable): choices
+            key (callable, optional): Returns the string key of a choice.
+            Defaults to str.
+        """
+        pairs = sorted(
+            ((key(item), i, item) for i, item in enumerate(items)),
+            key=lambda pair: pair[:2]
+        )
+        self._keys = [pair[0] for pair in pairs]
+        self._items = [pair[2] for pair in pairs]
+
+    def find(self, prefix, limit=None):
+        """Returns the choices whose key starts with `prefix`, sorted by key.
+
+        Args:
+            prefix (str): prefix of the keys
+            limit (int, optional): Maximum number of choices.
+            Defaults to None.
+
+        Returns:
+            list: matching choices
+        """
+        keys = self._keys
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + _MAX_CHAR, lo)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return self._items[lo:hi]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class ChoiceProvider:
+    """Base class of choice providers. Subclasses must implement `get`,
+    `page` and `__len__`.
+    """
+
+    __slots__ = ()
+
+    def get(self, value, default=None):
+        """Returns the choice that matches the given value.
+
+        Args:
+            value (any): answer
+            default (any, optional): Returned if no choice matches.
+            Defaults to None.
+
+        Returns:
+            any: the matching choice, or `default`
+        """
+        raise NotImplementedError()
+
+    def page(self, offset, limit):
+        """Returns a slice of the choices.
+
+        Args:
+            offset (int): index of the first choice
+            limit (int): maximum number of choices
+
+        Returns:
+            list: choices
+        """
+        raise NotImplementedError()
+
+    def __len__(self):
+        raise NotImplementedError()
+
+    def filter(self, prefix, limit=None):
+        """Returns the choices whose string representation starts with
+        `prefix`, in order. The default implementation scans the pages.
+
+        Args:
+            prefix (str): prefix of the choices
+            limit (int, optional): Maximum number of choices.
+            Defaults to None.
+
+        Returns:
+            list: matching choices
+        """
+        res = []
+        for item in self:
+            if str(item).startswith(prefix):
+                res.append(item)
+                if limit is not None and len(res) >= limit:
+                    break
+        return res
+
+    def expand(self, prefix, default=None):
+        """Returns the only choice that starts with `prefix`.
+
+        Args:
+            prefix (str): prefix of the choice
+            default (any, optional): Returned if no choice or more than one
+            choice starts with `prefix`. Defaults to None.
+
+        Returns:
+            any: the matching choice, or `default`
+        """
+        if prefix == "":
+            return default
+        matches = self.filter(prefix, limit=2)
+        return matches[0] if len(matches) == 1 else default
+
+    def window(self, size=WINDOW):
+        """Returns the first `size` choices as a comma-separated string,
+        followed by the number of the other choices (if any).
+
+        Args:
+            size (int, optional): Number of choices shown.
+            Defaults to WINDOW.
+
+        Returns:
+            str: choices as string
+        """
+        items = self.page(0, size + 1)
+        text = ", ".join([str(item) for item in items[:size]])
+        if len(items) > size:
+            text = f"{text}, ... ({len(self) - size} more)"
+        return text
+
+    def __contains__(self, value):
+        return self.get(value, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        offset = 0
+        while True:
+            items = self.page(offset, 256)
+            yield from items
+            if len(items) < 256:
+                break
+            offset += len(items)
+
+    def __bool__(self):
+        # Providers are not empty; do not count remote catalogs to find out
+        return True
+
+    def __str__(self):
+        return self.window()
+
+
+class PagedChoices(ChoiceProvider):
+    """Choices fetched page by page on demand. Fetched pages and looked up
+    values are kept in bounded LRU caches. Instances are thread-safe.
+    """
+
+    def __init__(self, fetch, count, lookup=None, pageSize=100,
+                 maxPages=64, maxLookups=1024):
+        """Initialize a new instance of the `PagedChoices` class.
+
+        Args:
+            fetch (callable): `fetch(offset, limit)` returns a list of
+            choices
+            count (int | callable): Number of choices, or a function that
+            returns it (called once, on first use)
+            lookup (callable, optional): `lookup(value)` returns the choice
+            that matches the value or `None`. Without it, membership tests
+            scan the pages. Defaults to None.
+            pageSize (int, optional): Number of choices fetched at once.
+            Defaults to 100.
+            maxPages (int, optional): Maximum number of cached pages.
+            Defaults to 64.
+            maxLookups (int, optional): Maximum number of cached lookups.
+            Defaults to 1024.
+        """
+        self.fetch = fetch
+        self.lookup = lookup
+        self.pageSize = pageSize
+        self.maxPages = maxPages
+        self.maxLookups = maxLookups
+        self._counter = count if callable(count) else None
+        self._count = None if callable(count) else count
+        self._pages = OrderedDict()
+        self._lookups = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _page(self, index):
+        with self._lock:
+            items = self._pages.get(index)
+            if items is not None:
+                self._pages.move_to_end(index)
+                return items
+
+        items = list(self.fetch(index * self.pageSize, self.pageSize))
+
+        with self._lock:
+            self._pages[index] = items
+            if len(self._pages) > self.maxPages:
+                self._pages.popitem(last=False)
+        return items
+
+    def page(self, offset, limit):
+        """Returns a slice of the choices, fetching the pages it spans.
+
+        Args:
+            offset (int): index of the first choice
+            limit (int): maximum number of choices
+
+        Returns:
+            list: choices
+        """
+        res = []
+        size = self.pageSize
+        index = offset // size
+        start = offset - index * size
+
+        while len(res) < limit:
+            items = self._page(index)
+            res.extend(items[start:start + limit - len(res)])
+            if len(items) < size:
+                break
+            index += 1
+            start = 0
+
+        return res
+
+    def _find(self, value):
+        if self.lookup is not None:
+            return self.lookup(value)
+
+        index = 0
+        while True:
+            items = self._page(index)
+            for item in items:
+                if item == value:
+                    return item
+            if len(items) < self.pageSize:
+                return None
+            index += 1
+
+    def get(self, value, default=None):
+        """Returns the choice that matches the given value, using `lookup`
+        or scanning the pages. Results are cached.
+
+        Args:
+            value (any): answer
+            default (any, optional): Returned if no choice matches.
+            Defaults to None.
+
+        Returns:
+            any: the matching choice, or `default`
+        """
+        try:
+            with self._lock:
+                found = self._lookups.get(value, _MISSING)
+                if found is not _MISSING:
+                    self._lookups.move_to_end(value)
+        except TypeError:
+            # Unhashable values are never among the choices
+            return default
+
+        if found is _MISSING:
+            found = self._find(value)
+            with self._lock:
+                self._lookups[value] = found
+                if len(self._lookups) > self.maxLookups:
+                    self._lookups.popitem(last=False)
+
+        return default if found is None else found
+
+    def __iter__(self):
+        index = 0
+        while True:
+            items = self._page(index)
+            yield from items
+            if len(items) < self.pageSize:
+                break
+            index += 1
+
+    def __len__(self):
+        if self._count is None:
+            self._count = self._counter()
+        return self._count
+
+    def clear(self):
+        """Drop the cached pages and lookups, and the count if it is
+        computed.
+        """
+        with self._lock:
+            self._pages.clear()
+            self._lookups.clear()
+            if self._counter is not None:
+                self._count = None
+
+    def __repr__(self):
+        """Returns printable representation of the current object.
+
+        Returns:
+            str: string representation of the provider
+        """
+        return f"<PagedChoices: {len(self._pages)} pages cached>"
@@ -0,0 +1,169 @@
+"""Recorders: classes that record information as the questionnaire
+progresses.
+
+A recorder is set on the suite (`Kerdezo(recorder=...)`) or on a single
+session, and receives every event of the session as a dict through its
+`record` method. Every event has the following keys:
+
+* `event`: type of the event: "prompt", "input", "conversionError",
+  "validationError", "answer" or "abort"
+* `time`: UNIX timestamp of the event
+* `session`: identifier of the session
+* `dest`: 'dest' of the question the event relates to (if any)
+
+Further keys depend on the type of the event (`prompt`, `raw`, `error`,
+`errorType`, `value`). Answers typed at prompts with `echo` disabled are
+never recorded.
+"""
+
+import gzip
+import json
+import lzma
+import os
+import threading
+
+# Openers of the supported compression formats
+_OPENERS = {
+    None: open,
+    "gzip": gzip.open,
+    "lzma": lzma.open
+}
+
+
+class Recorder:
+    """Base class of recorders. Subclasses must implement `record`."""
+
+    def record(self, event):
+        """Record an event.
+
+        Args:
+            event (dict): the event
+        """
+        raise NotImplementedError()
+
+    def flush(self):
+        """Write out buffered events."""
+        pass
+
+    def close(self):
+        """Write out buffered events and release resources."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class JSONLRecorder(Recorder):
+    """Recorder that writes events as JSON lines to a file.
+
+    Events are buffered and written in batches by a background thread, so
+    recording does not block the session on file I/O. A batch is written
+    when `batchSize` events are buffered or `flushInterval` seconds have
+    elapsed, whichever comes first. Output can be compressed with gzip or
+    lzma. Values that are not JSON serializable are written as strings.
+    """
+
+    def __init__(self, file, compression=None, batchSize=512,
+                 flushInterval=1.0):
+        """Initialize a new instance of the `JSONLRecorder` class.
+
+        Args:
+            file (str | PathLike | file): Path of the output file (appended
+            to), or a file-like object opened in binary mode
+            compression (str, optional): "gzip", "lzma" or None.
+            Defaults to None.
+            batchSize (int, optional): Number of events that triggers a
+            write. Defaults to 512.
+            flushInterval (float, optional): Maximum number of seconds events
+            are kept in the buffer. Defaults to 1.0.
+
+        Raises:
+            ValueError: Unsupported compression
+        """
+        if compression not in _OPENERS:
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        isPath = isinstance(file, (str, bytes, os.PathLike))
+        if isPath or compression is not None:
+            self._file = _OPENERS[compression](file, "ab")
+            self._ownsFile = True
+        else:
+            self._file = file
+            self._ownsFile = False
+
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+
+        self._buffer = []
+        self._closed = False
+        self._condition = threading.Condition()
+        self._writeLock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="JSONLRecorder", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._buffer) < self.batchSize:
+                    self._condition.wait(self.flushInterval)
+                closed = self._closed
+
+            self._write()
+
+            if closed:
+                break
+
+    def _write(self):
+        with self._writeLock:
+            with self._condition:
+                events, self._buffer = self._buffer, []
+
+            if len(events) > 0:
+                lines = "".join(
+                    json.dumps(event, default=str) + "\n" for event in events
+                )
+                self._file.write(lines.encode("utf8"))
+
+    def record(self, event):
+        """Buffer an event to be written by the background thread.
+
+        Args:
+            event (dict): the event
+
+        Raises:
+            ValueError: Recorder is closed
+        """
+        with self._condition:
+            if self._closed:
+                raise ValueError("Recorder is closed")
+            self._buffer.append(event)
+            if len(self._buffer) >= self.batchSize:
+                self._condition.notify()
+
+    def flush(self):
+        """Write out buffered events and flush the output file."""
+        self._write()
+        with self._writeLock:
+            self._file.flush()
+
+    def close(self):
+        """Write out buffered events, stop the background thread and close
+        the output file (if it was opened by the recorder).
+        Closing a closed recorder has no effect.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+
+        self._thread.join()
+        self.flush()
+
+        if self._ownsFile:
+            self._file.close()
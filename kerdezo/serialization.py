@@ -0,0 +1,365 @@
+"""Load suites from and save suites to JSON.
+
+Validators, handlers and non built-in types are stored by reference: an
+importable `"module:qualname"` name, or a plain `"Class.method"` name for the
+validators of `kerdezo.validators`. Validators created by a factory decorated
+with `validatorFactory` (e.g. all built-in validators) are stored with their
+arguments and re-created on load:
+
+    {"name": "StringValidators.minimumLength", "args": [3]}
+
+Memoized validators (see `kerdezo.validators.MemoizedValidator`) are stored
+as the validator they wrap, with the options of the cache:
+
+    {"name": "IntegerValidators.greater", "args": [0],
+     "memoize": {"maxsize": 1024, "ttl": null}}
+
+Question sources are stored by reference as well:
+
+    {"source": "package.module:generateQuestions"}
+
+Loaded suites are frozen (`Suite`) and cached by the content hash of the
+definition, so loading the same definition again costs a hash computation.
+"""
+
+from collections import OrderedDict
+import hashlib
+import importlib
+import json
+
+from kerdezo import Choices, Question, Suite
+from kerdezo.dependencies import Computed
+from kerdezo.validators import MemoizedValidator
+
+# Version of the JSON suite definition format
+FORMAT_VERSION = 1
+# Number of loaded suites kept in the cache
+CACHE_SIZE = 16
+
+# Suite options stored in the definition, with their default values
+_OPTIONS = OrderedDict([
+    ("startMessage", None),
+    ("endMessage", None),
+    ("errorMessage", None),
+    ("failBehaviour", "retry"),
+    ("helpInvoker", "?")
+])
+# Suite options that hold callables
+_HANDLERS = ("failHandler", "abortHandler")
+# Built-in answer types stored by name
+_TYPES = {"str": str, "int": int, "float": float, "bool": bool}
+# Module of the validators that can be referenced without module name
+_VALIDATORS_MODULE = "kerdezo.validators"
+
+_cache = OrderedDict()
+
+
+def getReference(obj):
+    """Returns the importable reference of a function or class.
+
+    Args:
+        obj (callable): module-level function, class or method
+
+    Raises:
+        ValueError: The object cannot be imported by name
+
+    Returns:
+        str: reference as "module:qualname"
+    """
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+
+    if module is None or qualname is None or "<" in qualname:
+        raise ValueError(f"Cannot be stored by reference: {obj!r}")
+
+    return f"{module}:{qualname}"
+
+
+def resolveReference(reference):
+    """Import the object referenced by `reference`.
+
+    Args:
+        reference (str): "module:qualname", or "qualname" in
+        `kerdezo.validators`
+
+    Raises:
+        ValueError: The reference cannot be resolved
+
+    Returns:
+        any: the referenced object
+    """
+    module, sep, qualname = reference.rpartition(":")
+    if not sep:
+        module = _VALIDATORS_MODULE
+
+    try:
+        obj = importlib.import_module(module)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr)
+    except (ImportError, AttributeError) as ex:
+        raise ValueError(f"Cannot resolve reference: {reference}") from ex
+
+    return obj
+
+
+def _shorten(reference):
+    module, _, qualname = reference.partition(":")
+    return qualname if module == _VALIDATORS_MODULE else reference
+
+
+def _dumpValidator(validator):
+    if isinstance(validator, MemoizedValidator):
+        res = _dumpValidator(validator.validator)
+        res["memoize"] = {"maxsize": validator.maxsize, "ttl": validator.ttl}
+        return res
+
+    factory = getattr(validator, "factory", None)
+    if factory is None:
+        return {"name": _shorten(getReference(validator))}
+
+    reference, args, kwargs = factory
+    res = {"name": _shorten(reference), "args": list(args)}
+    if kwargs:
+        res["kwargs"] = dict(kwargs)
+    return res
+
+
+def _loadValidator(data):
+    fn = resolveReference(data["name"])
+    if "args" in data:
+        fn = fn(*data["args"], **data.get("kwargs", {}))
+    if "memoize" in data:
+        fn = MemoizedValidator(fn, **data["memoize"])
+    return fn
+
+
+def _dumpType(typ):
+    if typ is None:
+        return None
+    for name, builtin in _TYPES.items():
+        if typ is builtin:
+            return name
+    return getReference(typ)
+
+
+def _loadType(name):
+    if name is None:
+        return None
+    return _TYPES.get(name) or resolveReference(name)
+
+
+def _dumpChoices(choices):
+    if not isinstance(choices, Choices):
+        raise ValueError(f"Choice provider cannot be stored: {choices!r}")
+    if not (choices.caseFold or choices.strip or choices.aliases):
+        return list(choices)
+
+    res = {"items": list(choices)}
+    if choices.caseFold:
+        res["caseFold"] = True
+    if choices.strip:
+        res["strip"] = True
+    if choices.aliases:
+        res["aliases"] = choices.aliases
+    return res
+
+
+def _loadChoices(data):
+    if isinstance(data, dict):
+        return Choices(
+            data["items"],
+            caseFold=data.get("caseFold", False),
+            strip=data.get("strip", False),
+            aliases=data.get("aliases")
+        )
+    return data
+
+
+def _dumpQuestion(question):
+    res = OrderedDict([("title", question.title)])
+
+    if question.dest != question.title:
+        res["dest"] = question.dest
+    if question.type is not str:
+        res["type"] = _dumpType(question.type)
+    if isinstance(question.default, Computed):
+        raise ValueError(
+            f"Computed default cannot be stored: {question.default!r}"
+        )
+    if question.default is not None:
+        res["default"] = question.default
+    if not question.echo:
+        res["echo"] = False
+    if question.help:
+        res["help"] = question.help
+    if question.choices:
+        res["choices"] = _dumpChoices(question.choices)
+    if len(question.validators) > 0:
+        res["validators"] = [_dumpValidator(v) for v in question.validators]
+    if len(question.extra) > 0:
+        res["extra"] = dict(question.extra)
+
+    return res
+
+
+def _loadQuestion(data):
+    options = dict(data.get("extra", {}))
+
+    for key in ("dest", "default", "echo", "help"):
+        if key in data:
+            options[key] = data[key]
+    if "type" in data:
+        options["type"] = _loadType(data["type"])
+    if "choices" in data:
+        options["choices"] = _loadChoices(data["choices"])
+    if "validators" in data:
+        options["validators"] = [_loadValidator(v) for v in data["validators"]]
+
+    return Question(data["title"], **options)
+
+
+def toDict(suite):
+    """Returns the definition of a suite as a JSON-serializable dict.
+
+    Args:
+        suite (Kerdezo | Suite): suite to save
+
+    Raises:
+        ValueError: A validator, handler or type cannot be stored by reference
+
+    Returns:
+        dict: suite definition
+    """
+    options = OrderedDict()
+    for key, default in _OPTIONS.items():
+        value = getattr(suite, key)
+        if value != default:
+            options[key] = value
+    for key in _HANDLERS:
+        handler = getattr(suite, key)
+        if handler is not None:
+            options[key] = getReference(handler)
+
+    return OrderedDict([
+        ("version", FORMAT_VERSION),
+        ("options", options),
+        ("questions", [
+            _dumpQuestion(item) if isinstance(item, Question)
+            else {"source": getReference(item)}
+            for item in suite._questions.plan()
+        ])
+    ])
+
+
+def fromDict(data):
+    """Create a suite from its definition.
+
+    Args:
+        data (dict): suite definition as returned by `toDict`
+
+    Raises:
+        ValueError: Unsupported format version or unresolvable reference
+
+    Returns:
+        Suite: frozen suite
+    """
+    version = data.get("version")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported suite definition version: {version}")
+
+    options = dict(data.get("options", {}))
+    for key in _HANDLERS:
+        if key in options:
+            options[key] = resolveReference(options[key])
+
+    questions = [
+        resolveReference(q["source"]) if "source" in q else _loadQuestion(q)
+        for q in data.get("questions", [])
+    ]
+    return Suite(questions, **options).compile()
+
+
+def dumps(suite, **kwargs):
+    """Returns the definition of a suite as a JSON string.
+
+    Args:
+        suite (Kerdezo | Suite): suite to save
+        kwargs: passed to `json.dumps` (e.g. `indent`)
+
+    Raises:
+        ValueError: A part of the suite cannot be stored (by reference or
+        as JSON, e.g. a callable `skip` condition)
+
+    Returns:
+        str: JSON suite definition
+    """
+    data = toDict(suite)
+    try:
+        return json.dumps(data, **kwargs)
+    except TypeError as ex:
+        raise ValueError(f"Suite cannot be stored as JSON: {ex}") from ex
+
+
+def dump(suite, fp, **kwargs):
+    """Write the definition of a suite as JSON to a text file.
+
+    Args:
+        suite (Kerdezo | Suite): suite to save
+        fp (file): file-like object opened for writing text
+        kwargs: passed to `json.dumps` (e.g. `indent`)
+
+    Raises:
+        ValueError: A part of the suite cannot be stored, see `dumps`
+    """
+    # Nothing is written if the suite cannot be stored
+    fp.write(dumps(suite, **kwargs))
+
+
+def loads(text, cache=True):
+    """Load a suite from a JSON definition.
+
+    Suites are cached by the hash of `text`: loading an identical
+    definition again returns the same (frozen and compiled) suite without
+    parsing and validating it again.
+
+    Args:
+        text (str | bytes): JSON suite definition
+        cache (bool, optional): Use the cache. Defaults to True.
+
+    Returns:
+        Suite: frozen suite
+    """
+    if not cache:
+        return fromDict(json.loads(text))
+
+    data = text.encode("utf8") if isinstance(text, str) else text
+    key = hashlib.sha256(data).hexdigest()
+
+    suite = _cache.get(key)
+    if suite is None:
+        suite = fromDict(json.loads(text))
+        _cache[key] = suite
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+
+    return suite
+
+
+def load(fp, cache=True):
+    """Load a suite from a JSON file. See `loads`.
+
+    Args:
+        fp (file): file-like object opened for reading (text or binary)
+        cache (bool, optional): Use the cache. Defaults to True.
+
+    Returns:
+        Suite: frozen suite
+    """
+    return loads(fp.read(), cache=cache)
+
+
+def clearCache():
+    """Drop all suites from the cache of loaded suites."""
+    _cache.clear()
@@ -0,0 +1,347 @@
+"""Binary snapshots of suites, for a fast start of command line tools.
+
+A snapshot holds a fully built suite in a compact binary file. Questions
+are restored as they were saved, without running the checks of
+`Question.__init__` and `Kerdezo.addQuestion` again, and their pipelines
+are compiled when they are first asked. Validators, types, handlers and
+sources are stored by reference, like in JSON definitions (see
+`kerdezo.serialization`): validators created by a factory decorated with
+`validatorFactory` are re-created from the factory and its arguments.
+Recorders, metrics and converters are not stored.
+
+Every snapshot carries the version of its format and a fingerprint of the
+build: the versions of kerdezo and Python, and a key that identifies the
+suite definition. `cached` rebuilds and saves the snapshot when the
+fingerprint differs, e.g. after the module that builds the suite changed:
+
+    suite = snapshot.cached("suite.snapshot", buildSuite)
+    suite.ask()
+
+Snapshots are pickles: `load`, `loads` and `cached` unpickle them, which can
+run arbitrary code. The SHA-256 digest in the header only detects corrupt
+files, it does not authenticate them. Load snapshots from trusted locations
+only: whoever can write the snapshot file can run code in the process that
+loads it.
+"""
+
+import gc
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import types
+
+from kerdezo import (
+    _NO_EXTRA,
+    Kerdezo,
+    Question,
+    QuestionRegistry,
+    Suite,
+    __version__
+)
+from kerdezo.dependencies import Computed, Constraint
+from kerdezo.serialization import (
+    _HANDLERS,
+    _OPTIONS,
+    getReference,
+    resolveReference
+)
+from kerdezo.validators import MemoizedValidator
+
+# Version of the snapshot format
+FORMAT_VERSION = 1
+
+_MAGIC = b"KRDZSNAP"
+# Magic, format version, fingerprint and digest of the payload
+_HEADER = struct.Struct(">8sH32s32s")
+# Question attributes stored in the snapshot
+_ATTRS = tuple(
+    name for name in Question.__slots__ if name not in ("_pipeline", "_prompt")
+)
+
+
+def fingerprint(key=""):
+    """Returns the fingerprint of a build: the hash of the snapshot format,
+    the versions of kerdezo and Python, and the key of the suite.
+
+    Args:
+        key (str | bytes, optional): Identifies the suite definition.
+        Defaults to "".
+
+    Returns:
+        bytes: fingerprint (32 bytes)
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        f"{FORMAT_VERSION}:{__version__}:{sys.version_info[:2]}:".encode()
+    )
+    digest.update(key.encode("utf8") if isinstance(key, str) else key)
+    return digest.digest()
+
+
+def _restoreValidator(reference, args, kwargs):
+    return resolveReference(reference)(*args, **kwargs)
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler that re-creates each distinct validator once: validators
+    created by a factory with the same arguments are shared.
+    """
+
+    def __init__(self, file):
+        super().__init__(file)
+        self._factories = {}
+        self._validators = {}
+
+    def find_class(self, module, name):
+        if module == __name__ and name == "_restoreValidator":
+            return self._restoreValidator
+        return super().find_class(module, name)
+
+    def _restoreValidator(self, reference, args, kwargs):
+        try:
+            key = (reference, args, tuple(sorted(kwargs.items())))
+            validator = self._validators.get(key)
+        except TypeError:
+            # Unhashable arguments
+            key = validator = None
+        if validator is not None:
+            return validator
+
+        factory = self._factories.get(reference)
+        if factory is None:
+            factory = self._factories[reference] = resolveReference(reference)
+        validator = factory(*args, **kwargs)
+        if key is not None:
+            self._validators[key] = validator
+        return validator
+
+
+def _restoreQuestion(cls, values, attributes):
+    question = object.__new__(cls)
+    for name, value in zip(_ATTRS, values):
+        if name == "extra":
+            value = types.MappingProxyType(value) if value else _NO_EXTRA
+        object.__setattr__(question, name, value)
+    object.__setattr__(question, "_pipeline", None)
+    object.__setattr__(question, "_prompt", None)
+    if attributes:
+        question.__dict__.update(attributes)
+    return question
+
+
+def _restoreSuite(options, plan):
+    suite = object.__new__(Suite)
+    for key, value in options.items():
+        object.__setattr__(suite, key, value)
+
+    registry = QuestionRegistry()
+    questions = [item for item in plan if isinstance(item, Question)]
+    registry._byDest = {question.dest: question for question in questions}
+    registry._byId = {id(question): question.dest for question in questions}
+    if len(questions) != len(plan):
+        registry._plan = list(plan)
+    object.__setattr__(suite, "_questions", registry)
+    return suite
+
+
+class _Pickler(pickle.Pickler):
+    def reducer_override(self, obj):
+        if isinstance(obj, Question):
+            values = tuple(
+                dict(value) if name == "extra" else value
+                for name, value in (
+                    (name, getattr(obj, name)) for name in _ATTRS
+                )
+            )
+            return _restoreQuestion, (
+                type(obj), values, getattr(obj, "__dict__", None)
+            )
+        if isinstance(obj, types.FunctionType):
+            factory = getattr(obj, "factory", None)
+            if factory is not None:
+                return _restoreValidator, factory
+            # Check that the function can be imported when loading
+            getReference(obj)
+        elif isinstance(obj, MemoizedValidator):
+            return MemoizedValidator, (obj.validator, obj.maxsize, obj.ttl)
+        elif isinstance(obj, (Computed, Constraint)):
+            # Decorated module-level functions (see `computed`)
+            reference = getReference(obj.fn)
+            if resolveReference(reference) is obj:
+                return resolveReference, (reference,)
+        return NotImplemented
+
+
+def dumps(suite, key=""):
+    """Returns the snapshot of a suite.
+
+    Args:
+        suite (Kerdezo | Suite): suite to save
+        key (str | bytes, optional): Identifies the suite definition, see
+        `fingerprint`. Defaults to "".
+
+    Raises:
+        ValueError: A part of the suite cannot be stored by reference
+
+    Returns:
+        bytes: snapshot
+    """
+    options = {name: getattr(suite, name) for name in _OPTIONS}
+    for name in _HANDLERS:
+        handler = getattr(suite, name)
+        if handler is not None:
+            options[name] = handler
+
+    buffer = io.BytesIO()
+    try:
+        _Pickler(buffer, pickle.HIGHEST_PROTOCOL).dump(
+            (options, list(suite._questions.plan()))
+        )
+    except (pickle.PicklingError, AttributeError, TypeError) as ex:
+        raise ValueError(f"Suite cannot be stored in a snapshot: {ex}") from ex
+
+    payload = buffer.getvalue()
+    header = _HEADER.pack(
+        _MAGIC, FORMAT_VERSION, fingerprint(key),
+        hashlib.sha256(payload).digest()
+    )
+    return header + payload
+
+
+def loads(data, key=None):
+    """Restore a suite from its snapshot. The snapshot is unpickled, thus it
+    must come from a trusted source (see the module documentation).
+
+    Args:
+        data (bytes): snapshot
+        key (str | bytes, optional): Key of the suite definition the
+        snapshot must have been saved with, `None` not to check it.
+        Defaults to None.
+
+    Raises:
+        ValueError: Invalid or stale snapshot, or unresolvable reference
+
+    Returns:
+        Suite: frozen suite
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Invalid snapshot")
+
+    magic, version, saved, digest = _HEADER.unpack_from(data)
+    payload = memoryview(data)[_HEADER.size:]
+    if magic != _MAGIC or hashlib.sha256(payload).digest() != digest:
+        raise ValueError("Invalid snapshot")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    if key is not None and saved != fingerprint(key):
+        raise ValueError("Stale snapshot")
+
+    # The objects restored are long-lived: collecting garbage while they are
+    # created would only slow the load down
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        options, plan = _Unpickler(io.BytesIO(payload)).load()
+        return _restoreSuite(options, plan)
+    except (pickle.UnpicklingError, AttributeError, ImportError) as ex:
+        raise ValueError(f"Cannot restore snapshot: {ex}") from ex
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def save(suite, path, key=""):
+    """Save the snapshot of a suite to a file. The file is replaced
+    atomically.
+
+    Args:
+        suite (Kerdezo | Suite): suite to save
+        path (str): path of the file
+        key (str | bytes, optional): Identifies the suite definition.
+        Defaults to "".
+
+    Raises:
+        ValueError: A part of the suite cannot be stored by reference
+    """
+    data = dumps(suite, key)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load(path, key=None):
+    """Restore a suite from a snapshot file. See `loads`.
+
+    Args:
+        path (str): path of the file
+        key (str | bytes, optional): Key of the suite definition the
+        snapshot must have been saved with. Defaults to None.
+
+    Returns:
+        Suite: frozen suite
+    """
+    with open(path, "rb") as fp:
+        return loads(fp.read(), key)
+
+
+def buildKey(build):
+    """Returns the default key of a suite built by a function: the source of
+    the module of the function, thus the snapshot is rebuilt when the
+    module changes.
+
+    Args:
+        build (callable): function that builds the suite
+
+    Returns:
+        bytes: key
+    """
+    key = getReference(build).encode("utf8")
+    try:
+        with open(inspect.getsourcefile(build), "rb") as fp:
+            return key + b"\0" + fp.read()
+    except (OSError, TypeError):
+        return key
+
+
+def cached(path, build, key=None):
+    """Restore a suite from its snapshot, or build it and save its snapshot
+    if the snapshot is missing, invalid or stale. The snapshot file must be
+    trusted, see the module documentation.
+
+    Args:
+        path (str): path of the snapshot file
+        build (callable): builds the suite (`Kerdezo` or `Suite`)
+        key (str | bytes, optional): Identifies the suite definition.
+        Defaults to the source of the module of `build` (see `buildKey`).
+
+    Returns:
+        Suite: the restored suite, or the built one (frozen if `build`
+        returns a `Kerdezo`)
+    """
+    key = buildKey(build) if key is None else key
+    try:
+        return load(path, key)
+    except (OSError, ValueError):
+        pass
+
+    suite = build()
+    if isinstance(suite, Kerdezo):
+        # The same type of suite on every start
+        suite = suite.freeze()
+    try:
+        save(suite, path, key)
+    except (OSError, ValueError):
+        # Unsaved snapshots only cost the next start
+        pass
+    return suite
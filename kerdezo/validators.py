@@ -1,109 +1,839 @@
 """This file contains validators for most common use cases.
 """
 
+import array
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import functools
+import itertools
+import operator
 import re
+import threading
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_EMAIL = re.compile(r"^\w+([\.-]?\w+)*@\w+([\.-]?\w+)*(\.\w{2,9})+$")
+
+
+def validatorFactory(fn):
+    """Decorator for validator factories. Validators created by the factory
+    remember the factory and its arguments in their `factory` attribute as a
+    `(reference, args, kwargs)` tuple, so they can be stored by reference
+    (e.g. in JSON suite definitions) and re-created later.
+
+    Args:
+        fn (callable): validator factory
+
+    Returns:
+        callable: decorated validator factory
+    """
+    reference = f"{fn.__module__}:{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def _factory(*args, **kwargs):
+        validator = fn(*args, **kwargs)
+        validator.factory = (reference, args, kwargs)
+        return validator
+    return _factory
+
+
+def nonRaising(fn):
+    """Decorator for validators that return their failure (an exception,
+    e.g. `ValueError`) instead of raising it, and `None` on success. Building
+    an exception is cheap, raising and catching it is not. The decorated
+    validator raises the failure, thus it can be used like any other
+    validator; the original function is kept as its `check`, which the
+    batch and ask paths call without raising (see `checker`).
+
+    Args:
+        fn (callable): validator that returns its failure
+
+    Returns:
+        callable: raising validator
+    """
+    @functools.wraps(fn)
+    def _validator(value, question=None, context=None):
+        error = fn(value, question, context)
+        if error is not None:
+            raise error
+    _validator.check = fn
+    return _validator
+
+
+def checker(validator):
+    """Returns the non-raising form of a validator: a callable that returns
+    the failure of the validator, or `None` on success. Validators without
+    one (see `nonRaising`) are adapted: the exceptions they raise are caught
+    and returned.
+
+    Args:
+        validator (callable): validator
+
+    Returns:
+        callable: `check(value, question=None, context=None)`
+    """
+    check = getattr(validator, "check", None)
+    if check is not None:
+        return check
+
+    def _check(value, question=None, context=None):
+        try:
+            validator(value, question, context)
+        except Exception as ex:
+            return ex
+    return _check
+
+
+def contextual(fn):
+    """Decorator that marks a validator as depending on the `question` or
+    the `context` it is called with (e.g. on other answers). Such validators
+    are never memoized.
+
+    Args:
+        fn (callable): validator
+
+    Returns:
+        callable: the same validator
+    """
+    fn.contextual = True
+    return fn
+
+
+def independent(fn=None, timeout=None):
+    """Decorator that marks a validator as independent of the other
+    validators of a question, e.g. an I/O-bound check. Adjacent independent
+    validators of a question run concurrently on a thread pool (see
+    `concurrentValidators`). Can be used with or without arguments.
+
+    Args:
+        fn (callable, optional): validator
+        timeout (float, optional): Maximum run time of the validator in
+        seconds. Defaults to None.
+
+    Returns:
+        callable: the same validator (or a decorator)
+    """
+    if fn is None:
+        return functools.partial(independent, timeout=timeout)
+    fn.independent = True
+    fn.timeout = timeout
+    return fn
+
+
+class ValidationTimeout(ValueError):
+    """A validator did not finish in time."""
+    pass
+
+
+class ValidationErrors(ValueError):
+    """Several concurrently run validators failed. `errors` holds the errors
+    in the order of the validators.
+    """
+
+    def __init__(self, errors):
+        super().__init__("; ".join(str(err) for err in errors))
+        self.errors = errors
+
+    def __reduce__(self):
+        return (type(self), (self.errors,))
+
+
+def _copyError(err):
+    """Returns a copy of an exception with the same arguments and attributes,
+    without calling its `__init__` (its signature may differ from `args`)
+    and without the traceback of the original.
+    """
+    res = type(err).__new__(type(err), *err.args)
+    res.args = err.args
+    res.__dict__.update(err.__dict__)
+    return res
+
+
+class MemoizedValidator:
+    """Validator wrapper that caches the outcome of the wrapped validator by
+    the validated value: either success or the `ValueError` it raised, which
+    is raised again (as a copy with the same arguments and attributes) on a
+    hit.
+
+    The cache holds at most `maxsize` values, evicting the least recently
+    used one, and entries expire `ttl` seconds after they were stored (never
+    if `ttl` is None). Unhashable values are not cached. The wrapper is
+    thread-safe.
+    """
+
+    def __init__(self, validator, maxsize=1024, ttl=None):
+        """Initialize a new instance of the `MemoizedValidator` class.
+
+        Args:
+            validator (callable): validator to wrap
+            maxsize (int, optional): Maximum number of cached values.
+            Defaults to 1024.
+            ttl (float, optional): Time to live of entries in seconds.
+            Defaults to None.
+
+        Raises:
+            ValueError: The validator depends on question or context
+        """
+        if getattr(validator, "contextual", False):
+            raise ValueError(
+                f"Contextual validator cannot be memoized: {validator!r}"
+            )
+
+        functools.update_wrapper(self, validator)
+        # The non-raising form of the wrapped validator would bypass the cache
+        self.__dict__.pop("check", None)
+        self.validator = validator
+        self._check = checker(validator)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, value, question=None, context=None):
+        err = self.check(value, question, context)
+        if err is not None:
+            raise err
+
+    def check(self, value, question=None, context=None):
+        """Non-raising form of the validator (see `nonRaising`), that goes
+        through the cache as well.
+
+        Returns:
+            Exception: the failure, or `None` if the value is valid
+        """
+        try:
+            hash(value)
+        except TypeError:
+            return self._check(value, question, context)
+
+        with self._lock:
+            entry = self._cache.get(value)
+            if entry is not None:
+                expires, err = entry
+                if expires is None or expires > time.monotonic():
+                    self._cache.move_to_end(value)
+                    self.hits += 1
+                    return None if err is None else _copyError(err)
+                del self._cache[value]
+            self.misses += 1
+
+        err = self._check(value, question, context)
+        if err is None or isinstance(err, ValueError):
+            self._store(value, err)
+        return err
+
+    def _store(self, value, err):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._cache[value] = (expires, err)
+            self._cache.move_to_end(value)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def cacheClear(self):
+        """Drop all cached outcomes and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cacheInfo(self):
+        """Returns statistics of the cache.
+
+        Returns:
+            dict: `hits`, `misses`, `size` and `maxsize` of the cache
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self.maxsize
+        }
+
+
+def memoize(validator=None, maxsize=1024, ttl=None):
+    """Memoize the outcome of a validator. See `MemoizedValidator`.
+    Can be used as a decorator, with or without arguments.
+
+    Args:
+        validator (callable, optional): validator to wrap
+        maxsize (int, optional): Maximum number of cached values.
+        Defaults to 1024.
+        ttl (float, optional): Time to live of entries in seconds.
+        Defaults to None.
+
+    Returns:
+        MemoizedValidator: the memoized validator (or a decorator)
+    """
+    if validator is None:
+        return functools.partial(memoize, maxsize=maxsize, ttl=ttl)
+    return MemoizedValidator(validator, maxsize=maxsize, ttl=ttl)
+
+
+def memoizeValidators(validators, maxsize=1024, ttl=None):
+    """Memoize each of the validators, except the contextual and the already
+    memoized ones.
+
+    Args:
+        validators (Iterable[callable]): validators
+        maxsize (int, optional): Maximum number of cached values per
+        validator. Defaults to 1024.
+        ttl (float, optional): Time to live of entries in seconds.
+        Defaults to None.
+
+    Returns:
+        list: validators
+    """
+    return [
+        validator
+        if getattr(validator, "contextual", False)
+        or isinstance(validator, MemoizedValidator)
+        else MemoizedValidator(validator, maxsize=maxsize, ttl=ttl)
+        for validator in validators
+    ]
+
+
+class ColumnResult:
+    """Outcome of validating a column of values at once: the indexes of the
+    failed values in ascending order. Error messages are formatted on
+    demand, only for the failures that are looked at.
+    """
+
+    __slots__ = ("failures", "size", "_format")
+
+    def __init__(self, failures, size, format):
+        """Initialize a new instance of the `ColumnResult` class.
+
+        Args:
+            failures (list): indexes of the failed values
+            size (int): number of values validated
+            format (callable): returns the message of a failure by index
+        """
+        self.failures = failures
+        self.size = size
+        self._format = format
+
+    @property
+    def ok(self):
+        """Whether all the values are valid.
+
+        Returns:
+            bool: `True` if there were no failures
+        """
+        return len(self.failures) == 0
+
+    def mask(self):
+        """Returns the failures as a mask.
+
+        Returns:
+            bytearray: 1 for failed, 0 for valid values
+        """
+        res = bytearray(self.size)
+        for index in self.failures:
+            res[index] = 1
+        return res
+
+    def message(self, index):
+        """Get the error message of a failed value.
+
+        Args:
+            index (int): index of the value in the column
+
+        Returns:
+            str: error message
+        """
+        return self._format(index)
+
+    def messages(self):
+        """Error messages of the failed values, formatted lazily.
+
+        Yields:
+            tuple: index of the value and error message
+        """
+        for index in self.failures:
+            yield index, self._format(index)
+
+    def __len__(self):
+        return len(self.failures)
+
+    def __repr__(self):
+        return f"<ColumnResult: {len(self.failures)} of {self.size} failed>"
+
+
+def _failures(flags):
+    """Indexes of the true flags."""
+    return list(itertools.compress(itertools.count(), flags))
+
+
+def _isArray(values):
+    return isinstance(values, (array.array, memoryview)) or (
+        hasattr(values, "__array_interface__")
+    )
+
+
+def _compareColumn(values, op, limit):
+    """Indexes of the values for which `op(value, limit)` does not hold.
+    Arrays of numbers are compared by NumPy if it is installed; other
+    columns by `map`, without a Python-level call per value.
+    """
+    if numpy is not None and _isArray(values):
+        column = numpy.asarray(values)
+        if column.dtype.kind in "iuf":
+            return numpy.flatnonzero(~op(column, limit)).tolist()
+    return _failures(
+        map(operator.not_, map(op, values, itertools.repeat(limit)))
+    )
+
+
+def _column(failures, format):
+    """Create the column form of a built-in validator.
+
+    Args:
+        failures (callable): returns the failure indexes of a column
+        format (callable): returns the message of a failed value
+    """
+    def _validateColumn(values):
+        return ColumnResult(
+            failures(values), len(values), lambda index: format(values[index])
+        )
+    return _validateColumn
+
+
+def validateColumn(validator, values, question=None, context=None):
+    """Validate a column of values at once. Built-in validators check the
+    whole column in bulk (see their `column` attribute), without raising an
+    exception per failure; other validators are called value by value.
+
+    Args:
+        validator (callable): validator
+        values (Sequence): the values, e.g. a list or an `array.array`
+        question (Question, optional): Passed to per-value validators.
+        Defaults to None.
+        context (any, optional): Passed to per-value validators.
+        Defaults to None.
+
+    Returns:
+        ColumnResult: failures of the column
+    """
+    column = getattr(validator, "column", None)
+    if column is not None:
+        return column(values)
+
+    errors = {}
+    for index, value in enumerate(values):
+        try:
+            validator(value, question, context)
+        except ValueError as ex:
+            errors[index] = ex
+    return ColumnResult(list(errors), len(values), lambda i: str(errors[i]))
 
 
 class StringValidators:
     @staticmethod
+    @validatorFactory
     def equal(value, message="Must equal to {expected}"):
+        @nonRaising
         def _validator(expected, question=None, context=None):
             if value != expected:
-                raise ValueError(
+                return ValueError(
                     message.format(value=value, expected=expected)
                 )
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.eq, value),
+            lambda expected: message.format(value=value, expected=expected)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def notEqual(value, message="Must not equal to {notExpected}"):
+        @nonRaising
         def _validator(notExpected, question=None, context=None):
             if value == notExpected:
-                raise ValueError(
+                return ValueError(
                     message.format(value=value, notExpected=notExpected)
                 )
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.ne, value),
+            lambda notExpected: message.format(
+                value=value, notExpected=notExpected
+            )
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def minimumLength(length, message="Minimum length is {length}"):
+        @nonRaising
         def _validator(value, question=None, context=None):
             if len(value) < length:
-                raise ValueError(
-                    message.format(value=value, length=length)
-                )
+                return ValueError(message.format(value=value, length=length))
+        _validator.lengthBound = (">=", length)
+        _validator.column = _column(
+            lambda values: _compareColumn(
+                map(len, values), operator.ge, length
+            ),
+            lambda value: message.format(value=value, length=length)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def maximumLength(length, message="Maximum length is: {length}"):
+        @nonRaising
         def _validator(value, question=None, context=None):
             if len(value) > length:
-                raise ValueError(
-                    message.format(value=value, length=length)
-                )
+                return ValueError(message.format(value=value, length=length))
+        _validator.lengthBound = ("<=", length)
+        _validator.column = _column(
+            lambda values: _compareColumn(
+                map(len, values), operator.le, length
+            ),
+            lambda value: message.format(value=value, length=length)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def notEmptyOrWhitespace(message="Empty string is not allowed"):
+        @nonRaising
         def _validator(value, question=None, context=None):
             if value.strip() == "":
-                raise ValueError(message.format(value=value))
+                return ValueError(message.format(value=value))
+        _validator.column = _column(
+            lambda values: _failures(
+                map(operator.not_, map(str.strip, values))
+            ),
+            lambda value: message.format(value=value)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def emailAddress(message="Invalid e-mail address: {value}"):
+        @nonRaising
         def _validator(value, question=None, context=None):
-            m = re.match(
-                r"^\w+([\.-]?\w+)*@\w+([\.-]?\w+)*(\.\w{2,9})+$",
-                value
-            )
-
-            if not m:
-                raise ValueError(message.format(value=value))
+            if not _EMAIL.match(value):
+                return ValueError(message.format(value=value))
+        _validator.column = _column(
+            lambda values: _failures(
+                map(operator.not_, map(_EMAIL.match, values))
+            ),
+            lambda value: message.format(value=value)
+        )
         return _validator
 
 
 class IntegerValidators:
     @staticmethod
+    @validatorFactory
     def equal(value, message="Must equal to {expected}"):
+        @nonRaising
         def _validator(expected, question=None, context=None):
             if value != expected:
-                raise ValueError(
+                return ValueError(
                     message.format(value=value, expected=expected)
                 )
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.eq, value),
+            lambda expected: message.format(value=value, expected=expected)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def notEqual(value, message="Must not equal to {notExpected}"):
+        @nonRaising
         def _validator(notExpected, question=None, context=None):
             if value == notExpected:
-                raise ValueError(
+                return ValueError(
                     message.format(value=value, notExpected=notExpected)
                 )
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.ne, value),
+            lambda notExpected: message.format(
+                value=value, notExpected=notExpected
+            )
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def greater(min, message="Must be greater than {min}"):
+        @nonRaising
         def _validator(value, question=None, context=None):
             if not (value > min):
-                raise ValueError(message.format(value=value, min=min))
+                return ValueError(message.format(value=value, min=min))
+        _validator.bound = (">", min)
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.gt, min),
+            lambda value: message.format(value=value, min=min)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def greaterEqual(min, message="Must be greater or equal than {min}"):
+        @nonRaising
         def _validator(value, question=None, context=None):
             if not (value >= min):
-                raise ValueError(message.format(value=value, min=min))
+                return ValueError(message.format(value=value, min=min))
+        _validator.bound = (">=", min)
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.ge, min),
+            lambda value: message.format(value=value, min=min)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def less(max, message="Must be less than {max}"):
+        @nonRaising
         def _validator(value, question=None, context=None):
             if not (value < max):
-                raise ValueError(message.format(value=value, max=max))
+                return ValueError(message.format(value=value, max=max))
+        _validator.bound = ("<", max)
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.lt, max),
+            lambda value: message.format(value=value, max=max)
+        )
         return _validator
 
     @staticmethod
+    @validatorFactory
     def lessEqual(max, message="Must be less or equal than {max}"):
+        @nonRaising
         def _validator(value, question=None, context=None):
             if not (value <= max):
-                raise ValueError(message.format(max=max, value=value))
+                return ValueError(message.format(max=max, value=value))
+        _validator.bound = ("<=", max)
+        _validator.column = _column(
+            lambda values: _compareColumn(values, operator.le, max),
+            lambda value: message.format(max=max, value=value)
+        )
         return _validator
+
+
+_OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le
+}
+
+
+def _tightest(bounds, lower):
+    """Returns the tightest of the given lower or upper bounds."""
+    res = None
+    for op, limit in bounds:
+        if op.startswith(">") != lower:
+            continue
+        if res is None:
+            res = (op, limit)
+        elif (limit > res[1]) if lower else (limit < res[1]):
+            res = (op, limit)
+        elif limit == res[1] and len(op) == 1:
+            # Strict comparison is tighter on the same limit
+            res = (op, limit)
+    return res
+
+
+def _fuseRun(run, attr):
+    """Fuse adjacent bound checks into a single range check.
+    On failure the original validators are run in order, so the error message
+    is the same as without fusing.
+    """
+    bounds = [getattr(validator, attr) for validator in run]
+    checks = [
+        (_OPERATORS[bound[0]], bound[1])
+        for bound in (_tightest(bounds, True), _tightest(bounds, False))
+        if bound is not None
+    ]
+    measure = len if attr == "lengthBound" else None
+    runChecks = [checker(validator) for validator in run]
+
+    def _check(value, question=None, context=None):
+        measured = value if measure is None else measure(value)
+        for op, limit in checks:
+            if not op(measured, limit):
+                for check in runChecks:
+                    error = check(value, question, context)
+                    if error is not None:
+                        return error
+    # Validators of the group, e.g. for naming it in metrics
+    _check.group = tuple(run)
+    return nonRaising(_check)
+
+
+def fuseValidators(validators):
+    """Collapse adjacent built-in bound validators (e.g.
+    `IntegerValidators.greaterEqual` and `IntegerValidators.lessEqual`, or
+    `StringValidators.minimumLength` and `StringValidators.maximumLength`)
+    into a single range check. Other validators are kept as they are.
+
+    Args:
+        validators (Iterable[callable]): validators in order of execution
+
+    Returns:
+        list: validators with adjacent bound checks fused
+    """
+    res = []
+    run = []
+    runAttr = None
+
+    def flush():
+        if len(run) > 1:
+            res.append(_fuseRun(list(run), runAttr))
+        else:
+            res.extend(run)
+        run.clear()
+
+    for validator in validators:
+        attr = None
+        for candidate in ("bound", "lengthBound"):
+            if hasattr(validator, candidate):
+                attr = candidate
+        if attr is None or attr != runAttr:
+            flush()
+        runAttr = attr
+        if attr is None:
+            res.append(validator)
+        else:
+            run.append(validator)
+
+    flush()
+    return res
+
+
+_executor = None
+_executorLock = threading.Lock()
+
+
+def setValidatorExecutor(executor):
+    """Set the executor that runs independent validators concurrently.
+    By default, a shared thread pool is created on first use.
+
+    Args:
+        executor (concurrent.futures.Executor): executor
+    """
+    global _executor
+    with _executorLock:
+        _executor = executor
+
+
+def _getExecutor():
+    global _executor
+    with _executorLock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                thread_name_prefix="kerdezo-validator"
+            )
+        return _executor
+
+
+def _concurrentRun(run, timeout):
+    """Run validators concurrently, with per-validator and overall deadlines.
+    After the first failure, validators that have not started yet are
+    cancelled. The failures of the others are collected and reported in the
+    order of the validators. Validators that time out are abandoned: their
+    thread cannot be interrupted.
+    """
+    def _validator(value, question=None, context=None):
+        executor = _getExecutor()
+        start = time.monotonic()
+        overall = None if timeout is None else start + timeout
+        pending = {}
+
+        for index, validator in enumerate(run):
+            own = getattr(validator, "timeout", None)
+            own = None if own is None else start + own
+            deadlines = [d for d in (overall, own) if d is not None]
+            future = executor.submit(validator, value, question, context)
+            pending[future] = (index, min(deadlines) if deadlines else None)
+
+        errors = [None] * len(run)
+        failed = False
+
+        while pending:
+            deadlines = [d for _, d in pending.values() if d is not None]
+            wait(
+                pending,
+                timeout=max(0, min(deadlines) - time.monotonic())
+                if deadlines else None,
+                return_when=FIRST_COMPLETED
+            )
+
+            now = time.monotonic()
+            for future, (index, deadline) in list(pending.items()):
+                if future.done():
+                    del pending[future]
+                    if not future.cancelled() and future.exception():
+                        errors[index] = future.exception()
+                        failed = True
+                elif deadline is not None and deadline <= now:
+                    del pending[future]
+                    future.cancel()
+                    name = getattr(run[index], "__qualname__", run[index])
+                    errors[index] = ValidationTimeout(
+                        f"Validation timed out: {name}"
+                    )
+                    failed = True
+
+            if failed:
+                # First failure: do not start the rest
+                for future in list(pending):
+                    if future.cancel():
+                        del pending[future]
+
+        errors = [err for err in errors if err is not None]
+        if len(errors) == 1:
+            raise errors[0]
+        elif len(errors) > 1:
+            raise ValidationErrors(errors)
+    _validator.group = tuple(run)
+    # Blocks until the group is done, see `Question.validateAsync`
+    _validator.concurrent = True
+    return _validator
+
+
+def concurrentValidators(validators, timeout=None):
+    """Replace adjacent independent validators (see `independent`) with a
+    single validator that runs them concurrently. Other validators run
+    sequentially, in order, as usual.
+
+    Args:
+        validators (Iterable[callable]): validators in order of execution
+        timeout (float, optional): Overall deadline of each concurrent group
+        in seconds. Defaults to None.
+
+    Returns:
+        list: validators
+    """
+    res = []
+    run = []
+
+    def flush():
+        timed = timeout is not None or any(
+            getattr(v, "timeout", None) is not None for v in run
+        )
+        if len(run) > 1 or (len(run) == 1 and timed):
+            res.append(_concurrentRun(list(run), timeout))
+        else:
+            res.extend(run)
+        run.clear()
+
+    for validator in validators:
+        if getattr(validator, "independent", False):
+            run.append(validator)
+        else:
+            flush()
+            res.append(validator)
+
+    flush()
+    return res
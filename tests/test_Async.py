@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import unittest
+
+from kerdezo import (
+    Kerdezo,
+    InteractiveError
+)
+from kerdezo.validators import (
+    StringValidators,
+    ValidationTimeout,
+    independent
+)
+
+
+class AsyncTests(unittest.TestCase):
+
+    @staticmethod
+    def answerMachine(answers):
+        answers = iter(answers)
+
+        async def _input(prompt):
+            await asyncio.sleep(0)
+            return next(answers)
+
+        return _input
+
+    @staticmethod
+    async def asyncValidator(value, question, context):
+        await asyncio.sleep(0)
+        if value == "taken":
+            raise ValueError("Already taken")
+
+    def test_async_no_questions(self):
+        k = Kerdezo()
+
+        with self.assertRaises(InteractiveError):
+            asyncio.run(k.askAsync())
+
+    def test_async_retry(self):
+        failures = []
+        output = []
+
+        async def failHandler(err, context):
+            failures.append(str(err))
+
+        k = Kerdezo(endMessage="Done", failHandler=failHandler)
+        k.addQuestion("User name", dest="user", help="Pick a free one",
+                      validators=[self.asyncValidator])
+        k.addQuestion("Password", echo=False,
+                      validators=[StringValidators.minimumLength(3)])
+        k.addQuestion("Age", type=int, default=18)
+
+        res = asyncio.run(k.askAsync(
+            inputFn=self.answerMachine(["?", "taken", "john", "", "x"]),
+            silentInputFn=self.answerMachine(["pw", "secret"]),
+            outputFn=output.append
+        ))
+
+        self.assertEqual(res, {"user": "john", "Password": "secret", "Age": 18})
+        self.assertEqual(failures, ["Already taken", "Minimum length is 3"])
+        self.assertEqual(output, ["Pick a free one", "Done"])
+
+    def test_async_continue(self):
+        k = Kerdezo(failBehaviour="continue")
+        k.addQuestion("Name", validators=[self.asyncValidator])
+
+        asyncio.run(k.askAsync(
+            inputFn=self.answerMachine(["taken"]),
+            outputFn=lambda msg: None
+        ))
+
+        self.assertEqual(len(k.getErrors("Name")), 1)
+
+    def test_async_timeout(self):
+        @independent(timeout=0.05)
+        def never(value, question, context):
+            threading.Event().wait(1)
+
+        k = Kerdezo(failBehaviour="continue")
+        k.addQuestion("Name", validators=[never])
+
+        asyncio.run(k.askAsync(
+            inputFn=self.answerMachine(["john"]),
+            outputFn=lambda msg: None
+        ))
+
+        self.assertIsInstance(k.getErrors("Name")[0], ValidationTimeout)
+
+    def test_async_independent_in_executor(self):
+        started = threading.Event()
+        released = threading.Event()
+
+        @independent(timeout=5)
+        def waiting(value, question, context):
+            started.set()
+            # Released by a task of the event loop
+            if not released.wait(1):
+                raise ValueError("Event loop blocked")
+
+        async def release():
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            released.set()
+
+        async def main():
+            k = Kerdezo(failBehaviour="continue")
+            k.addQuestion("Name", validators=[waiting])
+            task = asyncio.ensure_future(release())
+            res = await k.askAsync(
+                inputFn=self.answerMachine(["john"]),
+                outputFn=lambda msg: None
+            )
+            await task
+            return res
+
+        self.assertEqual(asyncio.run(main()), {"Name": "john"})
+
+    def test_async_stop(self):
+        failures = []
+
+        def failHandler(err, context):
+            failures.append(err)
+
+        k = Kerdezo(failBehaviour="stop", failHandler=failHandler)
+        k.addQuestion("Age", type=int)
+
+        asyncio.run(k.askAsync(inputFn=self.answerMachine(["x"])))
+
+        self.assertIsInstance(failures[0], InteractiveError)
+
+    def test_async_interrupt(self):
+        aborted = []
+
+        async def _input(prompt):
+            raise KeyboardInterrupt()
+
+        async def abortHandler(context):
+            aborted.append(True)
+
+        k = Kerdezo(abortHandler=abortHandler)
+        k.addQuestion("Never answered")
+
+        asyncio.run(k.askAsync(inputFn=_input))
+
+        self.assertEqual(aborted, [True])
+
+    def test_async_sessions_share_loop(self):
+        async def main():
+            suites = []
+            for i in range(20):
+                k = Kerdezo()
+                k.addQuestion("Name", validators=[self.asyncValidator])
+                suites.append(k)
+            return await asyncio.gather(*[
+                k.askAsync(inputFn=self.answerMachine([f"user{i}"]))
+                for i, k in enumerate(suites)
+            ])
+
+        results = asyncio.run(main())
+
+        self.assertEqual(results[7], {"Name": "user7"})
+
+
+if __name__ == "__main__":
+    unittest.main()
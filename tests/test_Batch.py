@@ -0,0 +1,140 @@
+import unittest
+
+from kerdezo import (
+    Kerdezo,
+    BatchResult,
+    Choices,
+    InteractiveError
+)
+from kerdezo.validators import (
+    IntegerValidators,
+    StringValidators,
+    nonRaising
+)
+
+
+class BatchTests(unittest.TestCase):
+
+    @staticmethod
+    def suite(**kwargs):
+        k = Kerdezo(**kwargs)
+        k.addQuestion("Name", validators=[StringValidators.minimumLength(3)])
+        k.addQuestion("Age", type=int, default=18)
+        k.addQuestion("Color", choices=["red", "green"])
+        return k
+
+    def test_batch_no_questions(self):
+        k = Kerdezo()
+
+        with self.assertRaises(InteractiveError):
+            list(k.askBatch([{}]))
+
+    def test_batch_ok(self):
+        k = self.suite()
+
+        results = list(k.askBatch([
+            {"Name": "John", "Age": "42", "Color": "red"},
+            {"Name": "Jane", "Color": "green"}
+        ]))
+
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0], BatchResult)
+        self.assertTrue(results[0].ok)
+        self.assertEqual(
+            results[0].answers, {"Name": "John", "Age": 42, "Color": "red"}
+        )
+        self.assertEqual(results[1].answers["Age"], 18)
+
+    def test_batch_errors_collected(self):
+        k = self.suite()
+
+        result = next(k.askBatch([{"Name": "Jo", "Age": "x", "Color": "red"}]))
+
+        self.assertFalse(result.ok)
+        self.assertEqual(set(result.errors), {"Name", "Age"})
+        self.assertIsInstance(result.errors["Name"][0], ValueError)
+        self.assertEqual(result.answers, {"Color": "red"})
+
+    def test_batch_stop(self):
+        k = self.suite(failBehaviour="stop")
+
+        result = next(k.askBatch([{"Name": "Jo", "Age": "x", "Color": "red"}]))
+
+        self.assertEqual(list(result.errors), ["Name"])
+        self.assertEqual(result.answers, {})
+
+    def test_batch_lazy_and_state_restored(self):
+        k = self.suite()
+        consumed = []
+
+        def records():
+            for name in ["Alice", "Bob"]:
+                consumed.append(name)
+                yield {"Name": name, "Color": "red"}
+
+        gen = k.askBatch(records())
+        next(gen)
+        self.assertEqual(consumed, ["Alice"])
+        list(gen)
+
+        self.assertEqual(k._answers, {})
+        self.assertEqual(k._errors, {})
+
+    def test_batch_canonical_choice(self):
+        k = Kerdezo()
+        k.addQuestion("Color", choices=Choices(["Red"], caseFold=True))
+
+        result = next(k.askBatch([{"Color": "RED"}]))
+
+        self.assertEqual(result.answers, {"Color": "Red"})
+
+    def test_batch_run_without_raising(self):
+        raised = []
+
+        def legacy(value, question=None, context=None):
+            raised.append(value)
+            raise ValueError("Legacy")
+
+        k = self.suite(failBehaviour="continue")
+        k.addQuestion("Nick", validators=[legacy])
+        pipeline = k.getQuestion("Name").compile()
+
+        self.assertEqual(pipeline.run("John"), ("John", None))
+        value, error = pipeline.run("Jo")
+        self.assertEqual((value, str(error)), ("Jo", "Minimum length is 3"))
+        self.assertIsNone(error.__traceback__)
+
+        result = next(k.askBatch([{"Name": "Jo", "Color": "blue"}]))
+
+        self.assertEqual(set(result.errors), {"Name", "Color", "Nick"})
+        self.assertIsInstance(result.errors["Color"][0], InteractiveError)
+        self.assertEqual(raised, [""])
+
+    def test_batch_memoized(self):
+        calls = []
+
+        @nonRaising
+        def positive(value, question=None, context=None):
+            calls.append(value)
+            if value <= 0:
+                return ValueError("Must be positive")
+
+        k = Kerdezo(failBehaviour="continue")
+        k.addQuestion("A", type=int, validators=[positive], memoize=True)
+        k.addQuestion("B", type=int, memoize=True,
+                      validators=[IntegerValidators.greater(0)])
+
+        results = list(k.askBatch([{"A": "1", "B": "0"}] * 3))
+
+        self.assertEqual(calls, [1])
+        for dest in ("A", "B"):
+            info = k.getQuestion(dest).validators[0].cacheInfo()
+            self.assertEqual((info["hits"], info["misses"]), (2, 1))
+        self.assertEqual(
+            [str(result.errors["B"][0]) for result in results],
+            ["Must be greater than 0"] * 3
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
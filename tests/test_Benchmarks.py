@@ -0,0 +1,52 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from kerdezo.benchmarks import cases
+from kerdezo.benchmarks.__main__ import main
+
+
+class BenchmarkTests(unittest.TestCase):
+
+    def test_benchmark_run_all_cases(self):
+        results = cases.run(sizes=[3], repeat=1)
+
+        names = [r["name"] for r in results["results"]]
+        self.assertEqual(names, list(cases.CASES))
+        self.assertIn("Kerdezo.ask", names)
+        self.assertIn("IntegerValidators.lessEqual", names)
+        self.assertEqual(results["version"], cases.FORMAT_VERSION)
+
+        # Results are JSON serializable
+        json.dumps(results)
+
+    def test_benchmark_compare(self):
+        before = cases.run(["Kerdezo.addQuestion"], sizes=[2, 4], repeat=1)
+        after = cases.run(["Kerdezo.addQuestion"], sizes=[4], repeat=1)
+
+        res = cases.compare(before, after)
+
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res[0][:2], ("Kerdezo.addQuestion", 4))
+
+    def test_benchmark_cli(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            argv = ["--case", "StringValidators.equal", "--sizes", "1,2",
+                    "--repeat", "1", "--output", path]
+
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(main(argv), 0)
+
+            out = io.StringIO()
+            with redirect_stdout(out):
+                main(["--compare", path, path])
+
+            self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import io
+import unittest
+from unittest import mock
+
+from kerdezo import Choices, Kerdezo, Question, InteractiveError
+from kerdezo import completion
+from kerdezo.completion import Completer
+from kerdezo.providers import PrefixIndex
+
+
+class TTY(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class CompletionTests(unittest.TestCase):
+
+    def test_completion_prefix_index(self):
+        index = PrefixIndex(["pear", "peach", "apple", "pea", 7])
+
+        self.assertEqual(index.find("pea"), ["pea", "peach", "pear"])
+        self.assertEqual(index.find("pea", limit=2), ["pea", "peach"])
+        self.assertEqual(index.find("7"), [7])
+        self.assertEqual(index.find("x"), [])
+        self.assertEqual(len(index.find("")), 5)
+
+    def test_completion_choices_filter(self):
+        choices = Choices(["Hungary", "Austria", "Hong Kong"], caseFold=True)
+
+        self.assertEqual(choices.filter("h"), ["Hong Kong", "Hungary"])
+        self.assertEqual(choices.filter("hong k"), ["Hong Kong"])
+        self.assertEqual(choices.expand("hu"), "Hungary")
+        self.assertIsNone(choices.expand("h"))
+        self.assertIsNone(choices.expand(""))
+        self.assertEqual(choices.expand("x", "x"), "x")
+
+    def test_completion_prefix_match(self):
+        q = Question(
+            "Country", choices=["Hungary", "Austria", "Australia"],
+            prefixMatch=True
+        )
+
+        self.assertEqual(q.compile()("Hu"), "Hungary")
+        self.assertEqual(q.compile()("Austria"), "Austria")
+
+        with self.assertRaises(InteractiveError):
+            q.compile()("Aus")
+
+        q = Question("Country", choices=["Hungary", "Austria"])
+
+        with self.assertRaises(InteractiveError):
+            q.compile()("Hu")
+
+    def test_completion_completer(self):
+        completer = Completer(limit=2)
+
+        self.assertIsNone(completer.complete("a", 0))
+
+        completer.choices = Choices(["ab", "ac", "ad", "b"])
+
+        self.assertEqual(completer.complete("a", 0), "ab")
+        self.assertEqual(completer.complete("a", 1), "ac")
+        self.assertIsNone(completer.complete("a", 2))
+
+    def test_completion_available(self):
+        self.assertFalse(completion.available(input, io.StringIO()))
+        self.assertFalse(completion.available(lambda p: "", TTY()))
+
+        if completion.readline is not None:
+            self.assertTrue(completion.available(input, TTY()))
+
+    @unittest.skipIf(completion.readline is None, "readline not available")
+    def test_completion_install(self):
+        readline = completion.readline
+        previous = readline.get_completer()
+
+        with Completer() as completer:
+            self.assertEqual(readline.get_completer(), completer.complete)
+            self.assertEqual(readline.get_completer_delims(), "")
+
+        self.assertEqual(readline.get_completer(), previous)
+
+    def test_completion_ask(self):
+        k = Kerdezo()
+        k.addQuestion("Fruit", choices=["apple", "pear"])
+        k.addQuestion("PIN", echo=False)
+        seen = []
+
+        def _input(prompt):
+            seen.append(completer.choices)
+            return "apple"
+
+        completer = Completer()
+        completer.install = mock.Mock(return_value=completer)
+        completer.uninstall = mock.Mock()
+
+        with mock.patch.object(completion, "available", return_value=True), \
+                mock.patch.object(completion, "Completer",
+                                  return_value=completer):
+            k.ask(inputFn=_input, silentInputFn=_input, outfile=io.StringIO())
+
+        self.assertEqual(seen, [k.getQuestion("Fruit").choices, None])
+        completer.install.assert_called_once()
+        completer.uninstall.assert_called_once()
+
+    def test_completion_large_choices(self):
+        # Timed by the "Choices.filter" benchmark case
+        choices = Choices([f"item-{i:06}" for i in range(100000)])
+
+        self.assertEqual(
+            choices.filter("item-0123", limit=3),
+            ["item-012300", "item-012301", "item-012302"]
+        )
+        self.assertEqual(len(choices.filter("item-0999", limit=100)), 100)
+        self.assertEqual(choices.filter("other"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+from datetime import date, datetime
+from decimal import Decimal
+import enum
+import unittest
+
+from kerdezo import Kerdezo, Question
+from kerdezo.converters import (
+    Converters,
+    defaults,
+    toBool,
+    toDecimal,
+    toFloat,
+    toInt
+)
+
+
+class Color(enum.Enum):
+    RED = "r"
+    GREEN = "g"
+
+
+class Size(enum.IntEnum):
+    SMALL = 1
+    LARGE = 2
+
+
+class ConverterTests(unittest.TestCase):
+
+    def test_converter_int(self):
+        point = Converters(decimalPoint=".")
+        comma = Converters(decimalPoint=",")
+
+        for raw in ("1000", " 1000 ", "1 000", "1,000", "1'000", "1 000"):
+            self.assertEqual(point.convert(int, raw), 1000)
+        for raw in ("1000", "1 000", "1.000", "1'000"):
+            self.assertEqual(comma.convert(int, raw), 1000)
+
+        self.assertEqual(point.convert(int, "-1,234,567"), -1234567)
+        for raw in ("", "x", "1.5", "1,00", "1,000.000", "1.000"):
+            with self.assertRaises(ValueError):
+                point.convert(int, raw)
+        with self.assertRaises(ValueError):
+            comma.convert(int, "1,000")
+
+    def test_converter_float_decimal(self):
+        cases = {
+            ",": {
+                "3,14": "3.14", "1 000,5": "1000.5", "1.000,5": "1000.5",
+                "1,5e3": "1500", "1.000": "1000", "1,000": "1"
+            },
+            ".": {
+                "3.14": "3.14", "1 000.5": "1000.5", "1,000.5": "1000.5",
+                "1.5e3": "1500", "1.000": "1", "1,000": "1000"
+            }
+        }
+        for point, pointCases in cases.items():
+            converters = Converters(decimalPoint=point)
+            for raw, expected in pointCases.items():
+                self.assertEqual(
+                    converters.convert(float, raw), float(expected)
+                )
+                self.assertEqual(
+                    converters.convert(Decimal, raw), Decimal(expected)
+                )
+
+            for raw in ("", ".", ",", "x", "1,000,5", "1.2.3"):
+                with self.assertRaises(ValueError):
+                    converters.convert(float, raw)
+                with self.assertRaises(ValueError):
+                    converters.convert(Decimal, raw)
+
+    def test_converter_numbers_default(self):
+        # The syntax of the types themselves, thus ambiguous answers are
+        # read the same way by all of them
+        self.assertEqual(defaults.convert(float, "1.000"), 1.0)
+        self.assertEqual(defaults.convert(Decimal, "1.000"), Decimal("1"))
+        self.assertEqual(toInt(" 42 "), 42)
+        for raw in ("1.000", "1,000", "1 000"):
+            with self.assertRaises(ValueError):
+                defaults.convert(int, raw)
+        for raw in ("1,000", "1 000", "3,14"):
+            with self.assertRaises(ValueError):
+                toFloat(raw)
+            with self.assertRaises(ValueError):
+                toDecimal(raw)
+
+    def test_converter_bool(self):
+        for raw in ("y", "Yes", " TRUE ", "on", "1"):
+            self.assertIs(toBool(raw), True)
+        for raw in ("n", "NO", "false", "off", "0"):
+            self.assertIs(toBool(raw), False)
+        with self.assertRaises(ValueError):
+            toBool("maybe")
+
+    def test_converter_iso_enum(self):
+        self.assertEqual(
+            defaults.convert(date, "2024-02-29"), date(2024, 2, 29)
+        )
+        self.assertEqual(
+            defaults.convert(datetime, "2024-02-29T12:30"),
+            datetime(2024, 2, 29, 12, 30)
+        )
+        self.assertIs(defaults.convert(Color, "green"), Color.GREEN)
+        self.assertIs(defaults.convert(Color, "R"), Color.RED)
+        self.assertIs(defaults.convert(Size, "2"), Size.LARGE)
+
+        with self.assertRaises(ValueError):
+            defaults.convert(date, "29/02/2024")
+        with self.assertRaises(ValueError):
+            defaults.convert(Color, "blue")
+
+    def test_converter_registry(self):
+        converters = Converters(builtins=False)
+
+        self.assertIs(converters.get(int), int)
+
+        converters.register(int, lambda raw: int(raw, 16))
+
+        self.assertEqual(converters.convert(int, "ff"), 255)
+        self.assertIs(Converters().get(str), str)
+
+    def test_converter_column(self):
+        values, errors = Converters(decimalPoint=".").convertColumn(
+            int, ["1", "x", "1 000"]
+        )
+
+        self.assertEqual(values, [1, None, 1000])
+        self.assertEqual(list(errors), [1])
+        self.assertEqual(defaults.convertColumn(bool, iter("yn")), (
+            [True, False], {}
+        ))
+
+    def test_converter_question(self):
+        q = Question("Licensed", type=bool)
+
+        self.assertIs(q.compile()("yes"), True)
+        with self.assertRaises(ValueError):
+            q.compile()("maybe")
+
+    def test_converter_suite(self):
+        converters = Converters().register(str, str.upper)
+        k = Kerdezo(converters=converters, failBehaviour="continue")
+        k.addQuestion("Name")
+        k.addQuestion("Color", type=Color)
+
+        result = next(k.askBatch([{"Name": "alice", "Color": "red"}]))
+
+        self.assertEqual(result.answers, {"Name": "ALICE", "Color": Color.RED})
+
+        # Registering a converter rebuilds the pipelines
+        converters.register(str, str.lower)
+        result = next(k.askBatch([{"Name": "Bob"}]))
+
+        self.assertEqual(result.answers["Name"], "bob")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+import io
+import unittest
+
+from kerdezo import Kerdezo, Question
+from kerdezo.dependencies import Computed, Constraint, computed, constraint
+
+
+@computed("Protocol")
+def portByProtocol(protocol):
+    return 443 if protocol == "https" else 80
+
+
+@constraint("Password")
+def matchesPassword(value, password):
+    if value != password:
+        raise ValueError("Passwords do not match")
+
+
+class DependencyTests(unittest.TestCase):
+
+    @staticmethod
+    def answerMachine(answers):
+        answers = iter(answers)
+
+        def _input(prompt):
+            return next(answers)
+
+        return _input
+
+    @staticmethod
+    def suite():
+        k = Kerdezo(failBehaviour="continue")
+        k.addQuestion("Protocol", choices=["http", "https"])
+        k.addQuestion("Port", type=int, default=portByProtocol)
+        k.addQuestion(
+            "Path",
+            choices=Computed(
+                lambda protocol: ["/", "/secure"] if protocol == "https"
+                else ["/"],
+                "Protocol"
+            )
+        )
+        return k
+
+    def test_dependency_decorators(self):
+        self.assertIsInstance(portByProtocol, Computed)
+        self.assertEqual(portByProtocol.sources, ("Protocol",))
+        self.assertEqual(portByProtocol({"Protocol": "https"}), 443)
+        self.assertEqual(portByProtocol({}), 80)
+
+        self.assertIsInstance(matchesPassword, Constraint)
+        self.assertTrue(matchesPassword.contextual)
+        self.assertEqual(matchesPassword.__name__, "matchesPassword")
+
+    def test_dependency_question(self):
+        q = Question("Port", type=int, default=portByProtocol)
+
+        self.assertEqual(q.sources(), ("Protocol",))
+        self.assertEqual(Question("Plain").sources(), ())
+        self.assertIsNone(q.compile().validate)
+
+        bound = q.bind({"Protocol": "https"})
+
+        self.assertIsNot(bound, q)
+        self.assertEqual(bound.default, 443)
+        self.assertIs(q.default, portByProtocol)
+        self.assertEqual(str(bound), "Port [443]")
+
+        plain = Question("Plain")
+        self.assertIs(plain.bind({}), plain)
+
+    def test_dependency_bind_checks(self):
+        q = Question(
+            "Port",
+            type=int,
+            default=Computed(lambda p: "x", "Protocol")
+        )
+
+        with self.assertRaises(ValueError):
+            q.bind({})
+
+        q = Question(
+            "Path",
+            default=Computed(lambda p: "/x", "Protocol"),
+            choices=["/"]
+        )
+
+        with self.assertRaises(ValueError):
+            q.bind({})
+
+    def test_dependency_index(self):
+        k = self.suite()
+        registry = k._questions
+
+        self.assertEqual(
+            [q.dest for q in registry.dependents("Protocol")],
+            ["Port", "Path"]
+        )
+        self.assertEqual(registry.dependents("Port"), ())
+
+        k.removeQuestion("Path")
+
+        self.assertEqual(
+            [q.dest for q in registry.dependents("Protocol")], ["Port"]
+        )
+
+    def test_dependency_ask(self):
+        k = self.suite()
+
+        answers = k.ask(
+            inputFn=self.answerMachine(["https", "", "/secure"]),
+            outfile=io.StringIO()
+        )
+
+        self.assertEqual(
+            answers, {"Protocol": "https", "Port": 443, "Path": "/secure"}
+        )
+
+        # Computed values are held by the session, not the suite
+        self.assertIs(k.getQuestion("Port").default, portByProtocol)
+
+    def test_dependency_batch(self):
+        suite = self.suite().freeze()
+
+        results = list(suite.askBatch([
+            {"Protocol": "http", "Path": "/secure"},
+            {"Protocol": "https", "Path": "/secure"}
+        ]))
+
+        self.assertEqual(results[0].answers, {"Protocol": "http", "Port": 80})
+        self.assertIn("Path", results[0].errors)
+        self.assertTrue(results[1].ok)
+        self.assertEqual(results[1].answers["Port"], 443)
+
+    def test_dependency_bind_failure(self):
+        k = Kerdezo(failBehaviour="continue")
+        k.addQuestion("Protocol", choices=["http", "https"])
+        k.addQuestion(
+            "Path",
+            default=Computed(
+                lambda protocol: "/x" if protocol == "https" else "/",
+                "Protocol"
+            ),
+            choices=["/"]
+        )
+        k.addQuestion("Host")
+
+        results = list(k.askBatch([
+            {"Protocol": "https", "Host": "a"},
+            {"Protocol": "http", "Host": "b"}
+        ]))
+
+        self.assertEqual(
+            results[0].answers, {"Protocol": "https", "Host": "a"}
+        )
+        self.assertIsInstance(results[0].errors["Path"][0], ValueError)
+        self.assertTrue(results[1].ok)
+
+        answers = k.ask(
+            inputFn=self.answerMachine(["https", "a"]),
+            outfile=io.StringIO()
+        )
+
+        self.assertEqual(answers, {"Protocol": "https", "Host": "a"})
+        self.assertIsInstance(k.getErrors("Path")[0], ValueError)
+
+        k.failBehaviour = "stop"
+        result = next(k.askBatch([{"Protocol": "https", "Host": "a"}]))
+
+        self.assertEqual(result.answers, {"Protocol": "https"})
+        self.assertIn("Path", result.errors)
+
+    def test_dependency_recompute_affected(self):
+        calls = []
+
+        def port(protocol):
+            calls.append(protocol)
+            return 80
+
+        k = Kerdezo()
+        k.addQuestion("Protocol")
+        k.addQuestion("Host")
+        k.addQuestion("Port", type=int, default=Computed(port, "Protocol"))
+        session = k.session()
+
+        session.askRecord({"Protocol": "http", "Host": "example.com"})
+        self.assertEqual(calls, ["http"])
+
+        # Unrelated answers keep the computed value
+        question = k.getQuestion("Port")
+        session._answer(k.getQuestion("Host"), "example.org")
+        session._bind(question)
+        self.assertEqual(calls, ["http"])
+
+        session._answer(k.getQuestion("Protocol"), "https")
+        session._bind(question)
+        self.assertEqual(calls, ["http", "https"])
+
+    def test_dependency_constraint(self):
+        k = Kerdezo(failBehaviour="continue")
+        k.addQuestion("Password")
+        k.addQuestion("Repeat", validators=[matchesPassword])
+        session = k.session()
+
+        result = session.askRecord({"Password": "secret", "Repeat": "secret"})
+
+        self.assertTrue(result.ok)
+
+        # Changing the source checks the answered dependent again
+        session._answer(k.getQuestion("Password"), "other")
+
+        self.assertNotIn("Repeat", session._answers)
+        self.assertEqual(
+            str(session.getErrors("Repeat")[0]), "Passwords do not match"
+        )
+
+        result = k.session().askRecord({"Password": "a", "Repeat": "b"})
+
+        self.assertEqual(list(result.errors), ["Repeat"])
+
+
+if __name__ == "__main__":
+    unittest.main()
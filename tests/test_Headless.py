@@ -0,0 +1,244 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from kerdezo import Kerdezo
+from kerdezo.__main__ import main
+from kerdezo.headless import (
+    Answers,
+    LineReader,
+    envName,
+    loadAnswers,
+    loadSuite,
+    runBatch,
+    runSession
+)
+from kerdezo.serialization import dumps
+from kerdezo.validators import IntegerValidators
+
+
+def createSuite():
+    k = Kerdezo(failBehaviour="continue")
+    k.addQuestion("Name")
+    k.addQuestion(
+        "Age", type=int, validators=[IntegerValidators.greater(0)]
+    )
+    k.addQuestion("IP address", default="127.0.0.1")
+    return k
+
+
+class Stdin:
+    def __init__(self, data):
+        self.buffer = io.BytesIO(data)
+
+    def isatty(self):
+        return False
+
+
+class ChunkedStream(io.BytesIO):
+    def read1(self, size=-1):
+        return super().read1(min(size, 3))
+
+
+class HeadlessTests(unittest.TestCase):
+
+    def test_headless_env_name(self):
+        self.assertEqual(envName("IP address"), "KERDEZO_IP_ADDRESS")
+        self.assertEqual(envName("e-mail?", "X_"), "X_E_MAIL")
+
+    def test_headless_answers(self):
+        answers = Answers(
+            {"Name": "Alice", "Age": "3"},
+            environ={"KERDEZO_AGE": "4", "OTHER_NAME": "Bob"}
+        )
+
+        self.assertEqual(answers.get("Name"), "Alice")
+        self.assertEqual(answers.get("Age"), "4")
+        self.assertIsNone(answers.get("Missing"))
+
+        answers.prefix = None
+
+        self.assertEqual(answers.get("Age"), "3")
+
+    def test_headless_line_reader(self):
+        prompts = io.StringIO()
+        reader = LineReader(
+            ChunkedStream("first\r\nsecond\n\nárvíz".encode("utf8")),
+            prompts=prompts
+        )
+
+        self.assertEqual(
+            [reader("> ") for i in range(4)], ["first", "second", "", "árvíz"]
+        )
+        self.assertEqual(prompts.getvalue(), "> " * 4)
+
+        with self.assertRaises(EOFError):
+            reader()
+
+    def test_headless_load_answers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {
+                "a.json": '{"Name": "Alice"}',
+                "b.jsonl": '{"Name": "A"}\n\n{"Name": "B"}\n',
+                "c.txt": "# comment\nName = Alice\n\nIP address=::1\n",
+                "d.txt": "Name\n",
+                "e.json": "[1]"
+            }
+            for name, content in files.items():
+                with open(os.path.join(tmp, name), "w") as fp:
+                    fp.write(content)
+
+            def load(name):
+                return loadAnswers(os.path.join(tmp, name))
+
+            self.assertEqual(load("a.json"), [{"Name": "Alice"}])
+            self.assertEqual(load("b.jsonl"), [{"Name": "A"}, {"Name": "B"}])
+            self.assertEqual(
+                load("c.txt"), [{"Name": "Alice", "IP address": "::1"}]
+            )
+            with self.assertRaises(ValueError):
+                load("d.txt")
+            with self.assertRaises(ValueError):
+                load("e.json")
+
+    def test_headless_load_suite(self):
+        suite = loadSuite(f"{__name__}:createSuite")
+
+        self.assertIsInstance(suite, Kerdezo)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "suite.json")
+            with open(path, "w") as fp:
+                fp.write(dumps(suite))
+
+            self.assertEqual(len(loadSuite(path)._questions), 3)
+
+        with self.assertRaises(ValueError):
+            loadSuite("os:sep")
+
+    def test_headless_run_session(self):
+        reads = []
+
+        def _input(prompt):
+            reads.append(prompt)
+            return "7"
+
+        result = runSession(
+            createSuite(),
+            answers=Answers({"Name": "Alice"}, environ={}),
+            inputFn=_input,
+            outfile=io.StringIO()
+        )
+
+        # Only the questions without prefilled answers are prompted
+        self.assertEqual(reads, ["Age: ", "IP address [127.0.0.1]: "])
+        self.assertEqual(result, {
+            "answers": {"Name": "Alice", "Age": 7, "IP address": "7"},
+            "errors": {},
+            "complete": True
+        })
+
+    def test_headless_prefilled_retry(self):
+        k = createSuite()
+        k.failBehaviour = "retry"
+        answers = iter(["5", ""])
+
+        result = k.ask(
+            answers={"Name": "Alice", "Age": "-1"},
+            inputFn=lambda prompt: next(answers),
+            outfile=io.StringIO()
+        )
+
+        self.assertEqual(
+            result, {"Name": "Alice", "Age": 5, "IP address": "127.0.0.1"}
+        )
+
+    def test_headless_eof_aborts(self):
+        k = createSuite()
+        k.failBehaviour = "retry"
+        aborted = []
+        k.abortHandler = aborted.append
+
+        def _input(prompt):
+            raise EOFError()
+
+        self.assertIsNone(k.ask(inputFn=_input, outfile=io.StringIO()))
+        self.assertEqual(len(aborted), 1)
+
+    def test_headless_run_batch(self):
+        results = list(runBatch(
+            createSuite(),
+            [{"Name": "A", "Age": "1"}, {"Age": "0"}],
+            environ={"KERDEZO_NAME": "Env"}
+        ))
+
+        self.assertEqual(results[0]["answers"]["Name"], "Env")
+        self.assertEqual(list(results[1]["errors"]), ["Age"])
+
+    def test_headless_run_batch_no_dest(self):
+        k = createSuite()
+        k.addQuestion("Note", dest=None, default="none")
+
+        results = list(runBatch(
+            k, [{"Name": "A", "Age": "1"}], environ={"KERDEZO_NAME": "Env"}
+        ))
+
+        self.assertEqual(
+            results[0]["answers"],
+            {"Name": "Env", "Age": 1, "IP address": "127.0.0.1"}
+        )
+        self.assertIsNone(Answers({None: "x"}, environ={}).get(None))
+
+    def test_headless_main(self):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        code = main(
+            [f"{__name__}:createSuite", "--no-env"],
+            stdin=Stdin(b"Alice\n42\n\n"),
+            stdout=stdout,
+            stderr=stderr
+        )
+
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(stdout.getvalue())["answers"], {
+            "Name": "Alice", "Age": 42, "IP address": "127.0.0.1"
+        })
+        self.assertEqual(stderr.getvalue(), "")
+
+        stdout = io.StringIO()
+        code = main(
+            [f"{__name__}:createSuite", "--no-env"],
+            stdin=Stdin(b"Alice\n"),
+            stdout=stdout,
+            stderr=io.StringIO()
+        )
+
+        self.assertEqual(code, 1)
+        self.assertFalse(json.loads(stdout.getvalue())["complete"])
+
+    def test_headless_main_batch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "answers.jsonl")
+            with open(path, "w") as fp:
+                fp.write('{"Name": "A", "Age": "1"}\n{"Age": "x"}\n')
+
+            stdout = io.StringIO()
+            code = main(
+                [f"{__name__}:createSuite", "--answers", path, "--no-env"],
+                stdin=Stdin(b""),
+                stdout=stdout
+            )
+
+        lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+        self.assertEqual(code, 1)
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0]["complete"])
+        self.assertIn("Age", lines[1]["errors"])
+
+
+if __name__ == "__main__":
+    unittest.main()
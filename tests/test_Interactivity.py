@@ -112,6 +112,29 @@ class InteractiveTests(unittest.TestCase):
 
         k.ask(inputFn=self.answerMachineAborting())
 
+    def test_interactive_prompt_dynamic_default(self):
+        prompts = []
+
+        def _input(prompt):
+            prompts.append(prompt)
+            return "https" if len(prompts) == 1 else ""
+
+        def setPort(value, question, context):
+            context.getQuestion("Port").default = 443
+
+        k = Kerdezo()
+        k.addQuestion("Protocol", choices=["http", "https"],
+                      validators=[setPort])
+        k.addQuestion("Port", type=int, default=80)
+
+        str(k.getQuestion("Port"))
+
+        with open(os.devnull, "w") as devnull:
+            k.ask(inputFn=_input, outfile=devnull)
+
+        self.assertEqual(prompts[1], "Port [443]: ")
+        self.assertEqual(k.getAnswer("Port"), 443)
+
 
 if __name__ == "__main__":
     unittest.main()
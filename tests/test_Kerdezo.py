@@ -82,6 +82,61 @@ class KerdezoTests(unittest.TestCase):
         with self.assertRaises(TypeError):
             k.getQuestion(3.14)
 
+    def test_kerdezo_add_questions_ok(self):
+        k = Kerdezo()
+        q = Question("Second", dest="two")
+
+        k.addQuestions(["First", q, Question("Third")])
+
+        self.assertEqual(
+            [x.dest for x in k._questions], ["First", "two", "Third"]
+        )
+        self.assertIs(k.getQuestion("two"), q)
+
+    def test_kerdezo_add_questions_atomic(self):
+        k = Kerdezo()
+        k.addQuestion("Existing", dest="one")
+
+        with self.assertRaises(InteractiveError):
+            k.addQuestions([Question("Fresh"), Question("Dup", dest="one")])
+
+        with self.assertRaises(InteractiveError):
+            k.addQuestions([Question("A", dest="x"), Question("B", dest="x")])
+
+        with self.assertRaises(InteractiveError):
+            k.addQuestions([Question("Fine"), Question("Bad", default="?")])
+
+        self.assertEqual(len(k._questions), 1)
+
+        with self.assertRaises(TypeError):
+            k.addQuestions([Question("Fine"), 42])
+
+    def test_kerdezo_getQuestion_foreign_instance(self):
+        k = Kerdezo()
+        k.addQuestion("Same title")
+
+        with self.assertRaises(ValueError):
+            k.getQuestion(Question("Same title"))
+
+    def test_kerdezo_removeQuestion(self):
+        k = Kerdezo()
+        q = Question("Removable")
+
+        k.addQuestion(q).addQuestion("Kept")
+        k.removeQuestion(q)
+
+        with self.assertRaises(ValueError):
+            k.getQuestion("Removable")
+
+        k.removeQuestion("Kept")
+        self.assertEqual(len(k._questions), 0)
+
+        with self.assertRaises(ValueError):
+            k.removeQuestion(q)
+
+        # 'dest' is free again
+        k.addQuestion("Removable")
+
 
 if __name__ == "__main__":
     unittest.main()
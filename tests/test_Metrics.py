@@ -0,0 +1,176 @@
+import asyncio
+import os
+import time
+import unittest
+
+from kerdezo import Kerdezo
+from kerdezo.metrics import Histogram, Metrics, validatorName
+from kerdezo.validators import (
+    IntegerValidators,
+    ValidationTimeout,
+    independent
+)
+
+
+def isEven(value, question, context):
+    if value % 2:
+        raise ValueError("Must be even")
+
+
+@independent
+def isKnown(value, question, context):
+    pass
+
+
+@independent(timeout=0.05)
+def isSlow(value, question, context):
+    time.sleep(1)
+
+
+class MetricsTests(unittest.TestCase):
+
+    @staticmethod
+    def answerMachine(answers):
+        answers = iter(answers)
+
+        def _input(prompt):
+            return next(answers)
+
+        return _input
+
+    @staticmethod
+    def suite(metrics):
+        k = Kerdezo(metrics=metrics)
+        k.addQuestion(
+            "Number",
+            dest="number",
+            type=int,
+            validators=[IntegerValidators.greater(0), isEven]
+        )
+        return k
+
+    def test_histogram(self):
+        h = Histogram(buckets=(1.0, 2.0))
+
+        for value in [0.5, 1.5, 1.5, 3]:
+            h.observe(value)
+
+        self.assertEqual(h.count, 4)
+        self.assertEqual(h.sum, 6.5)
+        self.assertEqual(
+            h.cumulative(), [(1.0, 1), (2.0, 3), (float("inf"), 4)]
+        )
+        self.assertEqual(h.quantile(0.5), 2.0)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+    def test_validator_name(self):
+        self.assertEqual(
+            validatorName(IntegerValidators.greater(0)),
+            "IntegerValidators.greater"
+        )
+        self.assertEqual(validatorName(isEven), "isEven")
+
+    def test_metrics_ask(self):
+        metrics = Metrics()
+        k = self.suite(metrics)
+
+        with open(os.devnull, "w") as devnull:
+            k.ask(
+                inputFn=self.answerMachine(["?", "x", "3", "4"]),
+                outfile=devnull
+            )
+
+        self.assertEqual(metrics.counter("number", "help_total"), 1)
+        self.assertEqual(metrics.counter("number", "retries_total"), 2)
+        self.assertEqual(metrics.counter("number", "failures_total"), 2)
+        self.assertEqual(
+            metrics.histogram("number", "input_seconds").count, 4
+        )
+        self.assertEqual(
+            metrics.histogram("number", "conversion_seconds").count, 3
+        )
+        self.assertEqual(metrics.histogram(
+            "number", "validator_seconds", "IntegerValidators.greater"
+        ).count, 2)
+        self.assertEqual(
+            metrics.histogram("number", "validator_seconds", "isEven").count,
+            2
+        )
+
+    def test_metrics_groups(self):
+        metrics = Metrics()
+        k = Kerdezo(metrics=metrics, failBehaviour="continue")
+        k.addQuestion(
+            "Number",
+            dest="number",
+            type=int,
+            validators=[
+                IntegerValidators.greaterEqual(0),
+                IntegerValidators.lessEqual(10),
+                isKnown,
+                isSlow
+            ]
+        )
+
+        result = next(k.askBatch([{"number": "4"}]))
+
+        self.assertIsInstance(result.errors["number"][0], ValidationTimeout)
+        self.assertEqual(metrics.histogram(
+            "number", "validator_seconds",
+            "IntegerValidators.greaterEqual+IntegerValidators.lessEqual"
+        ).count, 1)
+        self.assertEqual(metrics.histogram(
+            "number", "validator_seconds", "isKnown+isSlow"
+        ).count, 1)
+
+    def test_metrics_async(self):
+        metrics = Metrics()
+        k = self.suite(metrics)
+
+        async def _input(prompt):
+            return next(answers)
+
+        answers = iter(["?", "3", "4"])
+        asyncio.run(k.askAsync(inputFn=_input, outputFn=lambda msg: None))
+
+        self.assertEqual(metrics.counter("number", "help_total"), 1)
+        self.assertEqual(metrics.counter("number", "retries_total"), 1)
+        self.assertEqual(
+            metrics.histogram("number", "input_seconds").count, 3
+        )
+        self.assertEqual(metrics.histogram(
+            "number", "validator_seconds", "IntegerValidators.greater"
+        ).count, 2)
+
+    def test_metrics_disabled(self):
+        k = self.suite(None)
+
+        self.assertIsNone(k.metrics)
+        self.assertEqual(k.session().askRecord({"number": "2"}).answers,
+                         {"number": 2})
+
+    def test_metrics_prometheus(self):
+        metrics = Metrics(buckets=(0.1,))
+        metrics.observe("a\"b", "input_seconds", 0.05)
+        metrics.increment("a\"b", "help_total")
+        metrics.increment("a\"b", "help_total")
+
+        text = metrics.toPrometheus()
+
+        self.assertEqual(text.splitlines(), [
+            "# TYPE kerdezo_input_seconds histogram",
+            'kerdezo_input_seconds_bucket{dest="a\\"b",le="0.1"} 1',
+            'kerdezo_input_seconds_bucket{dest="a\\"b",le="+Inf"} 1',
+            'kerdezo_input_seconds_sum{dest="a\\"b"} 0.05',
+            'kerdezo_input_seconds_count{dest="a\\"b"} 1',
+            "# TYPE kerdezo_help_total counter",
+            'kerdezo_help_total{dest="a\\"b"} 2'
+        ])
+
+        metrics.reset()
+
+        self.assertEqual(metrics.toPrometheus(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
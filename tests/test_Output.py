@@ -0,0 +1,115 @@
+import asyncio
+import io
+import unittest
+
+from kerdezo import Kerdezo
+from kerdezo.output import Output
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class OutputTests(unittest.TestCase):
+
+    @staticmethod
+    def suite():
+        k = Kerdezo(startMessage="Hello", endMessage="Bye")
+        k.addQuestion("Name", help="Your name")
+        k.addQuestion("Age", type=int)
+        return k
+
+    def test_output_buffer(self):
+        stream = CountingStream()
+        output = Output(stream)
+
+        output.print("first")
+        output.write("second")
+        output.print("")
+
+        self.assertEqual(stream.getvalue(), "")
+
+        output.flush()
+        output.flush()
+
+        self.assertEqual(stream.getvalue(), "first\nsecond\n")
+        self.assertEqual((stream.writes, stream.flushes), (1, 1))
+
+    def test_output_binary(self):
+        stream = io.BytesIO()
+
+        with Output(stream) as output:
+            self.assertTrue(output.binary)
+            output.print("árvíztűrő")
+
+        self.assertEqual(stream.getvalue(), "árvíztűrő\n".encode("utf-8"))
+
+        stream = io.BytesIO()
+
+        with Output(stream, encoding="latin-1", errors="replace") as output:
+            output.print("ő é")
+
+        self.assertEqual(stream.getvalue(), "? é\n".encode("latin-1"))
+        self.assertFalse(Output(io.StringIO()).binary)
+
+    def test_output_ask_batched(self):
+        stream = CountingStream()
+        log = []
+        answers = iter(["?", "Alice", "42"])
+
+        def _input(prompt):
+            log.append((prompt, stream.getvalue()))
+            return next(answers)
+
+        self.suite().ask(inputFn=_input, outfile=stream)
+
+        # Pending messages are written before the prompt
+        self.assertEqual(log, [
+            ("Name: ", "Hello\n"),
+            ("Name: ", "Hello\nYour name\n"),
+            ("Age: ", "Hello\nYour name\n")
+        ])
+        self.assertEqual(stream.getvalue(), "Hello\nYour name\nBye\n")
+        self.assertEqual((stream.writes, stream.flushes), (3, 3))
+
+    def test_output_ask_binary(self):
+        stream = io.BytesIO()
+        answers = iter(["Ödön", "42"])
+
+        self.suite().ask(
+            inputFn=lambda prompt: next(answers),
+            outfile=stream,
+            encoding="utf-16"
+        )
+
+        self.assertEqual(
+            stream.getvalue().decode("utf-16"), "Hello\nBye\n"
+        )
+
+    def test_output_ask_async(self):
+        stream = CountingStream()
+        answers = iter(["?", "Alice", "42"])
+
+        async def _input(prompt):
+            return next(answers)
+
+        output = Output(stream)
+        asyncio.run(self.suite().askAsync(inputFn=_input, output=output))
+
+        self.assertEqual(stream.getvalue(), "Hello\nYour name\nBye\n")
+        self.assertEqual(stream.writes, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
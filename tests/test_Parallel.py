@@ -0,0 +1,135 @@
+import multiprocessing
+import pickle
+import unittest
+
+from kerdezo import InteractiveError, Kerdezo
+from kerdezo.converters import Converters
+from kerdezo.dependencies import computed
+from kerdezo.validators import (
+    IntegerValidators,
+    StringValidators,
+    ValidationErrors
+)
+
+
+def even(value, question=None, context=None):
+    if value % 2:
+        raise ValueError("Odd number")
+
+
+@computed("Name")
+def greeting(name):
+    return f"Hello {name}"
+
+
+def createSuite():
+    k = Kerdezo(failBehaviour="continue")
+    k.addQuestion("Name", validators=[StringValidators.minimumLength(2)])
+    k.addQuestion(
+        "Age", type=int, validators=[IntegerValidators.greater(0), even]
+    )
+    return k
+
+
+class ParallelTests(unittest.TestCase):
+
+    records = [{"Name": "A" * (i % 3 + 1), "Age": str(i)} for i in range(50)]
+
+    def assertResults(self, results, records):
+        self.assertEqual(len(results), len(records))
+        for result, record in zip(results, records):
+            expected = next(createSuite().askBatch([record]))
+            self.assertEqual(result.answers, expected.answers)
+            self.assertEqual(
+                {dest: [str(err) for err in errs]
+                 for dest, errs in result.errors.items()},
+                {dest: [str(err) for err in errs]
+                 for dest, errs in expected.errors.items()}
+            )
+
+    def test_parallel_ordered(self):
+        results = list(
+            createSuite().askBatch(self.records, workers=2, chunkSize=7)
+        )
+
+        self.assertResults(results, self.records)
+        self.assertIsInstance(results[1].errors["Age"][0], ValueError)
+
+    def test_parallel_unordered(self):
+        results = list(createSuite().askBatch(
+            iter(self.records), workers=3, chunkSize=4, ordered=False
+        ))
+
+        self.assertEqual(
+            sorted(result.answers.get("Age") for result in results
+                   if "Age" in result.answers),
+            [i for i in range(50) if i > 0 and i % 2 == 0]
+        )
+        self.assertEqual(len(results), 50)
+
+    def test_parallel_closure_suite(self):
+        k = createSuite()
+        k.addQuestion("Code", validators=[lambda value, question=None, context=None: None])
+
+        if multiprocessing.get_start_method() != "fork":
+            with self.assertRaises(ValueError):
+                list(k.askBatch(self.records, workers=2))
+            return
+
+        results = list(k.askBatch(self.records[:5], workers=2, chunkSize=2))
+
+        self.assertEqual([r.answers["Code"] for r in results], [""] * 5)
+
+    def test_parallel_converters(self):
+        converters = Converters(decimalPoint=",").register(str, str.upper)
+        k = Kerdezo(failBehaviour="continue", converters=converters)
+        k.addQuestion("Name")
+        k.addQuestion("Age", type=int)
+        records = [{"Name": "ann", "Age": "1.000"}, {"Name": "bob"}]
+
+        results = list(k.askBatch(records, workers=2, chunkSize=1))
+
+        self.assertEqual(
+            [result.answers for result in results],
+            [{"Name": "ANN", "Age": 1000}, {"Name": "BOB"}]
+        )
+        self.assertEqual(
+            [result.answers for result in results],
+            [result.answers for result in k.askBatch(records)]
+        )
+
+    def test_parallel_not_json(self):
+        k = createSuite()
+        k.addQuestion("Greeting", default=greeting)
+        k.addQuestion("Code", skip=lambda context: False)
+
+        if multiprocessing.get_start_method() != "fork":
+            with self.assertRaises(ValueError):
+                list(k.askBatch(self.records, workers=2))
+            return
+
+        results = list(k.askBatch(self.records[:5], workers=2, chunkSize=2))
+
+        self.assertEqual(
+            [result.answers for result in results],
+            [result.answers for result in k.askBatch(self.records[:5])]
+        )
+        self.assertEqual(results[1].answers["Greeting"], "Hello AA")
+
+    def test_parallel_empty(self):
+        with self.assertRaises(InteractiveError):
+            list(Kerdezo().askBatch([{}], workers=2))
+
+        self.assertEqual(list(createSuite().askBatch([], workers=2)), [])
+
+    def test_parallel_validation_errors_pickle(self):
+        err = pickle.loads(
+            pickle.dumps(ValidationErrors([ValueError("a"), ValueError("b")]))
+        )
+
+        self.assertEqual(str(err), "a; b")
+        self.assertEqual([str(e) for e in err.errors], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from kerdezo import Choices, Kerdezo, Question, InteractiveError
+from kerdezo.providers import ChoiceProvider, PagedChoices
+from kerdezo.serialization import dumps
+
+
+class Catalog:
+    def __init__(self, size):
+        self.items = [f"item-{i:06}" for i in range(size)]
+        self.fetches = []
+        self.lookups = []
+
+    def fetch(self, offset, limit):
+        self.fetches.append(offset)
+        return self.items[offset:offset + limit]
+
+    def lookup(self, value):
+        self.lookups.append(value)
+        return value if value in self.items else None
+
+
+class ProviderTests(unittest.TestCase):
+
+    def test_provider_base(self):
+        provider = ChoiceProvider()
+
+        with self.assertRaises(NotImplementedError):
+            provider.get("x")
+        with self.assertRaises(NotImplementedError):
+            provider.page(0, 1)
+        self.assertTrue(provider)
+
+    def test_provider_window(self):
+        choices = Choices(range(25))
+
+        self.assertEqual(choices.window(3), "0, 1, 2, ... (22 more)")
+        self.assertEqual(Choices(range(3)).window(3), "0, 1, 2")
+        self.assertEqual(
+            str(choices), "0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ... (15 more)"
+        )
+        self.assertEqual(choices.page(23, 5), [23, 24])
+        self.assertEqual(
+            Choices(["ab", "b", "ac"]).filter("a"), ["ab", "ac"]
+        )
+        self.assertFalse(Choices())
+
+    def test_provider_paged(self):
+        catalog = Catalog(1000)
+        choices = PagedChoices(catalog.fetch, count=lambda: 1000,
+                               pageSize=100)
+
+        self.assertEqual(
+            choices.page(95, 10), catalog.items[95:105]
+        )
+        self.assertEqual(catalog.fetches, [0, 100])
+        self.assertEqual(len(choices), 1000)
+        self.assertEqual(choices.window(2),
+                         "item-000000, item-000001, ... (998 more)")
+        self.assertEqual(catalog.fetches, [0, 100])
+
+        # Membership scans the pages lazily, until found
+        self.assertIn("item-000250", choices)
+        self.assertEqual(catalog.fetches, [0, 100, 200])
+        self.assertNotIn(["unhashable"], choices)
+        self.assertEqual(list(choices), catalog.items)
+        self.assertEqual(
+            choices.filter("item-0009", limit=3), catalog.items[900:903]
+        )
+
+    def test_provider_paged_lookup(self):
+        catalog = Catalog(1000)
+        choices = PagedChoices(catalog.fetch, count=1000,
+                               lookup=catalog.lookup, maxLookups=2)
+
+        self.assertEqual(choices.get("item-000999"), "item-000999")
+        self.assertIsNone(choices.get("missing"))
+        self.assertEqual(choices.get("item-000999"), "item-000999")
+        self.assertEqual(catalog.lookups, ["item-000999", "missing"])
+        self.assertEqual(catalog.fetches, [])
+
+        choices.get("a")
+        choices.get("b")
+        choices.get("item-000999")
+
+        self.assertEqual(catalog.lookups[-1], "item-000999")
+
+    def test_provider_paged_cache(self):
+        catalog = Catalog(500)
+        choices = PagedChoices(catalog.fetch, count=500, pageSize=100,
+                               maxPages=2)
+
+        for offset in (0, 100, 200, 0):
+            choices.page(offset, 1)
+
+        self.assertEqual(catalog.fetches, [0, 100, 200, 0])
+
+        choices.clear()
+        choices.page(0, 1)
+
+        self.assertEqual(catalog.fetches[-1], 0)
+
+    def test_provider_question(self):
+        catalog = Catalog(100000)
+        choices = PagedChoices(catalog.fetch, count=100000,
+                               lookup=catalog.lookup)
+        q = Question("Item", choices=choices, default="item-000000")
+
+        self.assertIs(q.choices, choices)
+        self.assertTrue(str(q).endswith("... (99990 more)} [item-000000]"))
+
+        k = Kerdezo(failBehaviour="continue")
+        k.addQuestion(q)
+        result = k.session().askRecord({"Item": "item-099999"})
+
+        self.assertEqual(result.answers, {"Item": "item-099999"})
+
+        result = k.session().askRecord({"Item": "nothing"})
+
+        self.assertIsInstance(result.errors["Item"][0], InteractiveError)
+        self.assertLessEqual(len(catalog.fetches), 1)
+
+        with self.assertRaises(ValueError):
+            Question("Item", choices=choices, default="nothing")
+        with self.assertRaises(ValueError):
+            dumps(k)
+
+
+if __name__ == "__main__":
+    unittest.main()
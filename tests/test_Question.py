@@ -1,6 +1,7 @@
 import unittest
 
-from kerdezo import Question
+from kerdezo import Choices, InteractiveError, Question
+from kerdezo.validators import IntegerValidators, StringValidators
 
 
 class QuestionTests(unittest.TestCase):
@@ -91,6 +92,160 @@ class QuestionTests(unittest.TestCase):
         q = Question("Do you want it to end?")
         self.assertEqual(repr(q), "<Question: Do you want it to end?>")
 
+    def test_question_choices_indexed(self):
+        q = Question("Pick", choices=["b", "a", "c"])
+        self.assertIsInstance(q.choices, Choices)
+        self.assertEqual(q.choices, ["b", "a", "c"])
+        self.assertIn("a", q.choices)
+        self.assertNotIn("d", q.choices)
+        self.assertNotIn(["unhashable"], q.choices)
+
+    def test_question_choices_normalized(self):
+        choices = Choices(
+            ["Hungary", "Austria"],
+            caseFold=True,
+            strip=True,
+            aliases={"HU": "Hungary", "AT": "Austria"}
+        )
+        q = Question("Country", choices=choices, default="Hungary")
+
+        self.assertTrue(q.validate("  hungary "))
+        self.assertEqual(q.choices.get(" hu"), "Hungary")
+        self.assertEqual(q.choices.get("at"), "Austria")
+        self.assertIsNone(q.choices.get("Germany"))
+        self.assertEqual(q.getChoices(), "Hungary, Austria")
+
+    def test_question_choices_normalized_duplicates(self):
+        with self.assertRaises(ValueError):
+            Choices(["Yes", "yes"], caseFold=True)
+
+    def test_question_choices_invalid_aliases(self):
+        with self.assertRaises(ValueError):
+            Choices(["yes", "no"], aliases={"y": "yep"})
+
+        with self.assertRaises(ValueError):
+            Choices(["yes", "no"], aliases={"no": "yes"})
+
+    def test_question_compile(self):
+        q = Question(
+            "Number",
+            type=int,
+            validators=[
+                IntegerValidators.greaterEqual(1, "too small"),
+                IntegerValidators.lessEqual(10, "too big")
+            ]
+        )
+        pipeline = q.compile()
+
+        self.assertIs(q.compile(), pipeline)
+        self.assertEqual(pipeline(" 5"), 5)
+
+        with self.assertRaisesRegex(ValueError, "too small"):
+            pipeline("0")
+
+        with self.assertRaisesRegex(ValueError, "too big"):
+            pipeline("11")
+
+        with self.assertRaises(ValueError):
+            pipeline("five")
+
+    def test_question_compile_choices(self):
+        q = Question("Size", choices=Choices(["S", "M"], caseFold=True))
+
+        self.assertEqual(q.compile()("m"), "M")
+
+        with self.assertRaises(InteractiveError):
+            q.compile()("XL")
+
+    def test_question_compile_invalidated(self):
+        q = Question("Name")
+        pipeline = q.compile()
+
+        self.assertEqual(pipeline("x"), "x")
+
+        q.validators = [StringValidators.minimumLength(2)]
+
+        self.assertIsNot(q.compile(), pipeline)
+        with self.assertRaises(ValueError):
+            q.compile()("x")
+
+        q.validators += (StringValidators.maximumLength(3),)
+
+        with self.assertRaises(ValueError):
+            q.compile()("xxxx")
+
+    def test_question_validate_subclass(self):
+        class Picky(Question):
+            def validate(self, answer, context=None):
+                return answer == "ok"
+
+        q = Picky("Picky")
+
+        self.assertEqual(q.compile()("ok"), "ok")
+
+        with self.assertRaises(ValueError):
+            q.compile()("nok")
+
+    def test_question_slotted(self):
+        q = Question("Slotted", validators=[])
+
+        with self.assertRaises(AttributeError):
+            q.nonesuch = True
+
+        self.assertEqual(q.validators, ())
+
+    def test_question_extra_options(self):
+        q = Question("Extra", placeholder="type here")
+
+        self.assertEqual(q.extra["placeholder"], "type here")
+        self.assertFalse(hasattr(q, "placeholder"))
+        self.assertEqual(len(Question("No extra").extra), 0)
+
+        with self.assertRaises(TypeError):
+            q.extra["other"] = 1
+
+    def test_question_shared_options(self):
+        validators = [StringValidators.minimumLength(2)]
+        q1 = Question("First", choices=["a", "b"], validators=validators)
+        q2 = Question("Second", choices=["a", "b"], validators=validators)
+        q3 = Question("Third", type=int, choices=[1, 2])
+
+        self.assertIs(q1.choices, q2.choices)
+        self.assertIs(q1.validators, q2.validators)
+        self.assertIsNot(q1.choices, q3.choices)
+
+        q2.choices = ["c"]
+
+        self.assertEqual(q1.choices, ["a", "b"])
+        self.assertIsInstance(q2.choices, Choices)
+
+    def test_question_shared_options_equal_values(self):
+        q1 = Question("a", type=int, choices=[True, 2])
+        q2 = Question("b", type=int, choices=[1, 2])
+        q3 = Question("c", type=float, choices=[-0.0, 1.0])
+        q4 = Question("d", type=float, choices=[0.0, 1.0])
+
+        self.assertIsNot(q1.choices, q2.choices)
+        self.assertEqual(str(q2), "b {1, 2}")
+        self.assertIs(q2.compile()("1"), 1)
+        self.assertIsNot(q3.choices, q4.choices)
+        self.assertEqual(repr(q4.compile()("0")), "0.0")
+
+    def test_question_str_cached(self):
+        q = Question("Port", type=int, choices=[80, 443, 8080], default=8080)
+        prompt = str(q)
+
+        self.assertEqual(prompt, "Port {80, 443, 8080} [8080]")
+        self.assertIs(str(q), prompt)
+
+        q.default = 443
+        self.assertEqual(str(q), "Port {80, 443, 8080} [443]")
+
+        q.title = "TCP port"
+        q.choices = [443]
+        self.assertEqual(str(q), "TCP port {443} [443]")
+        self.assertEqual(q.getChoices(), "443")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+import gzip
+import io
+import json
+import lzma
+import os
+import tempfile
+import unittest
+
+from kerdezo import Kerdezo, Session
+from kerdezo.recorders import Recorder, JSONLRecorder
+from kerdezo.validators import IntegerValidators
+
+
+class ListRecorder(Recorder):
+    def __init__(self):
+        self.events = []
+
+    def record(self, event):
+        self.events.append(event)
+
+
+class RecorderTests(unittest.TestCase):
+
+    @staticmethod
+    def answerMachine(answers):
+        answers = iter(answers)
+
+        def _input(prompt):
+            return next(answers)
+
+        return _input
+
+    @staticmethod
+    def suite(recorder):
+        k = Kerdezo(recorder=recorder)
+        k.addQuestion(
+            "Age", type=int, validators=[IntegerValidators.greater(0)]
+        )
+        k.addQuestion("PIN", echo=False)
+        return k
+
+    def test_recorder_base(self):
+        with self.assertRaises(NotImplementedError):
+            Recorder().record({})
+
+    def test_recorder_events(self):
+        recorder = ListRecorder()
+        k = self.suite(recorder)
+
+        with open(os.devnull, "w") as devnull:
+            k.ask(
+                inputFn=self.answerMachine(["x", "-1", "42"]),
+                silentInputFn=self.answerMachine(["1234"]),
+                outfile=devnull
+            )
+
+        kinds = [(e["event"], e.get("dest")) for e in recorder.events]
+        self.assertEqual(kinds, [
+            ("prompt", "Age"), ("input", "Age"), ("conversionError", "Age"),
+            ("prompt", "Age"), ("input", "Age"), ("validationError", "Age"),
+            ("prompt", "Age"), ("input", "Age"), ("answer", "Age"),
+            ("prompt", "PIN"), ("input", "PIN"), ("answer", "PIN")
+        ])
+        self.assertEqual(recorder.events[1]["raw"], "x")
+        self.assertEqual(recorder.events[5]["errorType"], "ValueError")
+        self.assertEqual(recorder.events[8]["value"], 42)
+        self.assertNotIn("1234", json.dumps(recorder.events))
+
+    def test_recorder_batch(self):
+        recorder = ListRecorder()
+        k = self.suite(recorder)
+
+        list(k.askBatch([{"Age": "0", "PIN": "1"}]))
+
+        kinds = [e["event"] for e in recorder.events]
+        self.assertEqual(kinds, ["validationError", "answer"])
+
+    def test_recorder_session_override(self):
+        suiteRecorder = ListRecorder()
+        sessionRecorder = ListRecorder()
+        k = self.suite(suiteRecorder)
+
+        k.session().askRecord({"Age": "3"})
+        Session(k, sessionRecorder).askRecord({"Age": "3"})
+
+        self.assertEqual(len(suiteRecorder.events), 2)
+        self.assertEqual(len(sessionRecorder.events), 2)
+
+    def test_recorder_set_later(self):
+        recorder = ListRecorder()
+        k = self.suite(None)
+        session = k.session()
+
+        k.recorder = recorder
+        session.askRecord({"Age": "3"})
+
+        self.assertEqual(len(recorder.events), 2)
+
+        with open(os.devnull, "w") as devnull:
+            k.ask(
+                inputFn=self.answerMachine(["42"]),
+                silentInputFn=self.answerMachine(["1234"]),
+                outfile=devnull
+            )
+
+        self.assertIn(("answer", "Age"), [
+            (e["event"], e.get("dest")) for e in recorder.events[2:]
+        ])
+
+    def test_recorder_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for compression, opener in [(None, open), ("gzip", gzip.open),
+                                        ("lzma", lzma.open)]:
+                path = os.path.join(tmp, f"events-{compression}.jsonl")
+
+                with JSONLRecorder(path, compression=compression,
+                                   batchSize=2) as recorder:
+                    for i in range(5):
+                        recorder.record({"event": "input", "raw": i})
+
+                with opener(path, "rt") as fp:
+                    events = [json.loads(line) for line in fp]
+
+                self.assertEqual([e["raw"] for e in events], list(range(5)))
+
+    def test_recorder_jsonl_file_object(self):
+        out = io.BytesIO()
+        recorder = JSONLRecorder(out, flushInterval=60)
+        recorder.record({"event": "answer", "value": object})
+        recorder.flush()
+
+        self.assertIn(b'"event": "answer"', out.getvalue())
+
+        recorder.close()
+        recorder.close()
+
+        self.assertFalse(out.closed)
+
+        with self.assertRaises(ValueError):
+            recorder.record({})
+
+    def test_recorder_jsonl_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            JSONLRecorder(io.BytesIO(), compression="zip")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+import io
+import json
+import unittest
+
+from kerdezo import (
+    Choices,
+    Kerdezo,
+    Question,
+    Suite
+)
+from kerdezo import serialization
+from kerdezo.dependencies import computed
+from kerdezo.validators import (
+    IntegerValidators,
+    MemoizedValidator,
+    StringValidators
+)
+
+
+def checkEven(value, question, context):
+    if value % 2:
+        raise ValueError("Must be even")
+
+
+def failHandler(err, context):
+    pass
+
+
+@computed("Name")
+def greeting(name):
+    return f"Hello {name}"
+
+
+class SerializationTests(unittest.TestCase):
+
+    def setUp(self):
+        serialization.clearCache()
+
+    @staticmethod
+    def suite():
+        k = Kerdezo(endMessage="Bye", failBehaviour="continue",
+                    failHandler=failHandler)
+        k.addQuestion(
+            "Name",
+            help="Your name",
+            validators=[StringValidators.minimumLength(3, "Too short")]
+        )
+        k.addQuestion(
+            "Age",
+            dest="age",
+            type=int,
+            default=18,
+            validators=[IntegerValidators.greaterEqual(0), checkEven]
+        )
+        k.addQuestion("Password", echo=False, placeholder="secret")
+        k.addQuestion(
+            "Country",
+            choices=Choices(["HU", "AT"], caseFold=True, aliases={"H": "HU"})
+        )
+        k.addQuestion("Size", choices=["S", "M"])
+        return k
+
+    def test_serialization_roundtrip(self):
+        text = serialization.dumps(self.suite())
+        suite = serialization.loads(text)
+
+        self.assertIsInstance(suite, Suite)
+        self.assertEqual(suite.endMessage, "Bye")
+        self.assertEqual(suite.failBehaviour, "continue")
+        self.assertIs(suite.failHandler, failHandler)
+
+        age = suite.getQuestion("age")
+        self.assertIs(age.type, int)
+        self.assertEqual(age.default, 18)
+        self.assertIs(age.validators[1], checkEven)
+
+        name = suite.getQuestion("Name")
+        self.assertEqual(name.help, "Your name")
+        with self.assertRaisesRegex(ValueError, "Too short"):
+            name.compile()("Al")
+
+        self.assertFalse(suite.getQuestion("Password").echo)
+        self.assertEqual(
+            suite.getQuestion("Password").extra, {"placeholder": "secret"}
+        )
+        self.assertEqual(suite.getQuestion("Country").compile()("h"), "HU")
+        self.assertEqual(suite.getQuestion("Size").choices, ["S", "M"])
+
+        self.assertEqual(serialization.dumps(suite), text)
+
+    def test_serialization_builtin_names(self):
+        data = serialization.toDict(self.suite())
+
+        self.assertEqual(
+            data["questions"][0]["validators"],
+            [{"name": "StringValidators.minimumLength",
+              "args": [3, "Too short"]}]
+        )
+        self.assertEqual(
+            data["questions"][1]["validators"][1],
+            {"name": "test_Serialization:checkEven"}
+        )
+
+    def test_serialization_memoize(self):
+        k = Kerdezo()
+        k.addQuestion(
+            "Age",
+            type=int,
+            validators=[IntegerValidators.greater(0), checkEven],
+            memoize={"maxsize": 10, "ttl": 60}
+        )
+
+        data = serialization.toDict(k)
+
+        self.assertEqual(data["questions"][0]["validators"][0], {
+            "name": "IntegerValidators.greater",
+            "args": [0],
+            "memoize": {"maxsize": 10, "ttl": 60}
+        })
+
+        question = serialization.fromDict(data).getQuestion("Age")
+        validators = question.validators
+        self.assertIsInstance(validators[1], MemoizedValidator)
+        self.assertIs(validators[1].validator, checkEven)
+        self.assertEqual(
+            (validators[0].maxsize, validators[0].ttl), (10, 60)
+        )
+
+    def test_serialization_cache(self):
+        text = serialization.dumps(self.suite())
+
+        first = serialization.loads(text)
+
+        self.assertIs(serialization.loads(text), first)
+        self.assertIs(serialization.load(io.StringIO(text)), first)
+        self.assertIsNot(serialization.loads(text, cache=False), first)
+
+        serialization.clearCache()
+
+        self.assertIsNot(serialization.loads(text), first)
+
+    def test_serialization_file(self):
+        fp = io.StringIO()
+        serialization.dump(self.suite(), fp, indent=2)
+        fp.seek(0)
+
+        suite = serialization.load(io.BytesIO(fp.getvalue().encode("utf8")))
+
+        self.assertEqual(len(suite._questions), 5)
+
+    def test_serialization_local_validator(self):
+        def local(value, question, context):
+            pass
+
+        k = Kerdezo()
+        k.addQuestion(Question("Local", validators=[local]))
+
+        with self.assertRaises(ValueError):
+            serialization.dumps(k)
+
+    def test_serialization_not_json(self):
+        k = Kerdezo()
+        k.addQuestion("Name")
+        k.addQuestion("Greeting", default=greeting)
+
+        with self.assertRaises(ValueError):
+            serialization.dumps(k)
+
+        k = Kerdezo()
+        k.addQuestion("Name", skip=lambda context: False)
+        fp = io.StringIO()
+
+        with self.assertRaises(ValueError):
+            serialization.dump(k, fp)
+        self.assertEqual(fp.getvalue(), "")
+
+    def test_serialization_invalid(self):
+        with self.assertRaises(ValueError):
+            serialization.loads(json.dumps({"version": 99}))
+
+        with self.assertRaises(ValueError):
+            serialization.loads(json.dumps({
+                "version": 1,
+                "questions": [
+                    {"title": "X", "validators": [{"name": "nonesuch:fn"}]}
+                ]
+            }))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+
+from kerdezo import (
+    Kerdezo,
+    Question,
+    Session,
+    Suite,
+    InteractiveError
+)
+
+
+class SessionTests(unittest.TestCase):
+
+    @staticmethod
+    def answerMachine(answers):
+        answers = iter(answers)
+
+        def _input(prompt):
+            return next(answers)
+
+        return _input
+
+    @staticmethod
+    def validateRepeat(value, question, context):
+        if value != context.getAnswer("Password"):
+            raise ValueError("Passwords do not match")
+
+    def suite(self):
+        k = Kerdezo(failBehaviour="continue", endMessage=None)
+        k.addQuestion("Password")
+        k.addQuestion("Repeat", validators=[self.validateRepeat])
+        return k
+
+    def test_suite_freeze(self):
+        k = self.suite()
+        suite = k.freeze()
+
+        self.assertIsInstance(suite, Suite)
+        self.assertEqual(suite.failBehaviour, "continue")
+        self.assertIs(suite.getQuestion("Password"), k.getQuestion("Password"))
+
+        # Changing the builder does not affect the frozen suite
+        k.addQuestion("Extra")
+
+        with self.assertRaises(ValueError):
+            suite.getQuestion("Extra")
+
+    def test_suite_immutable(self):
+        suite = self.suite().freeze()
+
+        with self.assertRaises(AttributeError):
+            suite.failBehaviour = "stop"
+
+        with self.assertRaises(AttributeError):
+            del suite.failBehaviour
+
+        self.assertFalse(hasattr(suite, "addQuestion"))
+
+    def test_suite_ctor(self):
+        suite = Suite([Question("One"), Question("Two")], helpInvoker="h")
+
+        self.assertEqual(suite.helpInvoker, "h")
+        self.assertEqual(len(suite._questions), 2)
+
+        with self.assertRaises(ValueError):
+            Suite([], failBehaviour="keep-going")
+
+        with self.assertRaises(InteractiveError):
+            Suite([Question("Bad", default="?")])
+
+    def test_sessions_independent(self):
+        suite = self.suite().freeze()
+        first = suite.session()
+        second = suite.session()
+
+        first.ask(inputFn=self.answerMachine(["secret", "secret"]))
+        second.ask(inputFn=self.answerMachine(["pw", "typo"]))
+
+        self.assertEqual(first.getAnswer("Repeat"), "secret")
+        self.assertIsNone(first.getErrors("Repeat"))
+        self.assertEqual(second.getAnswer("Password"), "pw")
+        self.assertEqual(len(second.getErrors("Repeat")), 1)
+        self.assertEqual(second.position, 1)
+
+    def test_session_slotted(self):
+        session = Session(self.suite())
+
+        with self.assertRaises(AttributeError):
+            session.extra = True
+
+        self.assertEqual(session.failBehaviour, "continue")
+
+        with self.assertRaises(AttributeError):
+            session.nonesuch
+
+    def test_kerdezo_ask_wraps_session(self):
+        k = self.suite()
+
+        res = k.ask(inputFn=self.answerMachine(["a", "a"]))
+
+        self.assertEqual(res, {"Password": "a", "Repeat": "a"})
+        self.assertEqual(k.getAnswer("Repeat"), "a")
+        self.assertEqual(k._answers, res)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import tempfile
+import unittest
+
+from kerdezo import Choices, Kerdezo, Question, Suite, snapshot
+from kerdezo.dependencies import computed
+from kerdezo.validators import (
+    IntegerValidators,
+    MemoizedValidator,
+    StringValidators
+)
+
+
+def checkEven(value, question, context):
+    if value % 2:
+        raise ValueError("Must be even")
+
+
+def failHandler(err, context):
+    pass
+
+
+@computed("Country")
+def defaultCity(country):
+    return "Budapest" if country == "HU" else "Wien"
+
+
+def extraQuestions(context):
+    yield Question("Extra")
+
+
+def buildSuite():
+    k = Kerdezo(endMessage="Bye", failBehaviour="continue",
+                failHandler=failHandler)
+    k.addQuestion(
+        "Name",
+        help="Your name",
+        validators=[StringValidators.minimumLength(3, message="Too short")]
+    )
+    k.addQuestion(
+        "Age",
+        dest="age",
+        type=int,
+        default=18,
+        validators=[IntegerValidators.greaterEqual(0), checkEven],
+        memoize=True
+    )
+    k.addQuestion("Password", echo=False, placeholder="secret")
+    k.addQuestion(
+        "Country",
+        choices=Choices(["HU", "AT"], caseFold=True, aliases={"H": "HU"})
+    )
+    k.addQuestion("City", default=defaultCity)
+    k.addQuestion("Nick", validators=[StringValidators.minimumLength(3)])
+    k.addSource(extraQuestions)
+    return k
+
+
+class SnapshotTests(unittest.TestCase):
+
+    def test_snapshot_roundtrip(self):
+        suite = snapshot.loads(snapshot.dumps(buildSuite()))
+
+        self.assertIsInstance(suite, Suite)
+        self.assertEqual(suite.endMessage, "Bye")
+        self.assertIs(suite.failHandler, failHandler)
+
+        age = suite.getQuestion("age")
+        self.assertEqual((age.type, age.default), (int, 18))
+        self.assertIsInstance(age.validators[0], MemoizedValidator)
+        self.assertEqual(suite.getQuestion("Password").extra["placeholder"],
+                         "secret")
+        self.assertFalse(suite.getQuestion("Password").echo)
+
+        result = suite.session().askRecord({
+            "Name": "Jo", "age": "3", "Country": "h", "Extra": "x"
+        })
+
+        self.assertEqual(result.answers, {
+            "Password": "", "Country": "HU", "City": "Budapest",
+            "Extra": "x"
+        })
+        self.assertEqual(
+            {dest: str(errs[0]) for dest, errs in result.errors.items()},
+            {"Name": "Too short", "age": "Must be even",
+             "Nick": "Minimum length is 3"}
+        )
+
+    def test_snapshot_shared_validators(self):
+        suite = snapshot.loads(snapshot.dumps(buildSuite()))
+
+        # Different arguments
+        self.assertIsNot(
+            suite.getQuestion("Nick").validators[0],
+            suite.getQuestion("Name").validators[0]
+        )
+
+        k = Kerdezo()
+        k.addQuestion("A", validators=[IntegerValidators.greater(0)])
+        k.addQuestion("B", validators=[IntegerValidators.greater(0)])
+        suite = snapshot.loads(snapshot.dumps(k))
+
+        self.assertIs(
+            suite.getQuestion("A").validators[0],
+            suite.getQuestion("B").validators[0]
+        )
+
+    def test_snapshot_invalid(self):
+        data = snapshot.dumps(buildSuite(), key="v1")
+
+        self.assertIsInstance(snapshot.loads(data, key="v1"), Suite)
+        with self.assertRaisesRegex(ValueError, "Stale"):
+            snapshot.loads(data, key="v2")
+        with self.assertRaisesRegex(ValueError, "Invalid"):
+            snapshot.loads(data[:-1])
+        with self.assertRaisesRegex(ValueError, "Invalid"):
+            snapshot.loads(b"KRDZ")
+
+        k = Kerdezo()
+        k.addQuestion("A", validators=[lambda value, question, context: 0])
+        with self.assertRaises(ValueError):
+            snapshot.dumps(k)
+
+    def test_snapshot_cached(self):
+        builds = []
+
+        def build():
+            builds.append(1)
+            return buildSuite()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "suite.snapshot")
+
+            self.assertIsInstance(snapshot.cached(path, build, "v1"), Suite)
+            self.assertIsInstance(snapshot.cached(path, build, "v1"), Suite)
+            self.assertEqual(len(builds), 1)
+
+            # Stale snapshots are rebuilt
+            snapshot.cached(path, build, "v2")
+            self.assertIsInstance(snapshot.cached(path, build, "v2"), Suite)
+            self.assertEqual(len(builds), 2)
+
+            with open(path, "r+b") as fp:
+                fp.truncate(10)
+
+            snapshot.cached(path, build, "v2")
+            self.assertEqual(len(builds), 3)
+            self.assertEqual(os.listdir(tmp), ["suite.snapshot"])
+
+    def test_snapshot_build_key(self):
+        key = snapshot.buildKey(buildSuite)
+
+        self.assertTrue(key.startswith(f"{__name__}:buildSuite".encode()))
+        self.assertIn(b"def buildSuite", key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import io
+import json
+import unittest
+
+from kerdezo import Kerdezo, Question, Suite, InteractiveError
+from kerdezo.dependencies import Computed
+from kerdezo.serialization import dumps, loads
+
+
+def followUp(context):
+    if context.getAnswer("Pets") == "yes":
+        yield Question("How many?", dest="count", type=int)
+        yield Question("Names", dest="names")
+
+
+class SourceTests(unittest.TestCase):
+
+    @staticmethod
+    def answerMachine(answers):
+        answers = iter(answers)
+
+        def _input(prompt):
+            return next(answers)
+
+        return _input
+
+    @staticmethod
+    def suite():
+        k = Kerdezo()
+        k.addQuestion("Pets", choices=["yes", "no"])
+        k.addSource(followUp)
+        k.addQuestion("Name")
+        return k
+
+    def test_source_branch(self):
+        k = self.suite()
+
+        answers = k.ask(
+            inputFn=self.answerMachine(["yes", "2", "Rex, Tom", "Alice"]),
+            outfile=io.StringIO()
+        )
+
+        self.assertEqual(answers, {
+            "Pets": "yes", "count": 2, "names": "Rex, Tom", "Name": "Alice"
+        })
+
+        answers = k.ask(
+            inputFn=self.answerMachine(["no", "Bob"]),
+            outfile=io.StringIO()
+        )
+
+        self.assertEqual(answers, {"Pets": "no", "Name": "Bob"})
+
+    def test_source_lazy(self):
+        built = []
+
+        def source(context):
+            for i in range(3):
+                built.append(i)
+                yield f"Question {i}"
+
+        k = Kerdezo()
+        k.addSource(source)
+        session = k.session()
+        walk = session._walk()
+
+        self.assertEqual(built, [])
+        self.assertEqual(next(walk).title, "Question 0")
+        self.assertEqual(built, [0])
+
+    def test_source_plan(self):
+        k = self.suite()
+
+        self.assertEqual(len(k._questions), 2)
+        self.assertEqual(
+            [getattr(item, "dest", item) for item in k._questions.plan()],
+            ["Pets", followUp, "Name"]
+        )
+
+        k.removeQuestion("Pets")
+
+        self.assertEqual(
+            list(k._questions.plan()), [followUp, k.getQuestion("Name")]
+        )
+
+    def test_source_only(self):
+        k = Kerdezo()
+        k.addSource([Question("First"), [Question("Nested")], "Last"])
+
+        result = k.session().askRecord({"First": "1", "Nested": "2"})
+
+        self.assertEqual(
+            result.answers, {"First": "1", "Nested": "2", "Last": ""}
+        )
+
+        with self.assertRaises(InteractiveError):
+            Kerdezo().ask()
+
+    def test_source_frozen(self):
+        suite = self.suite().freeze()
+
+        self.assertIsInstance(suite, Suite)
+
+        results = list(suite.askBatch([
+            {"Pets": "yes", "count": "x", "Name": "Alice"},
+            {"Pets": "no", "count": "1", "Name": "Bob"}
+        ]))
+
+        self.assertEqual(list(results[0].errors), ["count"])
+        self.assertEqual(results[1].answers, {"Pets": "no", "Name": "Bob"})
+
+    def test_source_skip(self):
+        k = Kerdezo()
+        k.addQuestion("Protocol")
+        k.addQuestion(
+            "Certificate",
+            skip=Computed(lambda protocol: protocol != "https", "Protocol")
+        )
+        k.addQuestion(
+            "Port", skip=lambda context: "Certificate" in context._answers
+        )
+
+        self.assertEqual(
+            k.session().askRecord({"Protocol": "http"}).answers,
+            {"Protocol": "http", "Port": ""}
+        )
+        self.assertEqual(
+            k.session().askRecord({"Protocol": "https"}).answers,
+            {"Protocol": "https", "Certificate": ""}
+        )
+
+    def test_source_serialization(self):
+        definition = dumps(self.suite())
+
+        self.assertIn(
+            {"source": f"{__name__}:followUp"},
+            json.loads(definition)["questions"]
+        )
+
+        suite = loads(definition, cache=False)
+
+        self.assertEqual(
+            [getattr(item, "dest", item) for item in suite._questions.plan()],
+            ["Pets", followUp, "Name"]
+        )
+
+        k = Kerdezo()
+        k.addSource([Question("Inline")])
+
+        with self.assertRaises(ValueError):
+            dumps(k)
+
+
+if __name__ == "__main__":
+    unittest.main()
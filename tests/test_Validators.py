@@ -1,8 +1,25 @@
+import array
+import threading
+import time
 import unittest
 
+from kerdezo import Question
+from kerdezo import validators as validatorsModule
 from kerdezo.validators import (
+    ColumnResult,
+    MemoizedValidator,
     StringValidators,
-    IntegerValidators
+    IntegerValidators,
+    ValidationErrors,
+    ValidationTimeout,
+    checker,
+    concurrentValidators,
+    contextual,
+    fuseValidators,
+    independent,
+    memoize,
+    nonRaising,
+    validateColumn
 )
 
 
@@ -168,6 +185,372 @@ class ValidatorTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             fn(99)
 
+    def test_validator_fuse_int_range(self):
+        def custom(value, question=None, context=None):
+            pass
+
+        fused = fuseValidators([
+            IntegerValidators.greater(0, "gt"),
+            IntegerValidators.greaterEqual(2, "ge"),
+            IntegerValidators.lessEqual(5, "le"),
+            custom,
+            IntegerValidators.less(3)
+        ])
+
+        self.assertEqual(len(fused), 3)
+        self.assertIs(fused[1], custom)
+
+        fused[0](2)
+        fused[0](5)
+
+        with self.assertRaisesRegex(ValueError, "ge"):
+            fused[0](1)
+
+        with self.assertRaisesRegex(ValueError, "gt"):
+            fused[0](0)
+
+        with self.assertRaisesRegex(ValueError, "le"):
+            fused[0](6)
+
+    def test_validator_fuse_length(self):
+        fused = fuseValidators([
+            StringValidators.minimumLength(2),
+            StringValidators.maximumLength(4),
+            IntegerValidators.greater(0)
+        ])
+
+        self.assertEqual(len(fused), 2)
+
+        fused[0]("abc")
+
+        with self.assertRaisesRegex(ValueError, "Minimum"):
+            fused[0]("a")
+
+        with self.assertRaisesRegex(ValueError, "Maximum"):
+            fused[0]("abcde")
+
+    def test_validator_memoize(self):
+        calls = []
+
+        @memoize(maxsize=2)
+        def expensive(value, question=None, context=None):
+            calls.append(value)
+            if value == "bad":
+                raise ValueError(f"Invalid: {value}")
+
+        expensive("good")
+        expensive("good")
+
+        for i in range(2):
+            with self.assertRaisesRegex(ValueError, "Invalid: bad"):
+                expensive("bad")
+
+        self.assertEqual(calls, ["good", "bad"])
+        self.assertEqual(
+            expensive.cacheInfo(),
+            {"hits": 2, "misses": 2, "size": 2, "maxsize": 2}
+        )
+        self.assertEqual(expensive.__name__, "expensive")
+
+        # Least recently used value is evicted
+        expensive("other")
+        expensive("good")
+
+        self.assertEqual(calls, ["good", "bad", "other", "good"])
+
+        expensive.cacheClear()
+
+        self.assertEqual(expensive.cacheInfo()["size"], 0)
+
+    def test_validator_memoize_custom_error(self):
+        class CodeError(ValueError):
+            def __init__(self, code):
+                super().__init__(f"code {code}")
+                self.code = code
+
+        @memoize
+        def coded(value, question=None, context=None):
+            raise CodeError(value)
+
+        @memoize
+        def several(value, question=None, context=None):
+            raise ValidationErrors([ValueError("a"), ValueError("b")])
+
+        for i in range(2):
+            with self.assertRaises(CodeError) as cm:
+                coded(3)
+            self.assertEqual(str(cm.exception), "code 3")
+            self.assertEqual(cm.exception.code, 3)
+
+            with self.assertRaises(ValidationErrors) as cm:
+                several(1)
+            self.assertEqual(str(cm.exception), "a; b")
+            self.assertEqual(len(cm.exception.errors), 2)
+
+        self.assertEqual(coded.cacheInfo()["hits"], 1)
+
+    def test_validator_memoize_ttl(self):
+        calls = []
+
+        def fn(value, question=None, context=None):
+            calls.append(value)
+
+        memoized = memoize(fn, ttl=0.01)
+        memoized(1)
+        memoized(1)
+        time.sleep(0.02)
+        memoized(1)
+
+        self.assertEqual(calls, [1, 1])
+
+    def test_validator_memoize_uncached(self):
+        calls = []
+
+        def fn(value, question=None, context=None):
+            calls.append(value)
+            if value == 0:
+                raise KeyError(value)
+
+        memoized = memoize(fn)
+        memoized([1])
+        memoized([1])
+
+        for i in range(2):
+            with self.assertRaises(KeyError):
+                memoized(0)
+
+        self.assertEqual(calls, [[1], [1], 0, 0])
+
+    def test_validator_memoize_contextual(self):
+        @contextual
+        def fn(value, question, context):
+            pass
+
+        with self.assertRaises(ValueError):
+            memoize(fn)
+
+    def test_validator_memoize_question(self):
+        @contextual
+        def fn(value, question, context):
+            pass
+
+        q = Question(
+            "Memoized",
+            validators=[StringValidators.minimumLength(2), fn],
+            memoize={"maxsize": 10}
+        )
+
+        self.assertIsInstance(q.validators[0], MemoizedValidator)
+        self.assertIs(q.validators[1], fn)
+
+        q.compile()("abc")
+        q.compile()("abc")
+
+        self.assertEqual(q.validators[0].cacheInfo()["hits"], 1)
+
+    @staticmethod
+    def sleeper(seconds, fail=None, timeout=None):
+        @independent(timeout=timeout)
+        def _validator(value, question=None, context=None):
+            time.sleep(seconds)
+            if fail:
+                raise ValueError(fail)
+        return _validator
+
+    def test_validator_concurrent(self):
+        # Passes only if all three validators run at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        @independent
+        def meet(value, question=None, context=None):
+            barrier.wait()
+
+        validators = concurrentValidators([meet, meet, meet])
+
+        self.assertEqual(len(validators), 1)
+
+        validators[0]("x")
+
+        self.assertFalse(barrier.broken)
+
+    def test_validator_concurrent_sequential_default(self):
+        def plain(value, question=None, context=None):
+            pass
+
+        validators = [plain, self.sleeper(0), plain, self.sleeper(0)]
+
+        self.assertEqual(concurrentValidators(validators), validators)
+
+    def test_validator_concurrent_errors_ordered(self):
+        validators = concurrentValidators([
+            self.sleeper(0.05, "first"),
+            self.sleeper(0, "second"),
+            self.sleeper(0)
+        ])
+
+        with self.assertRaises(ValidationErrors) as ctx:
+            validators[0]("x")
+
+        self.assertEqual(
+            [str(err) for err in ctx.exception.errors], ["first", "second"]
+        )
+        self.assertEqual(str(ctx.exception), "first; second")
+
+    def test_validator_concurrent_timeouts(self):
+        released = threading.Event()
+
+        @independent(timeout=0.05)
+        def blocked(value, question=None, context=None):
+            released.wait(5)
+
+        @independent
+        def waiting(value, question=None, context=None):
+            released.wait(5)
+
+        try:
+            validators = concurrentValidators([blocked])
+
+            with self.assertRaises(ValidationTimeout):
+                validators[0]("x")
+
+            validators = concurrentValidators(
+                [waiting, self.sleeper(0)], timeout=0.05
+            )
+
+            with self.assertRaises(ValidationTimeout):
+                validators[0]("x")
+        finally:
+            released.set()
+
+    def test_validator_concurrent_question(self):
+        threads = set()
+
+        @independent
+        def remember(value, question=None, context=None):
+            threads.add(threading.get_ident())
+
+        q = Question("Checked", validators=[remember, remember],
+                     validationTimeout=1)
+
+        self.assertEqual(q.compile()("x"), "x")
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_validator_non_raising(self):
+        check = checker(IntegerValidators.greater(0))
+
+        self.assertIsNone(check(1))
+        error = check(0)
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(str(error), "Must be greater than 0")
+
+        @nonRaising
+        def even(value, question=None, context=None):
+            if value % 2:
+                return ValueError(f"{value} is odd")
+
+        self.assertIs(checker(even), even.check)
+        self.assertEqual(str(checker(even)(3)), "3 is odd")
+        with self.assertRaisesRegex(ValueError, "3 is odd"):
+            even(3)
+
+    def test_validator_checker_legacy(self):
+        def legacy(value, question=None, context=None):
+            if not value:
+                raise ValueError("Empty")
+
+        check = checker(legacy)
+
+        self.assertIsNone(check("x"))
+        self.assertEqual(str(check("")), "Empty")
+
+    def test_validator_fuse_non_raising(self):
+        fused, = fuseValidators([
+            IntegerValidators.greaterEqual(1),
+            IntegerValidators.lessEqual(10)
+        ])
+
+        self.assertIsNone(checker(fused)(5))
+        self.assertEqual(
+            str(checker(fused)(11)), "Must be less or equal than 10"
+        )
+
+    def assertColumn(self, validator, values):
+        result = validateColumn(validator, values)
+        expected = {}
+        for index, value in enumerate(values):
+            try:
+                validator(value)
+            except ValueError as ex:
+                expected[index] = str(ex)
+
+        self.assertIsInstance(result, ColumnResult)
+        self.assertEqual(dict(result.messages()), expected)
+        self.assertEqual(
+            list(result.mask()),
+            [int(i in expected) for i in range(len(values))]
+        )
+        return result
+
+    def test_validator_column_int(self):
+        numbers = [-2, 0, 3, 10, 11]
+
+        for validator in (
+            IntegerValidators.greater(0),
+            IntegerValidators.greaterEqual(0),
+            IntegerValidators.less(10),
+            IntegerValidators.lessEqual(10),
+            IntegerValidators.equal(3),
+            IntegerValidators.notEqual(3)
+        ):
+            self.assertColumn(validator, numbers)
+            self.assertColumn(validator, array.array("q", numbers))
+
+        result = validateColumn(IntegerValidators.greater(0), numbers)
+
+        self.assertEqual(result.failures, [0, 1])
+        self.assertEqual(result.message(1), "Must be greater than 0")
+        self.assertFalse(result.ok)
+        self.assertTrue(validateColumn(
+            IntegerValidators.greater(0), array.array("d", [0.5])
+        ).ok)
+
+    def test_validator_column_string(self):
+        words = ["", " ", "ab", "abcdef", "a@b.hu", "a@b"]
+
+        for validator in (
+            StringValidators.minimumLength(2),
+            StringValidators.maximumLength(3),
+            StringValidators.notEmptyOrWhitespace(),
+            StringValidators.emailAddress(),
+            StringValidators.equal("ab"),
+            StringValidators.notEqual("ab")
+        ):
+            self.assertColumn(validator, words)
+
+        result = validateColumn(StringValidators.emailAddress(), words)
+
+        self.assertEqual(result.failures, [0, 1, 2, 3, 5])
+        self.assertEqual(len(result), 5)
+
+    def test_validator_column_fallback(self):
+        def odd(value, question=None, context=None):
+            if value % 2 == 0:
+                raise ValueError(f"{value} is even")
+
+        result = self.assertColumn(odd, range(5))
+
+        self.assertEqual(result.failures, [0, 2, 4])
+        self.assertEqual(result.message(4), "4 is even")
+
+    @unittest.skipIf(validatorsModule.numpy is None, "NumPy is not installed")
+    def test_validator_column_numpy(self):
+        numpy = validatorsModule.numpy
+        values = numpy.arange(-5, 5)
+
+        result = self.assertColumn(IntegerValidators.greater(0), values)
+
+        self.assertEqual(result.failures, list(range(6)))
+
 
 if __name__ == "__main__":
     unittest.main()